@@ -0,0 +1,6 @@
+"""Benchmarks of the tracker, run with `python -m benchmarks.<module>`.
+
+- commands: times main.py commands on synthetic ledgers, prints JSON;
+- ledger: generates synthetic tracker files;
+- the other modules compare particular storage and parsing approaches.
+"""
@@ -0,0 +1,91 @@
+"""Compare memory used by records loaded as objects and as columns.
+
+Usage:
+    python -m benchmarks.columnar_memory --rows 1000000
+"""
+
+import argparse
+import csv
+import gc
+import io
+import random
+import tracemalloc
+from dataclasses import dataclass
+
+from core.columnar import ColumnarLedger
+from core.record import Record
+
+DESCS = ['продукты', 'аренда', 'зп', 'кафе', 'такси', 'интернет', 'подарок']
+
+
+@dataclass
+class DictRecord:
+    """Record without __slots__, as it was before the columnar storage."""
+
+    date: str
+    category: str
+    amount: int
+    desc: str = ''
+
+
+def make_csv(rows: int) -> str:
+    """Generate CSV rows without a header."""
+    text = io.StringIO(newline='')
+    writer = csv.writer(text)
+    rnd = random.Random(1)
+    for _ in range(rows):
+        writer.writerow(
+            [
+                f'2024-{rnd.randint(1, 12):02}-{rnd.randint(1, 28):02}',
+                rnd.choice(['Доход', 'Расход']),
+                rnd.randint(1, 100_000),
+                f'{rnd.choice(DESCS)} {rnd.randint(1, 50)}',
+            ]
+        )
+    return text.getvalue()
+
+
+def parse(data: str, cls: type) -> list:
+    reader = csv.reader(io.StringIO(data, newline=''))
+    return [cls(date, cat, int(amt), desc) for date, cat, amt, desc in reader]
+
+
+def parse_iter(data: str):
+    reader = csv.reader(io.StringIO(data, newline=''))
+    for date, cat, amt, desc in reader:
+        yield Record(date, cat, int(amt), desc)
+
+
+def measure(build) -> int:
+    """Return the number of bytes retained by the object build() returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    data = make_csv(args.rows)
+    results = {
+        'dataclass with __dict__': measure(lambda: parse(data, DictRecord)),
+        'dataclass with __slots__': measure(lambda: parse(data, Record)),
+        'columnar': measure(lambda: ColumnarLedger(parse_iter(data))),
+    }
+    base = results['dataclass with __dict__']
+    for name, size in results.items():
+        per_million = size / args.rows * 1_000_000 / 2**20
+        print(
+            f'{name:25} {size / args.rows:8.1f} B/row '
+            f'{per_million:8.1f} MiB/1M rows {base / size:6.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
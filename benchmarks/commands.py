@@ -0,0 +1,175 @@
+"""Time main.py commands on synthetic ledgers of different sizes.
+
+Every command runs as a separate `python main.py ...` process, so the times
+include the interpreter start and imports, like for a user in a terminal.
+The first run of `balance` on a fresh file also builds the sidecar files,
+it's reported as `balance (cold)`; `startup` is `main.py --help`.
+
+Results are printed to stdout (or written to --output) as JSON with the
+commit, the Python version and, for each file size and command, all run
+times in seconds and the peak resident memory in KiB, so runs on different
+commits can be compared. Progress goes to stderr.
+
+Usage:
+    python -m benchmarks.commands --rows 1000 100000 1000000 --repeat 5
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from .ledger import generate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, 'main.py')
+
+COMMANDS = [
+    ('startup', ['--help']),
+    ('balance', ['balance']),
+    ('show --tail', ['show', '--tail', '20']),
+    ('search --date', ['search', '--date', '2024-12-30']),
+    (
+        'search --from --to',
+        ['search', '--from', '2024-12-01', '--to', '2024-12-07'],
+    ),
+    ('search --category', ['search', '--category', 'Доход']),
+    ('search --amount', ['search', '--amount', '500']),
+    ('search --desc', ['search', '--desc', 'аптека', '123']),
+    ('add', ['add', '2024-12-31', 'Расход', '300', 'бенчмарк']),
+    ('edit', ['edit', '{middle}', '--amount', '777']),
+]
+
+
+def run(file: str, argv: list[str]) -> tuple[float, int | None]:
+    """Run main.py with a tracker file.
+
+    Returns:
+        The wall time in seconds and the peak resident memory in KiB, or
+        None where it can't be measured.
+
+    Raises:
+        RuntimeError: If the command fails.
+    """
+    args = [sys.executable, MAIN, '--file', file, *argv]
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        args, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    if hasattr(os, 'wait4'):
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        memory = usage.ru_maxrss
+        if sys.platform == 'darwin':
+            memory //= 1024  # bytes on macOS
+    else:
+        process.wait()
+        memory = None
+    elapsed = time.perf_counter() - start
+    if process.returncode:
+        command = ' '.join(argv)
+        raise RuntimeError(f'{command} exited with {process.returncode}')
+    return elapsed, memory
+
+
+def measure(
+    name: str,
+    file: str,
+    argv: list[str],
+    rows: int,
+    repeat: int,
+) -> dict:
+    """Run a command several times and collect the results."""
+    times = []
+    memory = []
+    for _ in range(repeat):
+        elapsed, peak = run(file, argv)
+        times.append(elapsed)
+        if peak is not None:
+            memory.append(peak)
+    result = {
+        'rows': rows,
+        'size': os.path.getsize(file),
+        'command': name,
+        'argv': argv,
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+        'peak_rss_kib': max(memory, default=None),
+    }
+    print(
+        f'{rows:>10} rows  {name:<20} {result["median"]:8.3f} s  '
+        f'{result["peak_rss_kib"] or 0:>8} KiB',
+        file=sys.stderr,
+    )
+    return result
+
+
+def commit() -> str | None:
+    """Get the current commit of the repository, if it's a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--rows', type=int, nargs='+', default=[1000, 100_000, 1_000_000]
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write JSON here, not to stdout')
+    parser.add_argument('--dir', help='keep generated files here')
+    args = parser.parse_args()
+
+    directory = args.dir or tempfile.mkdtemp(prefix='tracker-bench-')
+    os.makedirs(directory, exist_ok=True)
+    results = []
+    try:
+        for rows in args.rows:
+            file = os.path.join(directory, f'bench_{rows}.csv')
+            for path in glob.glob(f'{file}*'):
+                os.remove(path)
+            generate(file, rows)
+            results.append(
+                measure('balance (cold)', file, ['balance'], rows, 1)
+            )
+            for name, argv in COMMANDS:
+                argv = [arg.format(middle=rows // 2 + 1) for arg in argv]
+                results.append(measure(name, file, argv, rows, args.repeat))
+    finally:
+        if not args.dir:
+            shutil.rmtree(directory)
+
+    report = {
+        'commit': commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
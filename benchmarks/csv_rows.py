@@ -0,0 +1,102 @@
+"""Compare dict-based and positional reading and writing of CSV rows.
+
+Usage:
+    python -m benchmarks.csv_rows --rows 1000000
+"""
+
+import argparse
+import csv
+import io
+import random
+import time
+
+from core.layout import RowLayout
+from core.record import Record
+
+FIELDNAMES = ['Дата', 'Категория', 'Сумма', 'Описание']
+FIELD_MAP = dict(zip(['date', 'category', 'amount', 'desc'], FIELDNAMES))
+DESCS = ['продукты', 'аренда', 'зп', 'кафе', 'такси', 'интернет', 'подарок']
+
+
+def make_records(rows: int) -> list[Record]:
+    rnd = random.Random(1)
+    return [
+        Record(
+            f'2024-{rnd.randint(1, 12):02}-{rnd.randint(1, 28):02}',
+            rnd.choice(['Доход', 'Расход']),
+            rnd.randint(1, 100_000),
+            f'{rnd.choice(DESCS)} {rnd.randint(1, 50)}',
+        )
+        for _ in range(rows)
+    ]
+
+
+def save_dicts(records: list[Record]) -> str:
+    """Write rows like the tracker did with DictWriter."""
+    text = io.StringIO(newline='')
+    writer = csv.DictWriter(text, fieldnames=FIELDNAMES)
+    writer.writeheader()
+    for record in records:
+        writer.writerow(
+            {field: getattr(record, attr) for attr, field in FIELD_MAP.items()}
+        )
+    return text.getvalue()
+
+
+def save_rows(records: list[Record]) -> str:
+    text = io.StringIO(newline='')
+    writer = csv.writer(text)
+    writer.writerow(FIELDNAMES)
+    layout = RowLayout(FIELDNAMES, FIELDNAMES)
+    writer.writerows(map(layout.to_row, records))
+    return text.getvalue()
+
+
+def load_dicts(data: str) -> list[Record]:
+    """Read rows like the tracker did with DictReader."""
+    reader = csv.DictReader(io.StringIO(data, newline=''))
+    return [
+        Record(
+            row['Дата'], row['Категория'], int(row['Сумма']), row['Описание']
+        )
+        for row in reader
+    ]
+
+
+def load_rows(data: str) -> list[Record]:
+    reader = csv.reader(io.StringIO(data, newline=''))
+    layout = RowLayout(next(reader), FIELDNAMES)
+    return [layout.to_record(row) for row in reader if row]
+
+
+def timed(run, *args):
+    start = time.perf_counter()
+    result = run(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    records = make_records(args.rows)
+    save_dict_time, data = timed(save_dicts, records)
+    save_row_time, row_data = timed(save_rows, records)
+    assert data == row_data
+    load_dict_time, loaded = timed(load_dicts, data)
+    load_row_time, row_loaded = timed(load_rows, data)
+    assert loaded == row_loaded == records
+
+    for name, dict_time, row_time in [
+        ('save', save_dict_time, save_row_time),
+        ('load', load_dict_time, load_row_time),
+    ]:
+        print(
+            f'{name}: dicts {dict_time:6.2f} s  rows {row_time:6.2f} s  '
+            f'{dict_time / row_time:5.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Compare date validation and normalization with and without strptime.
+
+Usage:
+    python -m benchmarks.date_parsing --count 1000000
+"""
+
+import argparse
+import datetime
+import random
+import time
+
+from core import utils
+
+
+def strptime_validate(value: str) -> bool:
+    """validate_date as it was implemented with strptime."""
+    try:
+        datetime.datetime.strptime(value, '%Y-%m-%d')
+        return True
+    except ValueError:
+        return False
+
+
+def strptime_normalize(value: str) -> str:
+    """normalize_date as it was implemented with strptime."""
+    date_obj = datetime.datetime.strptime(value, '%Y-%m-%d')
+    return date_obj.strftime('%Y-%m-%d')
+
+
+def strptime_process(value: str) -> str | None:
+    return strptime_normalize(value) if strptime_validate(value) else None
+
+
+def parse_uncached(value: str) -> str | None:
+    return utils.parse_date.__wrapped__(value)
+
+
+def make_dates(count: int, distinct: int) -> list[str]:
+    """Generate dates with a given number of distinct values."""
+    rnd = random.Random(1)
+    start = datetime.date(2015, 1, 1).toordinal()
+    pool = [
+        datetime.date.fromordinal(start + i).isoformat()
+        for i in range(distinct)
+    ]
+    return [rnd.choice(pool) for _ in range(count)]
+
+
+def timeit(func, values: list[str]) -> float:
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for distinct in (3650, min(args.count, 1_000_000)):
+        dates = make_dates(args.count, distinct)
+        utils.parse_date.cache_clear()
+        results = {
+            'strptime (validate + normalize)': timeit(strptime_process, dates),
+            'parse_date without cache': timeit(parse_uncached, dates),
+            'parse_date with cache': timeit(utils.parse_date, dates),
+        }
+        base = results['strptime (validate + normalize)']
+        print(f'{args.count} dates, {distinct} distinct:')
+        for name, seconds in results.items():
+            print(f'  {name:33} {seconds:7.3f} s {base / seconds:6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Generate synthetic tracker files that look like real ledgers.
+
+Records go mostly in date order, the way they are added day by day, with
+a few entered late. Later days get more records than earlier ones, about
+one in ten records is an income, amounts are skewed towards small ones and
+descriptions are Cyrillic, some of them with commas and quotes.
+
+The output depends only on the number of rows and the seed, so files of
+the same size can be compared across commits.
+
+Usage:
+    python -m benchmarks.ledger --rows 1000000 --file bench.csv
+"""
+
+import argparse
+import csv
+import datetime
+import random
+
+from core.utils import EXPENSE, INCOME
+
+FIELDNAMES = ['Дата', 'Категория', 'Сумма', 'Описание']
+END = datetime.date(2024, 12, 31)
+YEARS = 5
+LATE_SHARE = 0.05
+INCOME_SHARE = 0.1
+
+EXPENSES = [
+    'продукты',
+    'кофе',
+    'такси',
+    'аренда',
+    'интернет',
+    'аптека',
+    'кафе «Ёлка»',
+    'подарок маме',
+    'бензин, мойка',
+    'книги "Азбука"',
+    'проезд',
+    'спортзал',
+]
+INCOMES = ['зарплата', 'аванс', 'кешбэк', 'возврат долга', 'подработка']
+
+
+def make_rows(rows: int, seed: int = 1):
+    """Generate rows of a tracker file.
+
+    Args:
+        rows: The number of rows.
+        seed: The seed of random values.
+
+    Yields:
+        Lists of the date, category, amount and description.
+    """
+    rnd = random.Random(seed)
+    end = END.toordinal()
+    span = YEARS * 365
+    for i in range(rows):
+        # the density of rows grows linearly towards the end date
+        day = end - span + int(span * ((i + 1) / rows) ** 0.5)
+        if rnd.random() < LATE_SHARE:
+            day -= rnd.randint(1, 30)
+        date = datetime.date.fromordinal(day).isoformat()
+        if rnd.random() < INCOME_SHARE:
+            category = INCOME
+            amount = round(rnd.lognormvariate(10, 0.8), -2)
+            desc = rnd.choice(INCOMES)
+        else:
+            category = EXPENSE
+            amount = round(rnd.lognormvariate(6, 1.2), -1)
+            desc = rnd.choice(EXPENSES)
+            if rnd.random() < 0.3:
+                desc = f'{desc} {rnd.randint(1, 999)}'
+        yield [date, category, max(int(amount), 1), desc]
+
+
+def generate(path: str, rows: int, seed: int = 1) -> None:
+    """Write a tracker file with synthetic records.
+
+    Args:
+        path: The path to the file, it's overwritten.
+        rows: The number of records.
+        seed: The seed of random values.
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(make_rows(rows, seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--file', default='bench.csv')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    generate(args.file, args.rows, args.seed)
+
+
+if __name__ == '__main__':
+    main()
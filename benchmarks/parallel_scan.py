@@ -0,0 +1,91 @@
+"""Measure how full scans of a large CSV file scale with worker processes.
+
+Times a search that has to scan all rows, a report and a recount of the
+balance snapshot with 1 (sequential scan), 2, 4... workers up to the number
+of cores.
+
+Usage:
+    python -m benchmarks.parallel_scan --rows 2000000
+"""
+
+import argparse
+import contextlib
+import glob
+import os
+import random
+import time
+
+from core.query import Query
+from core.record import Record
+from core.tracker import Tracker
+
+DESCS = ['продукты', 'аренда', 'зп', 'кафе', 'такси', 'интернет', 'подарок']
+
+
+def make_tracker(path: str, rows: int) -> Tracker:
+    """Create a tracker file with random records."""
+    tracker = Tracker(path)
+    rnd = random.Random(1)
+    batch = 100_000
+    for start in range(0, rows, batch):
+        tracker._append(
+            [
+                Record(
+                    f'2024-{rnd.randint(1, 12):02}-{rnd.randint(1, 28):02}',
+                    rnd.choice(['Доход', 'Расход']),
+                    rnd.randint(1, 100_000),
+                    f'{rnd.choice(DESCS)} {rnd.randint(1, 50)}',
+                )
+                for _ in range(min(batch, rows - start))
+            ]
+        )
+    return tracker
+
+
+def timed(run) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--file', default='bench_parallel.csv')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    make_tracker(args.file, args.rows)
+    size = os.path.getsize(args.file)
+    print(f'{args.rows} rows, {size / 2**20:.1f} MiB')
+
+    counts = [1]
+    while counts[-1] * 2 <= args.max_workers:
+        counts.append(counts[-1] * 2)
+
+    base = None
+    try:
+        for workers in counts:
+            tracker = Tracker(args.file)
+            tracker.parallel_min_size = 0
+            tracker.workers = workers
+            search = timed(lambda: list(tracker.find(Query(amount=77))))
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tracker.reports_file)
+            report = timed(lambda: tracker.report_data(top=10))
+            os.remove(tracker.snapshot_file)
+            balance = timed(tracker.totals)
+            total = search + report + balance
+            base = base or total
+            print(
+                f'{workers:3} workers  search {search:7.2f} s  '
+                f'report {report:7.2f} s  balance {balance:7.2f} s  '
+                f'{base / total:5.2f}x'
+            )
+    finally:
+        for path in glob.glob(f'{args.file}*'):
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
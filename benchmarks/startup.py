@@ -0,0 +1,106 @@
+"""Measure the start of main.py: imports and `balance` on an empty ledger.
+
+Prints as JSON the median wall time of `main.py balance` on an empty file,
+of a bare interpreter (`python -c pass`) and their difference, the
+overhead of the tracker itself, together with the slowest imports reported
+by `python -X importtime`. With --check the exit code is 1 if the overhead
+is above --target milliseconds.
+
+Usage:
+    python -m benchmarks.startup --repeat 20 --check
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from .commands import MAIN, ROOT
+
+TARGET_MS = 80
+TOP_IMPORTS = 15
+
+
+def wall_time(args: list[str], repeat: int) -> float:
+    """Get the median time of running a command, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def slowest_imports(args: list[str]) -> list[dict]:
+    """Get modules with the largest cumulative import time."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    ).stderr
+    imports = []
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.removeprefix('import time:').split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        imports.append(
+            {
+                'module': parts[2].strip(),
+                'self_ms': int(parts[0]) / 1000,
+                'cumulative_ms': int(parts[1]) / 1000,
+            }
+        )
+    imports.sort(key=lambda item: item['cumulative_ms'], reverse=True)
+    return imports[:TOP_IMPORTS]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--target', type=float, default=TARGET_MS)
+    parser.add_argument('--check', action='store_true')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='tracker-startup-')
+    file = os.path.join(directory, 'empty.csv')
+    command = [MAIN, '--file', file, 'balance']
+    try:
+        subprocess.run(
+            [sys.executable, *command], stdout=subprocess.DEVNULL, check=True
+        )
+        bare = wall_time([sys.executable, '-c', 'pass'], args.repeat)
+        balance = wall_time([sys.executable, *command], args.repeat)
+        imports = slowest_imports(command)
+    finally:
+        for path in glob.glob(f'{file}*'):
+            os.remove(path)
+        os.rmdir(directory)
+
+    overhead = balance - bare
+    json.dump(
+        {
+            'python_ms': bare,
+            'balance_ms': balance,
+            'overhead_ms': overhead,
+            'target_ms': args.target,
+            'imports': imports,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    print()
+    if args.check and overhead > args.target:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,50 @@
 import argparse
 
-from .utils import texts as txt
+from .utils import FORMATS, GROUPINGS, texts as txt
 
 
-def parse_args() -> argparse.Namespace:
+def non_negative(value: str) -> int:
+    """Convert an argument to an integer that is 0 or greater."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(txt.count_validation)
+    return number
+
+
+def add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add pagination and format options of commands printing records."""
+    parser.add_argument(
+        '--offset', type=non_negative, default=0, help=txt.offset_help
+    )
+    parser.add_argument('--limit', type=non_negative, help=txt.limit_help)
+    parser.add_argument(
+        '--format', choices=FORMATS, default='table', help=txt.format_help
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """Create command line argument parser.
-    
+
+    Args:
+        argv: Arguments to parse, sys.argv[1:] by default.
+
     Returns:
         A namespace object that contains parsed command-line arguments.
     """
     parser = argparse.ArgumentParser(
         description='Финансовый трекер',
     )
+    parser.add_argument('-f', '--file', default='data.csv', help=txt.file_help)
+    parser.add_argument(
+        '--backend', choices=['csv', 'sqlite'], help=txt.backend_help
+    )
+    parser.add_argument(
+        '--profile', action='store_true', help=txt.profile_help
+    )
+    parser.add_argument('--profile-out', help=txt.profile_out_help)
     subparsers = parser.add_subparsers(dest='command', required=True)
 
     subparsers.add_parser('balance', help=txt.balance_help)
@@ -20,7 +53,10 @@ def parse_args() -> argparse.Namespace:
     list_ = subparsers.add_parser('list', help=txt.show_help)
 
     for subparser in [show, list_]:
-        subparser.add_argument('-t', '--tail', type=int, help=txt.show_tail)
+        subparser.add_argument(
+            '-t', '--tail', type=non_negative, help=txt.show_tail
+        )
+        add_output_arguments(subparser)
 
     add = subparsers.add_parser('add', help=txt.add_help)
     add.add_argument('date', help=txt.date_help)
@@ -38,7 +74,46 @@ def parse_args() -> argparse.Namespace:
     search = subparsers.add_parser('search', help=txt.search_help)
     search.add_argument('--category', default=None, help=txt.category_help)
     search.add_argument('--date', default=None, help=txt.date_help)
+    search.add_argument(
+        '--from', dest='date_from', default=None, help=txt.date_from_help
+    )
+    search.add_argument(
+        '--to', dest='date_to', default=None, help=txt.date_to_help
+    )
+    search.add_argument('--month', default=None, help=txt.month_help)
+    search.add_argument('--year', default=None, help=txt.year_help)
     search.add_argument('--amount', default=None, type=int, help=txt.amt_help)
     search.add_argument('--desc', default='', help=txt.desc_help, nargs='+')
+    search.add_argument('--words', action='store_true', help=txt.words_help)
+    search.add_argument(
+        '--explain', action='store_true', help=txt.explain_help
+    )
+    add_output_arguments(search)
+
+    report = subparsers.add_parser('report', help=txt.report_help)
+    report.add_argument(
+        '--by', choices=GROUPINGS, default='month', help=txt.report_by_help
+    )
+    report.add_argument(
+        '--top', type=non_negative, default=0, help=txt.report_top_help
+    )
+
+    import_ = subparsers.add_parser('import', help=txt.import_help)
+    import_.add_argument('path', help=txt.import_file_help)
+    import_.add_argument(
+        '--format', choices=['csv', 'jsonl'], help=txt.import_format_help
+    )
+
+    migrate = subparsers.add_parser('migrate', help=txt.migrate_help)
+    migrate.add_argument('source', help=txt.migrate_source_help)
+
+    subparsers.add_parser('compact', help=txt.compact_help)
+
+    subparsers.add_parser('serve', help=txt.serve_help)
+
+    batch = subparsers.add_parser('batch', help=txt.batch_help)
+    batch.add_argument(
+        '--dry-run', action='store_true', help=txt.batch_dry_run_help
+    )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
@@ -0,0 +1,43 @@
+"""Choice of a tracker class by a storage file.
+
+Backend modules are imported only when a tracker is opened, so commands that
+don't need one (like forwarding to the daemon) don't pay for the imports.
+"""
+
+import os
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseTracker
+
+# backend name: (module in this package, tracker class)
+BACKENDS: dict[str, tuple[str, str]] = {
+    'csv': ('tracker', 'Tracker'),
+    'sqlite': ('sqlite_tracker', 'SQLiteTracker'),
+}
+SUFFIXES = {
+    '.db': 'sqlite',
+    '.sqlite': 'sqlite',
+    '.sqlite3': 'sqlite',
+}
+
+
+def backend_class(backend: str) -> type['BaseTracker']:
+    """Import the tracker class of a backend from BACKENDS."""
+    module, name = BACKENDS[backend]
+    return getattr(import_module(f'.{module}', __package__), name)
+
+
+def open_tracker(file: str, backend: str | None = None) -> 'BaseTracker':
+    """Create a tracker for a storage file.
+
+    Args:
+        file: The path to the file with records.
+        backend: The name of a backend from BACKENDS. If not given, it's
+            chosen by the file extension, CSV by default.
+    """
+    if backend is None:
+        suffix = os.path.splitext(file)[1].lower()
+        backend = SUFFIXES.get(suffix, 'csv')
+    return backend_class(backend)(file)
@@ -0,0 +1,363 @@
+"""Storage backend interface of trackers.
+
+BaseTracker implements the user-facing commands (printing records, the
+balance, search results) on top of a few storage operations, which are
+implemented by trackers for each storage: Tracker for CSV files and
+SQLiteTracker for SQLite databases.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from itertools import chain, islice
+from typing import ContextManager, Iterable, Iterator
+
+from .output import write_records
+from .planner import Plan
+from .query import Query
+from .record import Record
+from .reports import aggregate
+from .utils import process_row, texts
+
+
+class BaseTracker(ABC):
+    """Base class of trackers that manage financial records in a storage.
+
+    Records are identified by 1-based IDs, which are their positions in the
+    order of adding.
+
+    Attributes:
+        file: The path to the file of the storage.
+        keep_records: Keep records read by a command in memory for the next
+            commands. It's set for trackers that serve many commands, like
+            the one of the daemon, a single command only pays for it.
+    """
+
+    file: str
+    keep_records = False
+
+    @abstractmethod
+    def iter_records(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Record]:
+        """Read records one by one.
+
+        Args:
+            start: 0-based index of the first record to read.
+            stop: 0-based index of the record to stop before, None for all.
+        """
+
+    @abstractmethod
+    def count(self) -> int:
+        """Get the number of records."""
+
+    @abstractmethod
+    def totals(self) -> tuple[int, int]:
+        """Get the sums of all incomes and all expenses."""
+
+    @abstractmethod
+    def find(
+        self,
+        query: Query,
+        plan: Plan | None = None,
+    ) -> Iterator[tuple[int, Record]]:
+        """Find records matching a query.
+
+        Args:
+            query: The search query.
+            plan: A plan to fill with the way records are read and with the
+                numbers of checked and found records, see core.planner.
+
+        Yields:
+            Pairs of a record ID and a record, in the order of IDs.
+        """
+
+    @abstractmethod
+    def _tail_records(self, n: int) -> list[Record]:
+        """Read the last n records."""
+
+    @abstractmethod
+    def _append(self, records: list[Record]) -> None:
+        """Save new records after the existing ones."""
+
+    @abstractmethod
+    def _edit(self, record_id: int, edit_data: dict) -> bool:
+        """Change fields of a record.
+
+        Args:
+            record_id: The 1-based ID of a record.
+            edit_data: New values of the record fields.
+
+        Returns:
+            False if there is no such record.
+        """
+
+    def compact(self) -> None:
+        """Rewrite storage files to drop data left by edits."""
+
+    def locked(self) -> ContextManager:
+        """Keep other processes from changing records in a with block."""
+        return nullcontext()
+
+    def _save_batch(
+        self,
+        records: list[Record],
+        first_new: int,
+        edited: list[int],
+    ) -> None:
+        """Save records changed by a batch of commands, see core.batch.
+
+        Args:
+            records: All records, with the changes.
+            first_new: The 0-based index of the first added record.
+            edited: Sorted 0-based indexes of changed records that existed
+                before the batch.
+        """
+        for i in edited:
+            record = records[i]
+            self._edit(
+                i + 1,
+                {
+                    'date': record.date,
+                    'category': record.category,
+                    'amount': record.amount,
+                    'desc': record.desc,
+                },
+            )
+        if first_new < len(records):
+            self._append(records[first_new:])
+
+    def _load_records(self) -> list[Record]:
+        """Load all records as a list of Record objects."""
+        return list(self.iter_records())
+
+    def import_from(
+        self,
+        source: 'BaseTracker',
+        batch_size: int = 10_000,
+    ) -> int:
+        """Copy all records of another tracker after the existing ones.
+
+        Args:
+            source: The tracker to copy records from.
+            batch_size: Number of records to save at once.
+
+        Returns:
+            Number of copied records.
+        """
+        count = 0
+        records = source.iter_records()
+        while batch := list(islice(records, batch_size)):
+            self._append(batch)
+            count += len(batch)
+        return count
+
+    def show_records(
+        self,
+        records: list[Record] | None = None,
+        n: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fmt: str = 'table',
+    ) -> None:
+        """Print existing records.
+
+        Records are read and printed one by one, so all records of a large
+        file can be exported with constant memory.
+
+        Args:
+            records: Records to show, all records of the tracker by default.
+            n: Number of last records to show.
+            offset: Number of records to skip, after taking the last n.
+            limit: The largest number of records to show.
+            fmt: The output format, one of core.utils.FORMATS.
+        """
+        first = 0
+        if n:
+            if records is None:
+                total = self.count()
+                records = self._tail_records(n)
+            else:
+                total = len(records)
+                records = records[-n:]
+            first = total - len(records)
+        stop = None if limit is None else offset + limit
+        if records is not None:
+            rows = enumerate(records[offset:stop], start=first + offset + 1)
+        else:
+            rows = enumerate(self.iter_records(offset, stop), start=offset + 1)
+
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is not None:
+            rows = chain([first_row], rows)
+            if first_row[0] > 1 and fmt == 'table':
+                print('  ...')
+        if not self._print_records(rows, fmt) and fmt == 'table':
+            print('Записей нет')
+
+    def _print_records(
+        self,
+        rows: Iterable[tuple[int, Record]],
+        fmt: str = 'table',
+    ) -> int:
+        """Print records with their IDs.
+
+        Args:
+            rows: Pairs of a 1-based row ID and a record.
+            fmt: The output format, one of core.utils.FORMATS.
+
+        Returns:
+            Number of printed records.
+        """
+        return write_records(rows, fmt)
+
+    def show_balance(self) -> None:
+        """Print info: current balance, total incomes, total expenses."""
+        incomes, expenses = self.totals()
+        print(
+            f'{"Текущий баланс:":<15} {incomes - expenses:>10} ₽\n'
+            f'{"Все доходы:":<15} {incomes:>10} ₽\n'
+            f'{"Все расходы:":<15} {expenses:>10} ₽'
+        )
+
+    def report_data(self, top: int = 0) -> dict:
+        """Collect totals of records for all report groupings in one pass.
+
+        Args:
+            top: The number of the largest expenses to keep.
+
+        Returns:
+            Totals like core.reports.Aggregator.result.
+        """
+        return aggregate(enumerate(self.iter_records(), start=1), top)
+
+    def show_report(self, grouping: str = 'month', top: int = 0) -> None:
+        """Print totals of records grouped by a period or a description.
+
+        Args:
+            grouping: One of core.utils.GROUPINGS.
+            top: Number of the largest expenses to print after the totals.
+        """
+        data = self.report_data(top)
+        groups = data['groups'][grouping]
+        if not groups:
+            print('Записей нет')
+            return
+
+        width = max(len(texts.report_key), *(len(row[0]) for row in groups))
+        print(
+            f'{texts.report_key:<{width}} {"Доходы":>10} {"Расходы":>10} '
+            f'{"Баланс":>10} {"Записей":>8}'
+        )
+        for key, incomes, expenses, count in groups:
+            print(
+                f'{key:<{width}} {incomes:>10} {expenses:>10} '
+                f'{incomes - expenses:>10} {count:>8}'
+            )
+
+        if data['top']:
+            print(f'\n{texts.report_top_title}')
+            for i, date, amount, desc in data['top']:
+                print(f'{i:3}.  {date:12} {amount:8}   {desc}')
+
+    def search(
+        self,
+        category: str | None = None,
+        date: str | None = None,
+        amount: int | None = None,
+        desc: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        by_words: bool = False,
+        explain: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+        fmt: str = 'table',
+    ) -> None:
+        """Search for records by category, date, amount, description.
+
+        Records are printed one by one with their IDs as they are found.
+
+        Args:
+            category: The category to filter by.
+            date: The date to filter by.
+            amount: The amount to filter by.
+            desc: The description to filter by, a case-insensitive substring.
+            date_from: The first date of a period to filter by.
+            date_to: The last date of a period to filter by, inclusive.
+            by_words: Match the description by words: every word of desc must
+                be the beginning of some word of the record description.
+            explain: Print the search plan and the numbers of checked and
+                found records after the results, to stderr if the format is
+                not a table.
+            offset: Number of found records to skip.
+            limit: The largest number of records to show.
+            fmt: The output format, one of core.utils.FORMATS.
+        """
+        query = Query(
+            category, date, amount, desc, date_from, date_to, by_words
+        )
+        plan = Plan() if explain else None
+        found = self.find(query, plan)
+        if offset or limit is not None:
+            stop = None if limit is None else offset + limit
+            found = islice(found, offset, stop)
+        if not self._print_records(found, fmt) and fmt == 'table':
+            print('Ничего не найдено.')
+        if plan is not None:
+            print(
+                '\n'.join(plan.describe()),
+                file=sys.stdout if fmt == 'table' else sys.stderr,
+            )
+
+    def add_record(self, record: Record) -> None:
+        """Save a new record based on user input.
+
+        Args:
+            record: The Record object to be saved.
+        """
+        self._append([record])
+        print('Запись сохранена.')
+
+    def add_records(self, rows: Iterable[dict | None]) -> int:
+        """Validate rows of new records and save all valid ones at once.
+
+        Rows that fail validation are reported and skipped, the rest are
+        saved with a single write.
+
+        Args:
+            rows: Dictionaries with date, category, amount and desc values,
+                None for rows that could not be parsed.
+
+        Returns:
+            Number of saved records.
+        """
+        records = []
+        errors = 0
+        for i, row in enumerate(rows, start=1):
+            try:
+                records.append(Record(**process_row(row)))
+            except ValueError as error:
+                errors += 1
+                print(texts.import_row.format(i, error))
+        if records:
+            self._append(records)
+        print(texts.import_done.format(len(records), errors))
+        return len(records)
+
+    def edit_record(self, record_id: int, edit_data: dict) -> bool:
+        """Edit an existing record using its ID.
+
+        Args:
+            record_id: The ID of a record to edit (its number in 'show').
+            edit_data: New values of the record fields.
+        """
+        if self._edit(record_id, edit_data):
+            print('Запись обновлена.')
+            return True
+
+        print('Запись не найдена.')
+        return False
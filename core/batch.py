@@ -0,0 +1,172 @@
+"""Running many commands with one load and one write of the records.
+
+The batch command reads commands from stdin, one per line, with the same
+arguments as main.py, quoted like in a shell; empty lines and lines
+starting with # are skipped. The records are loaded once into a
+BatchTracker, the commands run on it in order and see changes of the
+previous ones, and in the end all changes are saved at once: edited
+records with their new values, new records with one append. With
+--dry-run nothing is saved.
+
+The tracker file is locked for the whole batch, so other processes can't
+change it in between.
+"""
+
+import argparse
+import contextlib
+import io
+import shlex
+import sys
+from typing import Iterable, Iterator
+
+from .argparser import parse_args
+from .base import BaseTracker
+from .commands import run_command
+from .planner import Plan
+from .query import Query
+from .record import Record
+from .utils import EXPENSE, INCOME, texts
+
+# commands with other files or storage maintenance can't run in a batch
+BATCHED = {'add', 'balance', 'edit', 'list', 'report', 'search', 'show'}
+
+
+class BatchTracker(BaseTracker):
+    """Records of another tracker kept in memory until they are saved.
+
+    Attributes:
+        tracker: The tracker the records are loaded from and saved to.
+        records: All records with the changes made so far.
+    """
+
+    def __init__(self, tracker: BaseTracker) -> None:
+        self.tracker = tracker
+        self.file = tracker.file
+        self.records = tracker._load_records()
+        self._first_new = len(self.records)
+        self._edited: set[int] = set()
+
+    def iter_records(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Record]:
+        yield from self.records[start:stop]
+
+    def count(self) -> int:
+        return len(self.records)
+
+    def totals(self) -> tuple[int, int]:
+        incomes = expenses = 0
+        for record in self.records:
+            if record.category == INCOME:
+                incomes += record.amount
+            elif record.category == EXPENSE:
+                expenses += record.amount
+        return incomes, expenses
+
+    def find(
+        self,
+        query: Query,
+        plan: Plan | None = None,
+    ) -> Iterator[tuple[int, Record]]:
+        plan = Plan() if plan is None else plan
+        plan.total = len(self.records)
+        yield from plan.filter(query, enumerate(self.records, start=1))
+
+    def _tail_records(self, n: int) -> list[Record]:
+        return self.records[-n:]
+
+    def _append(self, records: list[Record]) -> None:
+        self.records.extend(records)
+
+    def _edit(self, record_id: int, edit_data: dict) -> bool:
+        if not 1 <= record_id <= len(self.records):
+            return False
+        self.records[record_id - 1].update(**edit_data)
+        if record_id <= self._first_new:
+            self._edited.add(record_id - 1)
+        return True
+
+    @property
+    def changed(self) -> bool:
+        """Check if there are changes to save."""
+        return bool(self._edited) or self._first_new < len(self.records)
+
+    def save(self) -> None:
+        """Save all changes to the tracker at once."""
+        if self.changed:
+            self.tracker._save_batch(
+                self.records, self._first_new, sorted(self._edited)
+            )
+
+
+def parse_line(line: str, file: str) -> argparse.Namespace | None:
+    """Parse a line of a batch into command arguments.
+
+    Args:
+        line: The line with command line arguments.
+        file: The records file of the batch.
+
+    Returns:
+        The namespace returned by core.argparser.parse_args, None for empty
+        lines, comments and help requests.
+
+    Raises:
+        ValueError: If the line is not a valid command of a batch.
+    """
+    if line.lstrip().startswith('#'):
+        return None
+    argv = shlex.split(line)
+    if not argv:
+        return None
+    with contextlib.redirect_stderr(io.StringIO()) as errors:
+        try:
+            args = parse_args(['--file', file, *argv])
+        except SystemExit as exit:
+            if not exit.code:
+                return None
+            raise ValueError(errors.getvalue().strip()) from None
+    if args.command not in BATCHED:
+        raise ValueError(texts.batch_command.format(args.command))
+    if args.file != file:
+        raise ValueError(texts.batch_file)
+    return args
+
+
+def run_batch(
+    lines: Iterable[str],
+    tracker: BaseTracker,
+    dry_run: bool = False,
+) -> int:
+    """Run commands from lines of text and save their changes at once.
+
+    Invalid lines are reported to stderr and skipped, the other commands
+    still run.
+
+    Args:
+        lines: Lines with command line arguments of the commands.
+        tracker: The tracker of the records file.
+        dry_run: Run the commands without saving the changes.
+
+    Returns:
+        Number of skipped lines.
+    """
+    errors = 0
+    with tracker.locked():
+        batch = BatchTracker(tracker)
+        for number, line in enumerate(lines, start=1):
+            try:
+                args = parse_line(line, tracker.file)
+            except ValueError as error:
+                errors += 1
+                print(texts.batch_line.format(number, error), file=sys.stderr)
+                continue
+            if args is not None:
+                run_command(args, batch)
+
+        if dry_run:
+            print(texts.batch_dry_run)
+        else:
+            batch.save()
+    return errors
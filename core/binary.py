@@ -0,0 +1,324 @@
+"""Fixed-width binary copy of the tracker file, read through mmap.
+
+Every record takes ROW.size bytes: the date ordinal, a category code, the
+amount and the position of the description in a separate file of UTF-8
+texts. Filters on categories and amounts are checked on numbers unpacked
+straight from the mapped file, so only matching rows become Record objects.
+
+Rows that can't be stored exactly (a date not in YYYY-MM-DD format, an
+unknown category or a huge amount) get the RAW category code and are read
+from the CSV file instead.
+
+The ledger file starts with the same header as the offset index and is
+kept in sync the same way: appended and edited rows are written in place,
+and if the CSV file was changed otherwise, the ledger is rebuilt. Edited
+descriptions are appended to the texts file, old ones stay there until the
+ledger is rebuilt.
+"""
+
+import datetime
+import mmap
+import os
+import struct
+from functools import lru_cache
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, NamedTuple
+
+from .offsets import HEADER
+from .record import Record
+from .sidecar import FileStamp, tail_crc
+from .utils import EXPENSE, INCOME, to_ordinal
+
+# date ordinal, category code, amount, description offset and length
+ROW = struct.Struct('<iBqQI')
+CATEGORIES = [INCOME, EXPENSE]
+RAW = 255
+BATCH_SIZE = 10_000
+
+
+class LedgerHeader(NamedTuple):
+    """The state of the CSV file the ledger is synced with."""
+
+    stamp: FileStamp
+    crc: int
+    rows: int
+
+    def is_prefix_of(self, file: BinaryIO, stamp: FileStamp) -> bool:
+        """Check if the file only got new rows appended since the last sync."""
+        return (
+            self.stamp.inode == stamp.inode
+            and 0 < self.stamp.size < stamp.size
+            and tail_crc(file, self.stamp.size) == self.crc
+        )
+
+
+@lru_cache(maxsize=4096)
+def from_ordinal(ordinal: int) -> str:
+    """Convert a day ordinal to a YYYY-MM-DD date string."""
+    return datetime.date.fromordinal(ordinal).isoformat()
+
+
+def encode(
+    records: Iterable[Record],
+    desc_offset: int,
+) -> tuple[bytes, bytes]:
+    """Pack records into ledger rows.
+
+    Args:
+        records: The records to pack.
+        desc_offset: The offset in the texts file for the first description.
+
+    Returns:
+        The packed rows and the descriptions to append to the texts file.
+    """
+    rows = bytearray()
+    descs = bytearray()
+    for record in records:
+        desc = record.desc.encode('utf-8')
+        try:
+            ordinal = to_ordinal(record.date)
+            row = ROW.pack(
+                ordinal,
+                CATEGORIES.index(record.category),
+                record.amount,
+                desc_offset + len(descs),
+                len(desc),
+            )
+        except (ValueError, struct.error):
+            row = ROW.pack(0, RAW, 0, 0, 0)
+        else:
+            if from_ordinal(ordinal) != record.date:
+                row = ROW.pack(0, RAW, 0, 0, 0)
+            else:
+                descs += desc
+        rows += row
+    return bytes(rows), bytes(descs)
+
+
+def read_header(path: str) -> LedgerHeader | None:
+    """Read the header of a ledger file, None if it's missing or broken."""
+    try:
+        with open(path, 'rb') as file:
+            *stamp, crc, rows = HEADER.unpack(file.read(HEADER.size))
+    except (OSError, struct.error):
+        return None
+    return LedgerHeader(FileStamp(*stamp), crc, rows)
+
+
+def build_ledger(
+    path: str,
+    descs_path: str,
+    records: Iterable[Record],
+    stamp: FileStamp,
+    crc: int,
+) -> None:
+    """Write a new ledger with all records of the CSV file.
+
+    Both files are written next to the old ones and moved over them, the
+    ledger goes last, so readers never see rows pointing to missing texts.
+
+    Args:
+        path: The path to the ledger file.
+        descs_path: The path to the texts file.
+        records: All records of the CSV file.
+        stamp: The stamp of the CSV file.
+        crc: The checksum of the CSV file end, see sidecar.tail_crc.
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    tmp_descs_path = f'{descs_path}.{os.getpid()}.tmp'
+    rows = 0
+    desc_offset = 0
+    records = iter(records)
+    with open(tmp_path, 'wb') as file, open(tmp_descs_path, 'wb') as descs:
+        file.write(HEADER.pack(*stamp, crc, 0))
+        while batch := list(islice(records, BATCH_SIZE)):
+            data, desc_data = encode(batch, desc_offset)
+            file.write(data)
+            descs.write(desc_data)
+            rows += len(batch)
+            desc_offset += len(desc_data)
+        file.seek(0)
+        file.write(HEADER.pack(*stamp, crc, rows))
+    os.replace(tmp_descs_path, descs_path)
+    os.replace(tmp_path, path)
+
+
+def append_rows(
+    path: str,
+    descs_path: str,
+    records: list[Record],
+    before: FileStamp,
+    after: FileStamp,
+    crc: int,
+) -> bool:
+    """Add appended records to a ledger in place.
+
+    The ledger is only updated if it was synced with the CSV file right
+    before the append. The header goes last, so if the write is interrupted,
+    the extra rows are ignored.
+
+    Args:
+        path: The path to the ledger file.
+        descs_path: The path to the texts file.
+        records: The appended records.
+        before: The stamp of the CSV file before the append.
+        after: The stamp of the CSV file after the append.
+        crc: The checksum of the CSV file end after the append.
+
+    Returns:
+        False if the ledger was not synced and was left as is.
+    """
+    return _update(path, descs_path, None, records, before, after, crc)
+
+
+def replace_rows(
+    path: str,
+    descs_path: str,
+    rows: list[int],
+    records: list[Record],
+    before: FileStamp,
+    after: FileStamp,
+    crc: int,
+) -> bool:
+    """Replace edited records in a ledger in place, see append_rows.
+
+    Args:
+        rows: 0-based indexes of the edited rows.
+        records: The new records of these rows.
+    """
+    return _update(path, descs_path, rows, records, before, after, crc)
+
+
+def _update(
+    path: str,
+    descs_path: str,
+    rows: list[int] | None,
+    records: list[Record],
+    before: FileStamp,
+    after: FileStamp,
+    crc: int,
+) -> bool:
+    try:
+        with open(path, 'r+b') as file, open(descs_path, 'r+b') as descs:
+            *stamp, _, count = HEADER.unpack(file.read(HEADER.size))
+            if FileStamp(*stamp) != before:
+                return False
+            if rows is not None and any(row >= count for row in rows):
+                return False
+            data, desc_data = encode(records, descs.seek(0, os.SEEK_END))
+            descs.write(desc_data)
+            descs.flush()
+            if rows is None:
+                file.seek(HEADER.size + count * ROW.size)
+                file.write(data)
+                count += len(records)
+            else:
+                for i, row in enumerate(rows):
+                    file.seek(HEADER.size + row * ROW.size)
+                    file.write(data[i * ROW.size : (i + 1) * ROW.size])
+            file.seek(0)
+            file.write(HEADER.pack(*after, crc, count))
+    except (OSError, struct.error):
+        return False
+    return True
+
+
+class BinaryLedger:
+    """Records of a ledger file mapped into memory.
+
+    Use it as a context manager to unmap the files.
+
+    Attributes:
+        header: The header of the ledger file.
+    """
+
+    def __init__(self, path: str, descs_path: str) -> None:
+        """Map a ledger file and its texts file.
+
+        Raises:
+            OSError: If the files can't be opened.
+            struct.error: If the ledger is broken.
+        """
+        self._maps = []
+        self._rows = self._map(path)
+        self._descs = self._map(descs_path)
+        *stamp, crc, rows = HEADER.unpack_from(self._rows)
+        self.header = LedgerHeader(FileStamp(*stamp), crc, rows)
+        end = HEADER.size + rows * ROW.size
+        if len(self._rows) < end:
+            self.close()
+            raise struct.error('the ledger file is truncated')
+        self._view = memoryview(self._rows)[HEADER.size : end]
+
+    def _map(self, path: str) -> mmap.mmap | bytes:
+        with open(path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                return b''
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return mapped
+
+    def __len__(self) -> int:
+        return self.header.rows
+
+    def __enter__(self) -> 'BinaryLedger':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the files."""
+        if getattr(self, '_view', None) is not None:
+            self._view.release()
+            self._view = None
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+    def scan(
+        self,
+        category: str | None = None,
+        amount: int | None = None,
+    ) -> Iterator[int]:
+        """Find rows that may match category and amount filters.
+
+        Rows with the RAW code are always returned, they have to be checked
+        with their CSV rows.
+
+        Yields:
+            0-based row indexes in the order of rows.
+        """
+        if category is None and amount is None:
+            yield from range(len(self))
+            return
+        if category is None:
+            code = None
+        elif category in CATEGORIES:
+            code = CATEGORIES.index(category)
+        else:
+            code = RAW  # only raw rows may have other categories
+
+        rows = ROW.iter_unpack(self._view)
+        if amount is None:
+            for i, (_, cat, _, _, _) in enumerate(rows):
+                if cat == code or cat == RAW:
+                    yield i
+        elif code is None:
+            for i, (_, cat, amt, _, _) in enumerate(rows):
+                if amt == amount or cat == RAW:
+                    yield i
+        else:
+            for i, (_, cat, amt, _, _) in enumerate(rows):
+                if cat == RAW or (cat == code and amt == amount):
+                    yield i
+
+    def record(self, row: int) -> Record | None:
+        """Unpack a record by its 0-based row index, None for raw rows."""
+        ordinal, code, amount, offset, length = ROW.unpack_from(
+            self._view, row * ROW.size
+        )
+        if code == RAW:
+            return None
+        desc = bytes(self._descs[offset : offset + length]).decode('utf-8')
+        return Record(from_ordinal(ordinal), CATEGORIES[code], amount, desc)
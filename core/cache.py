@@ -0,0 +1,77 @@
+"""In-memory cache of parsed records of the tracker file.
+
+Records are kept as tuples, so callers get new Record objects and can't
+change the cache by changing them.
+"""
+
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterable
+
+from .record import Record
+from .sidecar import FileStamp, tail_crc
+
+Row = tuple[str, str, int, str]
+
+
+@dataclass
+class RecordCache:
+    """Parsed records of the tracker file and the file state they match.
+
+    Attributes:
+        rows: Fields of all records, in the order of rows.
+        stamp: The file stamp the records were read at.
+        crc: The checksum of the file end, see sidecar.tail_crc.
+        journal: The stamp of the journal of edits the records were read
+            with, None if there was no journal.
+    """
+
+    rows: list[Row] = field(default_factory=list)
+    stamp: FileStamp = FileStamp(0, 0, 0)
+    crc: int = 0
+    journal: FileStamp | None = None
+    _strings: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def extend(self, records: Iterable[Record]) -> None:
+        """Add records to the end.
+
+        Dates and categories repeat a lot, so each distinct value is kept
+        once.
+        """
+        strings = self._strings
+        for record in records:
+            self.rows.append(
+                (
+                    strings.setdefault(record.date, record.date),
+                    strings.setdefault(record.category, record.category),
+                    record.amount,
+                    record.desc,
+                )
+            )
+
+    def replace(self, row: int, record: Record) -> None:
+        """Replace the record at a 0-based row index."""
+        self.rows[row] = (
+            record.date,
+            record.category,
+            record.amount,
+            record.desc,
+        )
+
+    def is_prefix_of(self, file: BinaryIO, stamp: FileStamp) -> bool:
+        """Check if the file only got new rows appended since the last sync."""
+        return (
+            self.stamp.inode == stamp.inode
+            and 0 < self.stamp.size < stamp.size
+            and tail_crc(file, self.stamp.size) == self.crc
+        )
+
+    def sync(
+        self,
+        stamp: FileStamp,
+        crc: int,
+        journal: FileStamp | None,
+    ) -> None:
+        """Mark the records as matching the current state of the files."""
+        self.stamp = stamp
+        self.crc = crc
+        self.journal = journal
@@ -0,0 +1,60 @@
+"""Client of the tracker daemon, see core.daemon.
+
+The client only needs the standard socket and json modules, so forwarding a
+command is cheap compared to loading the records in a new process.
+"""
+
+import json
+import os
+
+from .sidecar import sidecar_path
+
+# Commands the daemon serves; others work with paths relative to the
+# current directory of the client and run locally.
+FORWARDED = {
+    'add',
+    'balance',
+    'compact',
+    'edit',
+    'list',
+    'report',
+    'search',
+    'show',
+}
+
+
+def socket_path(file: str) -> str:
+    """Get the path to the socket of the daemon serving a records file."""
+    return sidecar_path(file, 'sock')
+
+
+def forward(file: str, argv: list[str]) -> dict | None:
+    """Send a command to the daemon serving a records file.
+
+    Args:
+        file: The path to the records file.
+        argv: Command line arguments of the command.
+
+    Returns:
+        The response of the daemon: a dictionary with 'output', the text
+        printed by the command, or 'error'. None if the daemon is not
+        running.
+    """
+    path = socket_path(file)
+    if not os.path.exists(path):
+        return None
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return None
+        request = json.dumps({'argv': argv}, ensure_ascii=False)
+        sock.sendall(request.encode() + b'\n')
+        sock.shutdown(socket.SHUT_WR)
+        data = b''.join(iter(lambda: sock.recv(65536), b''))
+    return json.loads(data)
@@ -0,0 +1,140 @@
+"""Compact column-oriented in-memory storage of records.
+
+Instead of an object per row, every field is kept in its own column: dates
+as day ordinals, categories as 1-byte codes, amounts as 64-bit integers and
+descriptions as indexes of unique strings, since they often repeat.
+
+A date that is not in YYYY-MM-DD format (the file may be edited by hand)
+gets the RAW_DATE ordinal and is kept as is in a separate dict, so such
+rows are loaded and read back unchanged.
+"""
+
+import datetime
+from array import array
+from typing import Iterable, Iterator
+
+from .record import Record
+from .utils import to_ordinal
+
+RAW_DATE = 0  # not a valid ordinal, the date is kept in raw_dates
+
+
+class ColumnarLedger:
+    """Records stored by columns in typed arrays.
+
+    Attributes:
+        dates: Dates of records as proleptic Gregorian ordinals, RAW_DATE
+            for dates not in YYYY-MM-DD format.
+        raw_dates: Dates not in YYYY-MM-DD format by 0-based row indexes.
+        categories: Codes of categories, see category_names.
+        amounts: Amounts of records.
+        desc_ids: Indexes of descriptions, see descs.
+        category_names: Unique categories, the code is the list index.
+        descs: Unique descriptions, the id is the list index.
+    """
+
+    __slots__ = (
+        'dates',
+        'raw_dates',
+        'categories',
+        'amounts',
+        'desc_ids',
+        'category_names',
+        'descs',
+        '_category_codes',
+        '_desc_codes',
+    )
+
+    def __init__(self, records: Iterable[Record] = ()) -> None:
+        """Create a ledger and fill it with records.
+
+        Args:
+            records: Records to add.
+        """
+        self.dates = array('i')
+        self.raw_dates: dict[int, str] = {}
+        self.categories = array('B')
+        self.amounts = array('q')
+        self.desc_ids = array('I')
+        self.category_names: list[str] = []
+        self.descs: list[str] = []
+        self._category_codes: dict[str, int] = {}
+        self._desc_codes: dict[str, int] = {}
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __getitem__(self, i: int) -> Record:
+        """Build a Record object of a row by its 0-based index."""
+        ordinal = self.dates[i]
+        if ordinal == RAW_DATE:
+            date = self.raw_dates[i % len(self)]
+        else:
+            date = datetime.date.fromordinal(ordinal).isoformat()
+        return Record(
+            date=date,
+            category=self.category_names[self.categories[i]],
+            amount=self.amounts[i],
+            desc=self.descs[self.desc_ids[i]],
+        )
+
+    def __iter__(self) -> Iterator[Record]:
+        return (self[i] for i in range(len(self)))
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = len(self.category_names)
+            if code > 255:
+                raise ValueError('Слишком много разных категорий.')
+            self._category_codes[category] = code
+            self.category_names.append(category)
+        return code
+
+    def _date_ordinal(self, i: int, date: str) -> int:
+        """Convert the date of a row, keep it as is if it's not YYYY-MM-DD.
+
+        Args:
+            i: The 0-based index of the row, not negative.
+            date: The date of the record.
+        """
+        try:
+            ordinal = to_ordinal(date)
+        except ValueError:
+            ordinal = RAW_DATE
+        else:
+            if datetime.date.fromordinal(ordinal).isoformat() != date:
+                ordinal = RAW_DATE  # another ISO format, like 20240501
+        if ordinal == RAW_DATE:
+            self.raw_dates[i] = date
+        else:
+            self.raw_dates.pop(i, None)
+        return ordinal
+
+    def _desc_code(self, desc: str) -> int:
+        code = self._desc_codes.get(desc)
+        if code is None:
+            code = len(self.descs)
+            self._desc_codes[desc] = code
+            self.descs.append(desc)
+        return code
+
+    def append(self, record: Record) -> None:
+        """Add a record to the end of the ledger."""
+        self.dates.append(self._date_ordinal(len(self), record.date))
+        self.categories.append(self._category_code(record.category))
+        self.amounts.append(record.amount)
+        self.desc_ids.append(self._desc_code(record.desc))
+
+    def extend(self, records: Iterable[Record]) -> None:
+        for record in records:
+            self.append(record)
+
+    def __setitem__(self, i: int, record: Record) -> None:
+        """Replace a row by its 0-based index."""
+        i = range(len(self))[i]  # count a negative index from the end
+        self.dates[i] = self._date_ordinal(i, record.date)
+        self.categories[i] = self._category_code(record.category)
+        self.amounts[i] = record.amount
+        self.desc_ids[i] = self._desc_code(record.desc)
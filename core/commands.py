@@ -0,0 +1,107 @@
+"""Execution of parsed command line arguments with a tracker.
+
+Modules needed by only some commands are imported in their branches.
+"""
+
+import argparse
+import sys
+from typing import TYPE_CHECKING
+
+from .record import Record
+from .utils import process_args, process_period, texts
+
+if TYPE_CHECKING:
+    from .base import BaseTracker
+
+
+def run_command(args: argparse.Namespace, tracker: 'BaseTracker') -> None:
+    """Run a command from parsed arguments and print its results.
+
+    Args:
+        args: The namespace returned by core.argparser.parse_args.
+        tracker: The tracker of the records file.
+    """
+    if args.command == 'add':
+        record_data = process_args(
+            args.date,
+            args.category,
+            args.amount,
+            args.desc,
+        )
+        if record_data:
+            new_record = Record(
+                date=record_data['date'],
+                category=record_data['category'],
+                amount=record_data['amount'],
+                desc=record_data['desc'],
+            )
+            tracker.add_record(new_record)
+
+    elif args.command == 'edit':
+        record_data = process_args(
+            args.date,
+            args.category,
+            args.amount,
+            args.desc,
+        )
+        if record_data:
+            # remove empty values
+            edit_data = {k: v for k, v in record_data.items() if v}
+            tracker.edit_record(args.id, edit_data)
+
+    elif args.command == 'search':
+        period = process_period(
+            args.date_from,
+            args.date_to,
+            args.month,
+            args.year,
+        )
+        if period:
+            tracker.search(
+                category=args.category,
+                date=args.date,
+                amount=args.amount,
+                desc=' '.join(args.desc),
+                date_from=period[0],
+                date_to=period[1],
+                by_words=args.words,
+                explain=args.explain,
+                offset=args.offset,
+                limit=args.limit,
+                fmt=args.format,
+            )
+
+    elif args.command in ['list', 'show']:
+        tracker.show_records(
+            n=args.tail,
+            offset=args.offset,
+            limit=args.limit,
+            fmt=args.format,
+        )
+
+    elif args.command == 'balance':
+        tracker.show_balance()
+
+    elif args.command == 'report':
+        tracker.show_report(args.by, args.top)
+
+    elif args.command == 'import':
+        from .importer import read_rows
+
+        tracker.add_records(read_rows(args.path, args.format))
+
+    elif args.command == 'compact':
+        tracker.compact()
+        print(texts.compact_done)
+
+    elif args.command == 'batch':
+        from .batch import run_batch
+
+        if run_batch(sys.stdin, tracker, args.dry_run):
+            sys.exit(1)
+
+    elif args.command == 'migrate':
+        from .backends import open_tracker
+
+        count = tracker.import_from(open_tracker(args.source))
+        print(f'Перенесено записей: {count}')
@@ -0,0 +1,136 @@
+"""Daemon that keeps a tracker open and serves commands over a socket.
+
+The daemon listens on a Unix domain socket next to the records file
+(data.csv.sock). A client sends one JSON line with command line arguments:
+
+    {"argv": ["search", "--desc", "еда"]}
+
+and gets one JSON line back with the printed text of the command or an
+error:
+
+    {"output": "  3.  2024-05-01   Расход ..."}
+    {"error": "..."}
+
+Commands are executed one at a time in the event loop, so writes never
+overlap, and the tracker keeps its snapshot and indexes in memory between
+commands instead of loading them for every process.
+
+Example:
+    python main.py serve &
+    python main.py balance  # forwarded to the daemon
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import signal
+
+from .argparser import parse_args
+from .backends import open_tracker
+from .base import BaseTracker
+from .client import FORWARDED, forward, socket_path
+from .commands import run_command
+from .utils import texts
+
+
+class TrackerServer:
+    """Server that runs forwarded commands with a long-living tracker.
+
+    Attributes:
+        file: The path to the records file.
+        backend: The name of the storage backend, None to choose by file.
+        tracker: The tracker of the records file.
+        path: The path to the socket.
+    """
+
+    def __init__(self, file: str, backend: str | None = None) -> None:
+        self.file = file
+        self.backend = backend
+        self.tracker = self.open()
+        self.path = socket_path(file)
+
+    def open(self) -> BaseTracker:
+        """Open a tracker that keeps records in memory between commands."""
+        tracker = open_tracker(self.file, self.backend)
+        tracker.keep_records = True
+        return tracker
+
+    def execute(self, argv: list[str]) -> str:
+        """Run a command and return the text it prints.
+
+        Args:
+            argv: Command line arguments of the command.
+
+        Raises:
+            ValueError: If the command is not served by the daemon.
+        """
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            try:
+                args = parse_args(argv)
+            except SystemExit:
+                raise ValueError(errors.getvalue().strip()) from None
+        if args.command not in FORWARDED:
+            raise ValueError(texts.serve_command.format(args.command))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            try:
+                run_command(args, self.tracker)
+            except Exception:
+                # objects kept in memory may be left half-updated
+                self.tracker = self.open()
+                raise
+        return output.getvalue()
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer a single request of a client."""
+        try:
+            request = json.loads(await reader.readline())
+            response = {'output': self.execute(request['argv'])}
+        except Exception as error:
+            response = {'error': str(error) or type(error).__name__}
+        writer.write(json.dumps(response, ensure_ascii=False).encode())
+        writer.write(b'\n')
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(self) -> asyncio.AbstractServer:
+        """Start listening on the socket.
+
+        A socket left by a daemon that was killed is removed, so the caller
+        has to make sure no other daemon serves the file.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+        return await asyncio.start_unix_server(self.handle, path=self.path)
+
+    async def serve(self) -> None:
+        """Serve commands until the process gets SIGINT or SIGTERM."""
+        server = await self.start()
+        print(texts.serve_started.format(self.path), flush=True)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.path)
+
+
+def serve(file: str, backend: str | None = None) -> None:
+    """Run the daemon for a records file in the foreground."""
+    if forward(file, ['balance']) is not None:
+        print(texts.serve_running)
+        return
+    asyncio.run(TrackerServer(file, backend).serve())
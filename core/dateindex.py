@@ -0,0 +1,97 @@
+"""Sorted index of record dates for range queries.
+
+Dates are kept as day ordinals sorted along with row indexes, so rows of a
+period are found with two binary searches instead of a scan of the file.
+"""
+
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+from .sidecar import FileStamp, atomic_write
+
+HEADER = struct.Struct('<QqQQ')  # size, mtime_ns, inode, rows
+
+
+class DateIndex:
+    """Row indexes sorted by dates.
+
+    Attributes:
+        ordinals: Sorted day ordinals of dates.
+        rows: 0-based row indexes, in the order of ordinals.
+        stamp: The file stamp the index was synced with.
+    """
+
+    def __init__(
+        self,
+        ordinals: array,
+        rows: array,
+        stamp: FileStamp = FileStamp(0, 0, 0),
+    ) -> None:
+        self.ordinals = ordinals
+        self.rows = rows
+        self.stamp = stamp
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def build(cls, dates: Iterable[tuple[int, int]]) -> 'DateIndex':
+        """Create an index from pairs of a row index and a date ordinal."""
+        pairs = sorted(dates, key=lambda pair: (pair[1], pair[0]))
+        return cls(
+            array('i', (ordinal for _, ordinal in pairs)),
+            array('I', (row for row, _ in pairs)),
+        )
+
+    def find(self, start: int, end: int) -> list[int]:
+        """Find rows with dates in a range.
+
+        Args:
+            start: The first ordinal of the range.
+            end: The last ordinal of the range, inclusive.
+
+        Returns:
+            0-based row indexes in ascending order.
+        """
+        lo = bisect_left(self.ordinals, start)
+        hi = bisect_right(self.ordinals, end)
+        return sorted(self.rows[lo:hi])
+
+    def count(self, start: int, end: int) -> int:
+        """Count rows with dates in a range, see find."""
+        lo = bisect_left(self.ordinals, start)
+        return max(0, bisect_right(self.ordinals, end) - lo)
+
+    def add(self, row: int, ordinal: int) -> None:
+        """Insert a row keeping the order."""
+        i = bisect_right(self.ordinals, ordinal)
+        self.ordinals.insert(i, ordinal)
+        self.rows.insert(i, row)
+
+    def remove(self, row: int, ordinal: int) -> None:
+        """Delete a row that was indexed with the given date."""
+        lo = bisect_left(self.ordinals, ordinal)
+        hi = bisect_right(self.ordinals, ordinal)
+        i = self.rows.index(row, lo, hi)
+        del self.ordinals[i]
+        del self.rows[i]
+
+    @classmethod
+    def load(cls, path: str) -> 'DateIndex | None':
+        """Read an index file, return None if it's missing or broken."""
+        try:
+            with open(path, 'rb') as file:
+                *stamp, count = HEADER.unpack(file.read(HEADER.size))
+                ordinals, rows = array('i'), array('I')
+                ordinals.fromfile(file, count)
+                rows.fromfile(file, count)
+        except (OSError, EOFError, struct.error):
+            return None
+        return cls(ordinals, rows, FileStamp(*stamp))
+
+    def save(self, path: str) -> None:
+        header = HEADER.pack(*self.stamp, len(self))
+        data = self.ordinals.tobytes() + self.rows.tobytes()
+        atomic_write(path, header + data)
@@ -0,0 +1,108 @@
+"""Hash index of exact values of record fields.
+
+For each of amount, category and date the index maps every distinct value
+to the sorted rows having it, so rows with an exact value are found without
+reading the file. The lengths of the row lists are also the statistics of
+the fields (the number of records of each category, amount and date) the
+search planner compares filters by, see core.planner.
+
+The index is stored as a header with the file stamp, the values with their
+row counts as JSON and then the row arrays in the same order.
+"""
+
+import json
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from .record import Record
+from .sidecar import FileStamp, atomic_write
+
+FIELDS = ('amount', 'category', 'date')
+HEADER = struct.Struct('<QqQQ')  # size, mtime_ns, inode, size of values
+NO_ROWS = array('I')
+
+
+class FieldIndex:
+    """Rows of records by exact values of their fields.
+
+    Attributes:
+        postings: Sorted 0-based row indexes by field names and values.
+        stamp: The file stamp the index was synced with.
+    """
+
+    def __init__(
+        self,
+        postings: dict[str, dict] | None = None,
+        stamp: FileStamp = FileStamp(0, 0, 0),
+    ) -> None:
+        self.postings = postings or {field: {} for field in FIELDS}
+        self.stamp = stamp
+
+    @classmethod
+    def build(cls, records: Iterable[tuple[int, Record]]) -> 'FieldIndex':
+        """Create an index from pairs of a row index and a record."""
+        index = cls()
+        for row, record in records:
+            index.add(row, record)
+        return index
+
+    def add(self, row: int, record: Record) -> None:
+        """Index the fields of a record of a row.
+
+        Rows are expected to be added in ascending order, except for edits.
+        """
+        for field in FIELDS:
+            postings = self.postings[field]
+            value = getattr(record, field)
+            rows = postings.get(value)
+            if rows is None:
+                postings[value] = array('I', [row])
+            elif rows[-1] > row:
+                rows.insert(bisect_left(rows, row), row)
+            else:
+                rows.append(row)
+
+    def remove(self, row: int, record: Record) -> None:
+        """Delete a row that was indexed with the given record."""
+        for field in FIELDS:
+            postings = self.postings[field]
+            value = getattr(record, field)
+            rows = postings[value]
+            rows.remove(row)
+            if not rows:
+                del postings[value]
+
+    def find(self, field: str, value) -> array:
+        """Get the sorted rows with a value of a field, don't change them."""
+        return self.postings[field].get(value, NO_ROWS)
+
+    @classmethod
+    def load(cls, path: str) -> 'FieldIndex | None':
+        """Read an index file, return None if it's missing or broken."""
+        try:
+            with open(path, 'rb') as file:
+                *stamp, size = HEADER.unpack(file.read(HEADER.size))
+                counts = json.loads(file.read(size))
+                postings = {}
+                for field in FIELDS:
+                    postings[field] = {}
+                    for value, count in counts[field]:
+                        rows = array('I')
+                        rows.fromfile(file, count)
+                        postings[field][value] = rows
+        except (OSError, EOFError, ValueError, KeyError, struct.error):
+            return None
+        return cls(postings, FileStamp(*stamp))
+
+    def save(self, path: str) -> None:
+        counts = {
+            field: [[value, len(rows)] for value, rows in postings.items()]
+            for field, postings in self.postings.items()
+        }
+        data = json.dumps(counts, ensure_ascii=False).encode()
+        parts = [HEADER.pack(*self.stamp, len(data)), data]
+        for postings in self.postings.values():
+            parts.extend(rows.tobytes() for rows in postings.values())
+        atomic_write(path, b''.join(parts))
@@ -0,0 +1,58 @@
+"""Readers of files with records for bulk import.
+
+Rows are read as dictionaries with the keys date, category, amount, desc.
+CSV files may use the tracker header (Дата, Категория, Сумма, Описание) or
+the English keys, JSONL files have a JSON object per line.
+"""
+
+import csv
+import json
+from typing import Iterator, TextIO
+
+FIELD_NAMES = {
+    'Дата': 'date',
+    'Категория': 'category',
+    'Сумма': 'amount',
+    'Описание': 'desc',
+}
+FORMATS = ['csv', 'jsonl']
+
+
+def _rename_keys(row: dict) -> dict:
+    return {FIELD_NAMES.get(key, key): value for key, value in row.items()}
+
+
+def read_csv(file: TextIO) -> Iterator[dict]:
+    """Read rows of a CSV file with a header."""
+    for row in csv.DictReader(file):
+        yield _rename_keys(row)
+
+
+def read_jsonl(file: TextIO) -> Iterator[dict | None]:
+    """Read rows of a JSONL file, skipping empty lines.
+
+    Yields:
+        Rows as dictionaries, or None for lines that are not JSON objects.
+    """
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield _rename_keys(row) if isinstance(row, dict) else None
+
+
+def read_rows(path: str, fmt: str | None = None) -> Iterator[dict | None]:
+    """Read rows of records from a file.
+
+    Args:
+        path: The path to the file.
+        fmt: The format from FORMATS, by default chosen by the extension.
+    """
+    if fmt is None:
+        fmt = 'jsonl' if path.endswith(('.jsonl', '.json')) else 'csv'
+    reader = read_jsonl if fmt == 'jsonl' else read_csv
+    with open(path, encoding='utf-8-sig', newline='') as file:
+        yield from reader(file)
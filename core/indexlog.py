@@ -0,0 +1,130 @@
+"""Append-only log of record changes for a secondary index.
+
+Saving a whole index (of dates, descriptions or field values) on every add
+or edit costs as much as the index is large. Instead, a write appends the
+changed rows to a log file next to the index (data.csv.text.log for
+data.csv.text), and a reader loads the index and replays the log on it.
+Once the log grows large, the reader saves the whole index again and
+starts a new log.
+
+The log starts with a header: the stamp of the tracker file the index was
+saved at, the stamp the log brings it to and the size of the changes. The
+header is written after the changes, so if a write is interrupted, the
+extra bytes are ignored. Every change is a JSON line with the 0-based row
+index, the fields of the record before the change (null for a new row) and
+after it.
+"""
+
+import json
+import struct
+from typing import NamedTuple
+
+from .record import Record
+from .sidecar import FileStamp, atomic_write, sidecar_path
+
+HEADER = struct.Struct('<QqQQqQQ')  # base stamp, stamp, size of changes
+
+# 0-based row index, the record before the change or None, the new record
+Change = tuple[int, Record | None, Record]
+
+
+class LogTail(NamedTuple):
+    """Changes of an index log after some position.
+
+    Attributes:
+        stamp: The stamp of the tracker file the changes bring the index to.
+        changes: The changes in the order they were made.
+        size: The size of all changes in the log, the position to read the
+            next ones from.
+    """
+
+    stamp: FileStamp
+    changes: list[Change]
+    size: int
+
+
+def log_path(index_path: str) -> str:
+    """Build the path of the log of an index file."""
+    return sidecar_path(index_path, 'log')
+
+
+def start_log(path: str, stamp: FileStamp) -> None:
+    """Create an empty log for an index saved at a stamp of the file."""
+    atomic_write(path, HEADER.pack(*stamp, *stamp, 0))
+
+
+def _fields(record: Record | None) -> list | None:
+    if record is None:
+        return None
+    return [record.date, record.category, record.amount, record.desc]
+
+
+def _record(fields: list | None) -> Record | None:
+    return None if fields is None else Record(*fields)
+
+
+def append_changes(
+    path: str,
+    changes: list[Change],
+    before: FileStamp,
+    after: FileStamp,
+) -> None:
+    """Add changes to a log file without reading it.
+
+    The log is only updated if it was synced with the tracker file right
+    before the write, otherwise the index is out of date anyway and is
+    rebuilt on the next load.
+
+    Args:
+        path: The path to the log file.
+        changes: The changes of the write.
+        before: The stamp of the tracker file before the write.
+        after: The stamp of the tracker file after the write.
+    """
+    lines = [
+        json.dumps([row, _fields(old), _fields(new)], ensure_ascii=False)
+        for row, old, new in changes
+    ]
+    data = ''.join(f'{line}\n' for line in lines).encode('utf-8')
+    try:
+        with open(path, 'r+b') as file:
+            *stamps, size = HEADER.unpack(file.read(HEADER.size))
+            if FileStamp(*stamps[3:]) != before:
+                return
+            file.seek(HEADER.size + size)
+            file.write(data)
+            file.truncate()
+            file.seek(0)
+            file.write(HEADER.pack(*stamps[:3], *after, size + len(data)))
+    except (OSError, struct.error):
+        return
+
+
+def read_log(path: str, base: FileStamp, offset: int = 0) -> LogTail | None:
+    """Read the changes of a log after a position.
+
+    Args:
+        path: The path to the log file.
+        base: The stamp the index was saved at.
+        offset: The size of the changes that were already read.
+
+    Returns:
+        The changes, or None if the log is missing, broken or was started
+        for another state of the index.
+    """
+    try:
+        with open(path, 'rb') as file:
+            *stamps, size = HEADER.unpack(file.read(HEADER.size))
+            if FileStamp(*stamps[:3]) != base or size < offset:
+                return None
+            file.seek(HEADER.size + offset)
+            data = file.read(size - offset)
+        changes = [
+            (row, _record(old), _record(new))
+            for row, old, new in map(json.loads, data.splitlines())
+        ]
+    except (OSError, ValueError, TypeError, struct.error):
+        return None
+    if len(data) != size - offset:
+        return None
+    return LogTail(FileStamp(*stamps[3:]), changes, size)
@@ -0,0 +1,147 @@
+"""Append-only journal of record edits not yet written to the tracker file.
+
+An edit appends one JSON line with the 1-based ID of the record and its
+changed fields (the arguments of Record.update) instead of rewriting the
+CSV file, so the file itself only grows until the journal is folded into
+it by compaction. Readers apply the journaled edits on top of the rows
+they parse.
+
+The first line of the journal identifies the tracker file it belongs to:
+its inode, size and the checksum of its end when the journal was started.
+After the file is replaced by compaction or changed by hand, the old
+journal no longer applies and is ignored.
+"""
+
+import json
+import os
+from dataclasses import fields
+from typing import Iterable, Iterator
+
+from .record import Record
+from .sidecar import FileStamp, tail_crc
+
+FIELDS = {field.name for field in fields(Record)}
+
+
+class Journal:
+    """Edits of records of the tracker file.
+
+    Attributes:
+        inode: The inode of the tracker file the edits apply to.
+        file_size: The size of the tracker file when the journal was started.
+        file_crc: The checksum of the tracker file end at that size, see
+            sidecar.tail_crc.
+        edits: Changed fields by 0-based row indexes, later edits of a row
+            merged over earlier ones.
+        size: The size of the journal file.
+    """
+
+    def __init__(self, inode: int, file_size: int, file_crc: int) -> None:
+        self.inode = inode
+        self.file_size = file_size
+        self.file_crc = file_crc
+        self.edits: dict[int, dict] = {}
+        self.size = 0
+        self._checked: FileStamp | None = None
+
+    def __len__(self) -> int:
+        return len(self.edits)
+
+    @classmethod
+    def load(cls, path: str) -> 'Journal | None':
+        """Load a journal file, None if it's missing or has no header.
+
+        A line cut short by a crash during an edit is skipped and
+        overwritten by the next edit.
+        """
+        try:
+            with open(path, 'rb') as file:
+                header = file.readline()
+                base = json.loads(header)
+                journal = cls(base['inode'], base['size'], base['crc'])
+                journal.size = len(header)
+                for line in file:
+                    if not line.endswith(b'\n'):
+                        break
+                    entry = json.loads(line)
+                    journal._merge(entry.pop('id') - 1, entry)
+                    journal.size += len(line)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return journal
+
+    def belongs_to(self, path: str, stamp: FileStamp) -> bool:
+        """Check if the edits apply to the current state of a tracker file.
+
+        Args:
+            path: The path to the tracker file.
+            stamp: The current stamp of the tracker file.
+        """
+        if stamp == self._checked:
+            return True
+        if stamp.inode != self.inode or stamp.size < self.file_size:
+            return False
+        with open(path, 'rb') as file:
+            if tail_crc(file, self.file_size) != self.file_crc:
+                return False
+        self._checked = stamp
+        return True
+
+    def _merge(self, row: int, changes: dict) -> None:
+        self.edits.setdefault(row, {}).update(changes)
+
+    def append(self, path: str, edits: list[tuple[int, dict]]) -> None:
+        """Write edits to the end of the journal file and sync it once.
+
+        The file is created with the header by the first edit.
+
+        Args:
+            path: The path to the journal file.
+            edits: Pairs of the 0-based index of an edited row and new
+                values of the record fields.
+        """
+        edits = [
+            (row, {k: v for k, v in changes.items() if k in FIELDS})
+            for row, changes in edits
+        ]
+        lines = [
+            json.dumps({'id': row + 1, **changes}, ensure_ascii=False)
+            for row, changes in edits
+        ]
+        data = ''.join(f'{line}\n' for line in lines).encode('utf-8')
+        if not self.size:
+            header = json.dumps(
+                {
+                    'inode': self.inode,
+                    'size': self.file_size,
+                    'crc': self.file_crc,
+                }
+            )
+            data = f'{header}\n'.encode('utf-8') + data
+        with open(path, 'r+b' if self.size else 'wb') as file:
+            file.seek(self.size)
+            file.write(data)
+            file.truncate()
+            file.flush()
+            os.fsync(file.fileno())
+        self.size += len(data)
+        for row, changes in edits:
+            self._merge(row, changes)
+
+    def apply(
+        self,
+        records: Iterable[Record],
+        first_row: int,
+    ) -> Iterator[Record]:
+        """Apply the edits to records of consecutive rows.
+
+        Args:
+            records: Records parsed from the tracker file.
+            first_row: The 0-based index of the row of the first record.
+        """
+        edits = self.edits
+        for row, record in enumerate(records, start=first_row):
+            changes = edits.get(row)
+            if changes is not None:
+                record.update(**changes)
+            yield record
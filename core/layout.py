@@ -0,0 +1,74 @@
+"""Positions of record fields in rows of a CSV file.
+
+The positions are resolved from the header once per file read, so rows can
+be parsed with csv.reader into lists and written with csv.writer from lists,
+without building a dict for every row, while columns may go in any order.
+"""
+
+from operator import itemgetter
+
+from .record import Record
+
+
+class RowLayout:
+    """Mapping between record fields and columns of a CSV file.
+
+    Attributes:
+        width: The number of columns in the header.
+        positions: Column indexes of date, category, amount and desc.
+    """
+
+    def __init__(self, header: list[str], fieldnames: list[str]) -> None:
+        """Find record fields in a header.
+
+        Args:
+            header: Column names from the first row of the file.
+            fieldnames: Names of date, category, amount and desc columns.
+
+        Raises:
+            ValueError: If some of the fields are missing in the header.
+        """
+        self.width = len(header)
+        self.positions = tuple(header.index(name) for name in fieldnames)
+        self._get = itemgetter(*self.positions)
+        self._standard = self.positions == tuple(range(self.width))
+
+    @classmethod
+    def resolve(
+        cls,
+        header: list[str],
+        fieldnames: list[str],
+    ) -> 'RowLayout | None':
+        """Find record fields in a header, None if some are missing."""
+        try:
+            return cls(header, fieldnames)
+        except ValueError:
+            return None
+
+    def to_record(self, row: list[str]) -> Record:
+        """Convert a parsed row to a Record object.
+
+        Missing values of short rows are None, like csv.DictReader does.
+        """
+        if len(row) < self.width:
+            row = row + [None] * (self.width - len(row))
+        date, category, amount, desc = self._get(row)
+        return Record(date, category, int(amount), desc)
+
+    def to_row(self, record: Record, cells: list[str] | None = None) -> list:
+        """Convert a Record object to a row for csv.writer.
+
+        Args:
+            record: The record to convert.
+            cells: The current cells of the row, columns that are not record
+                fields keep their values. Empty by default.
+        """
+        values = [record.date, record.category, record.amount, record.desc]
+        if cells is None and self._standard:
+            return values
+        row = [''] * self.width
+        if cells is not None:
+            row[: len(cells)] = cells
+        for position, value in zip(self.positions, values):
+            row[position] = value
+        return row
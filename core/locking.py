@@ -0,0 +1,79 @@
+"""Advisory file locks that coordinate processes using the same records.
+
+Readers hold a shared lock and writers an exclusive one. The lock is taken
+on a separate file next to the records file, because rewrites replace the
+records file with a new one. Locks are advisory: they only protect against
+other trackers, not against editing the file by hand.
+
+On platforms without fcntl locks are not taken.
+"""
+
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class FileLock:
+    """Shared/exclusive lock on a file, reentrant within one object.
+
+    Nested locks reuse the lock that is already held. An exclusive lock
+    nested in a shared one upgrades it until the inner block ends; the
+    upgrade is not atomic, so the inner block has to read everything it
+    relies on after taking the lock.
+
+    Attributes:
+        path: The path to the lock file, created if missing.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: IO | None = None
+        self._depth = 0
+        self._exclusive = False
+
+    def shared(self):
+        """Hold the lock for reading."""
+        return self._hold(exclusive=False)
+
+    def exclusive(self):
+        """Hold the lock for writing."""
+        return self._hold(exclusive=True)
+
+    @contextmanager
+    def _hold(self, exclusive: bool) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+
+        upgrade = False
+        if not self._depth:
+            self._file = open(self.path, 'a')
+            try:
+                fcntl.flock(self._file, _mode(exclusive))
+            except BaseException:
+                self._file.close()
+                raise
+            self._exclusive = exclusive
+        elif exclusive and not self._exclusive:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+            self._exclusive = upgrade = True
+
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._file.close()  # releases the lock
+                self._file = None
+            elif upgrade:
+                fcntl.flock(self._file, fcntl.LOCK_SH)
+                self._exclusive = False
+
+
+def _mode(exclusive: bool) -> int:
+    return fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
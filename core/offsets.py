@@ -0,0 +1,146 @@
+"""Index of byte offsets where each row of the tracker file starts.
+
+The index lets the tracker read a single row without going through the
+whole file. It's stored as a small header with the file stamp followed
+by an array of 8-byte offsets, so appending a row appends 8 bytes.
+"""
+
+import struct
+from array import array
+from typing import BinaryIO, Iterator
+
+from .sidecar import FileStamp, atomic_write, tail_crc
+
+HEADER = struct.Struct('<QqQIQ')  # size, mtime_ns, inode, tail crc, rows
+
+
+def scan_row_offsets(file: BinaryIO, offset: int) -> Iterator[int]:
+    """Find where rows start, skipping newlines inside quoted fields.
+
+    Blank lines outside of quotes are not rows, the CSV reader skips them
+    too, so row indexes match the record IDs.
+
+    Args:
+        file: The CSV file opened in binary mode.
+        offset: The byte offset of a row beginning to scan from.
+    """
+    file.seek(offset)
+    start = offset
+    quotes = 0
+    for line in file:
+        quotes += line.count(b'"')
+        offset += len(line)
+        if quotes % 2 == 0:
+            blank = start + len(line) == offset and not line.strip(b'\r\n')
+            if not blank:
+                yield start
+            start = offset
+            quotes = 0
+
+
+class OffsetIndex:
+    """Byte offsets of the rows of the tracker file.
+
+    Attributes:
+        offsets: Offset of every row, in the order of rows.
+        stamp: The file stamp the index was synced with.
+        crc: The checksum of the file end, see sidecar.tail_crc.
+    """
+
+    def __init__(
+        self,
+        offsets: array,
+        stamp: FileStamp = FileStamp(0, 0, 0),
+        crc: int = 0,
+    ) -> None:
+        self.offsets = offsets
+        self.stamp = stamp
+        self.crc = crc
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def span(self, i: int) -> tuple[int, int]:
+        """Get start and end offsets of a row by its 0-based index."""
+        end = self.offsets[i + 1] if i + 1 < len(self) else self.stamp.size
+        return self.offsets[i], end
+
+    @classmethod
+    def build(cls, file: BinaryIO) -> 'OffsetIndex':
+        """Index a file from scratch.
+
+        Args:
+            file: The CSV file with a header opened in binary mode.
+        """
+        file.seek(0)
+        header_size = len(file.readline())
+        return cls(array('Q', scan_row_offsets(file, header_size)))
+
+    def is_prefix_of(self, file: BinaryIO, stamp: FileStamp) -> bool:
+        """Check if the file only got new rows appended since the last sync."""
+        return (
+            self.stamp.inode == stamp.inode
+            and 0 < self.stamp.size < stamp.size
+            and tail_crc(file, self.stamp.size) == self.crc
+        )
+
+    def extend(self, file: BinaryIO) -> None:
+        """Index rows appended after the synced part of the file."""
+        self.offsets.extend(scan_row_offsets(file, self.stamp.size))
+
+    def sync(self, file: BinaryIO, stamp: FileStamp) -> None:
+        """Mark the index as describing the current state of the file."""
+        self.stamp = stamp
+        self.crc = tail_crc(file, stamp.size)
+
+    def _header(self) -> bytes:
+        return HEADER.pack(*self.stamp, self.crc, len(self))
+
+    @classmethod
+    def load(cls, path: str) -> 'OffsetIndex | None':
+        """Read an index file, return None if it's missing or broken."""
+        try:
+            with open(path, 'rb') as file:
+                *stamp, crc, rows = HEADER.unpack(file.read(HEADER.size))
+                offsets = array('Q')
+                offsets.fromfile(file, rows)
+        except (OSError, EOFError, struct.error):
+            return None
+        return cls(offsets, FileStamp(*stamp), crc)
+
+    def save(self, path: str) -> None:
+        atomic_write(path, self._header() + self.offsets.tobytes())
+
+
+def append_offsets(
+    path: str,
+    offsets: list[int],
+    before: FileStamp,
+    after: FileStamp,
+    crc: int,
+) -> None:
+    """Add offsets of appended rows to an index file without loading it.
+
+    The file is only updated if it was synced with the tracker file right
+    before the append, otherwise it's left to be fixed on the next load.
+    The header goes last and holds the number of rows, so if the write is
+    interrupted, the extra offsets are ignored.
+
+    Args:
+        path: The path to the index file.
+        offsets: Offsets of the appended rows.
+        before: The stamp of the tracker file before the append.
+        after: The stamp of the tracker file after the append.
+        crc: The checksum of the tracker file end after the append.
+    """
+    try:
+        with open(path, 'r+b') as file:
+            *stamp, _, rows = HEADER.unpack(file.read(HEADER.size))
+            if FileStamp(*stamp) != before:
+                return
+            file.seek(HEADER.size + rows * 8)
+            file.write(array('Q', offsets).tobytes())
+            file.seek(0)
+            file.write(HEADER.pack(*after, crc, rows + len(offsets)))
+    except (OSError, struct.error):
+        return
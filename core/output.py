@@ -0,0 +1,88 @@
+"""Writing found records to stdout as a table, CSV or JSON lines.
+
+Rows are formatted into an in-memory buffer as they are produced and the
+buffer goes to the output with one write per FLUSH_ROWS rows, so a large
+result takes few system calls and constant memory. CSV and JSON lines have
+the keys date, category, amount and desc after the record ID, so they can be
+imported back with the import command.
+"""
+
+import csv
+import io
+import json
+import sys
+from typing import Callable, Iterable, TextIO
+
+from .record import Record
+
+FLUSH_ROWS = 1024
+CSV_HEADER = ['id', 'date', 'category', 'amount', 'desc']
+
+RowWriter = Callable[[int, Record], object]
+
+
+def _table_writer(buffer: TextIO) -> RowWriter:
+    def write(i: int, rec: Record) -> None:
+        buffer.write(
+            f'{i:3}.  {rec.date:12} {rec.category:6} '
+            f'{rec.amount:8}   {rec.desc}\n'
+        )
+
+    return write
+
+
+def _csv_writer(buffer: TextIO) -> RowWriter:
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(CSV_HEADER)
+    return lambda i, rec: writer.writerow(
+        (i, rec.date, rec.category, rec.amount, rec.desc)
+    )
+
+
+def _jsonl_writer(buffer: TextIO) -> RowWriter:
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+
+    def write(i: int, rec: Record) -> None:
+        row = {
+            'id': i,
+            'date': rec.date,
+            'category': rec.category,
+            'amount': rec.amount,
+            'desc': rec.desc,
+        }
+        buffer.write(encode(row))
+        buffer.write('\n')
+
+    return write
+
+
+WRITERS = {'table': _table_writer, 'csv': _csv_writer, 'jsonl': _jsonl_writer}
+
+
+def write_records(
+    rows: Iterable[tuple[int, Record]],
+    fmt: str = 'table',
+    file: TextIO | None = None,
+) -> int:
+    """Write records with their IDs in one of core.utils.FORMATS.
+
+    Args:
+        rows: Pairs of a record ID and a record.
+        fmt: The output format, a table by default.
+        file: The text stream to write to, sys.stdout by default.
+
+    Returns:
+        Number of written records.
+    """
+    file = sys.stdout if file is None else file
+    buffer = io.StringIO()
+    write = WRITERS[fmt](buffer)
+    count = 0
+    for count, (i, record) in enumerate(rows, start=1):
+        write(i, record)
+        if count % FLUSH_ROWS == 0:
+            file.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    file.write(buffer.getvalue())
+    return count
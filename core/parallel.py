@@ -0,0 +1,143 @@
+"""Scan of large tracker files in several processes.
+
+The rows of the file are split into ranges of about the same size in bytes
+using the offset index, so every range starts at a row boundary. Each range
+is parsed in a worker process and its records are passed to a copy of a
+consumer: an object with add(record_id, record) and merge(other) methods.
+Consumers come back in the order of the ranges, so merging them gives the
+same result as a sequential scan, with the same record IDs.
+"""
+
+import os
+from bisect import bisect_left
+from contextlib import closing
+from itertools import islice, repeat
+from typing import TYPE_CHECKING, Iterator, TypeVar
+
+from .offsets import OffsetIndex
+from .query import Query
+from .record import Record
+from .utils import EXPENSE, INCOME
+
+if TYPE_CHECKING:
+    from .tracker import Tracker
+
+PARALLEL_MIN_SIZE = 32 * 1024 * 1024
+CHUNKS_PER_WORKER = 4
+
+Consumer = TypeVar('Consumer')
+
+
+class Matches:
+    """Consumer that collects records matching a query with their IDs."""
+
+    def __init__(self, query: Query) -> None:
+        self.query = query
+        self.found: list[tuple[int, Record]] = []
+
+    def add(self, record_id: int, record: Record) -> None:
+        if self.query.matches(record):
+            self.found.append((record_id, record))
+
+    def merge(self, other: 'Matches') -> None:
+        self.found.extend(other.found)
+
+
+class Totals:
+    """Consumer that counts records and sums incomes and expenses."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.incomes = 0
+        self.expenses = 0
+
+    def add(self, record_id: int, record: Record) -> None:
+        self.rows += 1
+        if record.category == INCOME:
+            self.incomes += record.amount
+        elif record.category == EXPENSE:
+            self.expenses += record.amount
+
+    def merge(self, other: 'Totals') -> None:
+        self.rows += other.rows
+        self.incomes += other.incomes
+        self.expenses += other.expenses
+
+
+def split_rows(index: OffsetIndex, chunks: int) -> list[tuple[int, int]]:
+    """Split rows into ranges of about the same size in bytes.
+
+    Args:
+        index: The offset index synced with the file.
+        chunks: The wanted number of ranges.
+
+    Returns:
+        Pairs of the first row and the row to stop before, 0-based.
+    """
+    rows = len(index)
+    if not rows:
+        return []
+    first = index.offsets[0]
+    size = index.stamp.size - first
+    bounds = {0, rows}
+    for i in range(1, chunks):
+        bounds.add(bisect_left(index.offsets, first + size * i // chunks))
+    bounds = sorted(bounds)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _scan_rows(
+    tracker: 'Tracker',
+    offset: int,
+    start: int,
+    stop: int,
+    consumer: Consumer,
+) -> Consumer:
+    """Pass records of a range of rows to a consumer, run by workers."""
+    with open(tracker.file, 'rb') as file:
+        rows = tracker._read_rows_from(file, offset, start)
+        with closing(rows):
+            records = islice(rows, stop - start)
+            for record_id, record in enumerate(records, start=start + 1):
+                consumer.add(record_id, record)
+    return consumer
+
+
+def parallel_scan(
+    tracker: 'Tracker',
+    index: OffsetIndex,
+    consumer: Consumer,
+    workers: int,
+) -> Iterator[Consumer]:
+    """Pass all records of a file to copies of a consumer in workers.
+
+    The file must not change during the scan, so the caller holds a lock.
+
+    Args:
+        tracker: The tracker of the file, sent to the workers.
+        index: The offset index synced with the file.
+        consumer: An empty consumer, copied for every range.
+        workers: The number of worker processes.
+
+    Yields:
+        Consumers with records of consecutive ranges of rows.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    ranges = split_rows(index, workers * CHUNKS_PER_WORKER)
+    starts, stops = zip(*ranges) if ranges else ((), ())
+    offsets = [index.offsets[start] for start in starts]
+    with ProcessPoolExecutor(min(workers, len(ranges) or 1)) as executor:
+        yield from executor.map(
+            _scan_rows,
+            repeat(tracker),
+            offsets,
+            starts,
+            stops,
+            repeat(consumer),
+        )
+
+
+def default_workers() -> int:
+    """Get the number of worker processes to use: one per core."""
+    return os.cpu_count() or 1
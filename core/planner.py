@@ -0,0 +1,126 @@
+"""Choice of the way a search reads records, and its explanation.
+
+A tracker with indexes estimates how many rows pass each indexed filter:
+exact category, amount and date with core.fieldindex, a period with
+core.dateindex and a description with core.textindex. Candidates are taken
+from the most selective filter only and the other filters are checked on
+them. If even the best filter keeps a large share of the records, reading
+rows one by one costs more than a sequential scan, so the records are
+scanned instead. A scan of the binary ledger by category and amount is
+much cheaper than parsing all rows, so it's preferred to an index already
+at a smaller share.
+
+The plan also counts the checked and the found records, search prints it
+after the results with --explain.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+from .query import Query
+from .record import Record
+from .utils import texts
+
+# ways to read candidate records
+INDEX = 'index'  # rows of the most selective estimate
+BINARY = 'binary'  # scan of the binary ledger by category and amount
+SCAN = 'scan'  # all records
+SQL = 'sql'  # by the database
+# the largest share of candidates in all records to still read them by rows
+INDEX_MAX_SHARE = 0.25
+BINARY_INDEX_MAX_SHARE = 0.05  # if the binary ledger can be scanned instead
+
+
+@dataclass
+class Estimate:
+    """Rows passing one filter according to an index.
+
+    Attributes:
+        field: The filtered field, a key of texts.plan_fields.
+        value: The value of the filter as shown in the plan.
+        count: The number of candidate rows.
+        rows: A function that returns the candidates, 0-based row indexes
+            in ascending order.
+    """
+
+    field: str
+    value: str
+    count: int
+    rows: Callable[[], Iterable[int]] = field(repr=False)
+
+
+@dataclass
+class Plan:
+    """The way a search reads records and the numbers of read records.
+
+    Attributes:
+        total: The number of all records.
+        access: How candidates are read: INDEX, BINARY, SCAN or SQL.
+        estimates: Estimates of the indexed filters of the query.
+        driver: The estimate the candidates are taken from with INDEX.
+        details: Notes of the storage, like the query plan of SQLite.
+        checked: The number of records checked against the query.
+        found: The number of matching records.
+    """
+
+    total: int = 0
+    access: str = SCAN
+    estimates: list[Estimate] = field(default_factory=list)
+    driver: Estimate | None = None
+    details: list[str] = field(default_factory=list)
+    checked: int = 0
+    found: int = 0
+
+    def choose(self, binary: bool) -> None:
+        """Pick the access by the most selective estimate.
+
+        Args:
+            binary: Scan the binary ledger instead of all records if no
+                estimate is selective enough.
+        """
+        share = BINARY_INDEX_MAX_SHARE if binary else INDEX_MAX_SHARE
+        best = min(self.estimates, key=lambda item: item.count, default=None)
+        if best is not None and best.count <= self.total * share:
+            self.access = INDEX
+            self.driver = best
+        else:
+            self.access = BINARY if binary else SCAN
+
+    def filter(
+        self,
+        query: Query,
+        records: Iterable[tuple[int, Record]],
+    ) -> Iterator[tuple[int, Record]]:
+        """Check candidate records against the query and count them.
+
+        Args:
+            query: The search query.
+            records: Pairs of a record ID and a record.
+        """
+        for i, record in records:
+            self.checked += 1
+            if query.matches(record):
+                self.found += 1
+                yield i, record
+
+    def describe(self) -> list[str]:
+        """Get the lines of the explanation of the plan."""
+        names = texts.plan_fields
+        lines = [texts.plan_title.format(self.total)]
+        for item in self.estimates:
+            lines.append(
+                texts.plan_estimate.format(
+                    names[item.field], item.value, item.count
+                )
+            )
+        if self.driver is not None:
+            lines.append(
+                texts.plan_index.format(
+                    names[self.driver.field], self.driver.value
+                )
+            )
+        else:
+            lines.append(texts.plan_access[self.access])
+        lines.extend(f'  {line}' for line in self.details)
+        lines.append(texts.plan_rows.format(self.checked, self.found))
+        return lines
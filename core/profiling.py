@@ -0,0 +1,247 @@
+"""Opt-in timing of tracker operations.
+
+Profiling is turned on with the --profile option or the TRACKER_PROFILE
+environment variable. Then methods of the tracker class and argument
+processing functions are wrapped with timers for the time of the command:
+for each of them the number of calls, the total time, the own time
+(without nested timed calls) and the number of rows returned or yielded
+are collected and printed to stderr. Time spent iterating a generator is
+counted for the generator, not for the loop consuming it, so the own time
+of the printing methods is the printing itself.
+
+With --profile-out (or a path in TRACKER_PROFILE) the results are also
+written to a file: as JSON if it ends with .json, otherwise as cProfile
+stats for pstats or snakeviz.
+
+When profiling is off nothing is wrapped, so commands run the same code as
+without this module.
+"""
+
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from functools import wraps
+from importlib import import_module
+from typing import Callable
+
+from .utils import texts
+
+ENV_VAR = 'TRACKER_PROFILE'
+# called for every row, timers would cost more than the calls themselves
+SKIPPED = {
+    '_decode_record',
+    '_record_to_csv_dict',
+    '_row_to_record',
+    '_date_ordinal',
+}
+# modules of this package and their functions to time
+FUNCTIONS = [
+    ('commands', 'process_args'),
+    ('commands', 'process_period'),
+    ('importer', 'read_rows'),
+]
+
+
+@dataclass
+class Timing:
+    """Collected numbers of a timed function."""
+
+    calls: int = 0
+    total: float = 0.0
+    own: float = 0.0
+    items: int = 0
+
+
+def read_bytes() -> int | None:
+    """Get the number of bytes read by the process, None if it's unknown."""
+    try:
+        with open('/proc/self/io', encoding='ascii') as file:
+            for line in file:
+                if line.startswith('rchar:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class Profile:
+    """Timers of one command, use it as a context manager.
+
+    Attributes:
+        name: The name of the profiled command.
+        output: The path to write results to, if any.
+        timings: Timings by the names of timed functions.
+        elapsed: The time of the whole command.
+        bytes_read: The number of bytes read during the command, if known.
+    """
+
+    def __init__(self, name: str, output: str | None = None) -> None:
+        self.name = name
+        self.output = output
+        self.timings: dict[str, Timing] = {}
+        self.elapsed = 0.0
+        self.bytes_read: int | None = None
+        self._children: list[float] = []
+        self._patched: list[tuple[object, str, object]] = []
+        self._cprofile = None
+
+    def __enter__(self) -> 'Profile':
+        if self.output and not self.output.endswith('.json'):
+            import cProfile
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        for module, name in FUNCTIONS:
+            self._patch(import_module(f'.{module}', __package__), name, name)
+        self._bytes_start = read_bytes()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self._start
+        bytes_end = read_bytes()
+        if self._bytes_start is not None and bytes_end is not None:
+            self.bytes_read = bytes_end - self._bytes_start
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        for owner, name, old in reversed(self._patched):
+            if old is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, old)
+        self._patched = []
+
+        self.print_summary()
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(self.output)
+        elif self.output:
+            with open(self.output, 'w', encoding='utf-8') as file:
+                json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+
+    def instrument(self, tracker: object) -> None:
+        """Time methods of a tracker class until the end of the profile."""
+        cls = type(tracker)
+        for name, _ in inspect.getmembers(cls, inspect.isfunction):
+            if name.startswith('__') or name in SKIPPED:
+                continue
+            if isinstance(
+                inspect.getattr_static(cls, name), (staticmethod, classmethod)
+            ):
+                continue
+            self._patch(cls, name, f'{cls.__name__}.{name}')
+
+    def _patch(self, owner: object, name: str, label: str) -> None:
+        self._patched.append((owner, name, vars(owner).get(name)))
+        setattr(owner, name, self.timed(label, getattr(owner, name)))
+
+    def timed(self, label: str, func: Callable) -> Callable:
+        """Wrap a function to collect its timing under a label."""
+        timing = self.timings.setdefault(label, Timing())
+
+        if inspect.isgeneratorfunction(func):
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                timing.calls += 1
+                iterator = func(*args, **kwargs)
+                try:
+                    while True:
+                        start = self._start_call()
+                        try:
+                            item = next(iterator)
+                        except StopIteration:
+                            return
+                        finally:
+                            self._stop_call(timing, start)
+                        timing.items += 1
+                        yield item
+                finally:
+                    iterator.close()
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                timing.calls += 1
+                start = self._start_call()
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    self._stop_call(timing, start)
+                if isinstance(result, list):
+                    timing.items += len(result)
+                return result
+
+        return wrapper
+
+    def _start_call(self) -> float:
+        self._children.append(0.0)
+        return time.perf_counter()
+
+    def _stop_call(self, timing: Timing, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        timing.total += elapsed
+        timing.own += elapsed - self._children.pop()
+        if self._children:
+            self._children[-1] += elapsed
+
+    def to_dict(self) -> dict:
+        """Get the results as a JSON-compatible dict."""
+        return {
+            'command': self.name,
+            'elapsed': self.elapsed,
+            'bytes_read': self.bytes_read,
+            'timings': {
+                label: asdict(timing)
+                for label, timing in self.timings.items()
+                if timing.calls
+            },
+        }
+
+    def print_summary(self) -> None:
+        """Print timings sorted by own time to stderr."""
+        if self.bytes_read is None:
+            read = '?'
+        else:
+            read = f'{self.bytes_read / 2**20:.1f}'
+        print(
+            texts.profile_total.format(self.name, self.elapsed, read),
+            file=sys.stderr,
+        )
+        print(
+            '{:<32} {:>8} {:>10} {:>10} {:>10}'.format(*texts.profile_header),
+            file=sys.stderr,
+        )
+        timings = sorted(
+            (item for item in self.timings.items() if item[1].calls),
+            key=lambda item: item[1].own,
+            reverse=True,
+        )
+        for label, timing in timings:
+            print(
+                f'{label:<32} {timing.calls:>8} {timing.total:>10.4f} '
+                f'{timing.own:>10.4f} {timing.items:>10}',
+                file=sys.stderr,
+            )
+
+
+def from_args(args: argparse.Namespace) -> Profile | None:
+    """Create a profile if profiling is on.
+
+    Args:
+        args: The namespace returned by core.argparser.parse_args.
+
+    Returns:
+        A profile for the command or None if profiling is off.
+    """
+    output = args.profile_out
+    value = os.environ.get(ENV_VAR, '')
+    if not (args.profile or output or value not in ('', '0')):
+        return None
+    if output is None and value not in ('', '0', '1'):
+        output = value
+    return Profile(args.command, output)
@@ -0,0 +1,56 @@
+"""Search query with the filters supported by all trackers."""
+
+from dataclasses import dataclass
+from functools import cached_property
+
+from .record import Record
+from .textindex import has_words, normalize, words
+
+
+@dataclass
+class Query:
+    """Filters of a search, a record matches if it passes all of them.
+
+    Attributes:
+        category: The category to filter by.
+        date: The date to filter by.
+        amount: The amount to filter by.
+        desc: The description to filter by, a case-insensitive substring.
+        date_from: The first date of a period to filter by.
+        date_to: The last date of a period to filter by, inclusive.
+        by_words: Match the description by words: every word of desc must
+            be the beginning of some word of the record description.
+    """
+
+    category: str | None = None
+    date: str | None = None
+    amount: int | None = None
+    desc: str | None = None
+    date_from: str | None = None
+    date_to: str | None = None
+    by_words: bool = False
+
+    @cached_property
+    def _desc_query(self) -> str | list[str] | None:
+        if not self.desc:
+            return None
+        return words(self.desc) if self.by_words else normalize(self.desc)
+
+    def matches(self, rec: Record) -> bool:
+        """Check if a record passes all filters of the query."""
+        desc_query = self._desc_query
+        return (
+            (self.category is None or rec.category == self.category)
+            and (self.date is None or rec.date == self.date)
+            and (self.date_from is None or rec.date >= self.date_from)
+            and (self.date_to is None or rec.date <= self.date_to)
+            and (self.amount is None or rec.amount == self.amount)
+            and (
+                desc_query is None
+                or (
+                    has_words(desc_query, rec.desc)
+                    if self.by_words
+                    else desc_query in normalize(rec.desc)
+                )
+            )
+        )
@@ -0,0 +1,26 @@
+"""Record class to represent and validate individual records."""
+
+from dataclasses import dataclass, fields
+
+
+@dataclass(slots=True)
+class Record:
+    """Data class that represents a user's record of a transaction to track.
+
+    Attributes:
+        date: A date of a transaction in format YYYY-MM-DD.
+        category: Type of a transaction (Expense/Income).
+        amount: Monetary amount of a transaction, whole number.
+        description: An optional description of a transaction.
+    """
+
+    date: str
+    category: str
+    amount: int
+    desc: str = ''
+
+    def update(self, **kwargs):
+        for field in fields(self):
+            if field.name in kwargs:
+                setattr(self, field.name, kwargs[field.name])
+        return self
@@ -0,0 +1,155 @@
+"""Reports with totals of records grouped by periods and descriptions.
+
+All groupings and the largest expenses are computed by one pass over the
+records, so any report can be taken from the same result.
+"""
+
+import datetime
+import heapq
+import json
+from functools import lru_cache
+from typing import Iterable
+
+from .record import Record
+from .sidecar import FileStamp, atomic_write
+from .textindex import words
+from .utils import EXPENSE, GROUPINGS, INCOME
+
+UNKNOWN = '?'
+
+
+@lru_cache(maxsize=4096)
+def week_of(date: str) -> str:
+    """Get an ISO week of a date in format YYYY-Www."""
+    try:
+        year, week, _ = datetime.date.fromisoformat(date).isocalendar()
+    except ValueError:
+        return UNKNOWN
+    return f'{year}-W{week:02}'
+
+
+def group_keys(record: Record) -> dict[str, str]:
+    """Get keys of groups a record belongs to, by each grouping.
+
+    A description is grouped by its first word.
+    """
+    desc_words = words(record.desc)
+    return {
+        'month': record.date[:7],
+        'week': week_of(record.date),
+        'year': record.date[:4],
+        'desc': desc_words[0] if desc_words else UNKNOWN,
+    }
+
+
+class Aggregator:
+    """Totals of records for all groupings, collected in a single pass.
+
+    Attributes:
+        groups: Totals by grouping and key: incomes, expenses, count.
+        top: The number of the largest expenses to keep.
+    """
+
+    def __init__(self, top: int = 0) -> None:
+        self.groups: dict[str, dict[str, list[int]]] = {
+            grouping: {} for grouping in GROUPINGS
+        }
+        self.top = top
+        self._expenses: list[tuple[int, int, Record]] = []
+
+    def add(self, record_id: int, record: Record) -> None:
+        """Count a record in its groups."""
+        is_income = record.category == INCOME
+        is_expense = record.category == EXPENSE
+        for grouping, key in group_keys(record).items():
+            totals = self.groups[grouping].get(key)
+            if totals is None:
+                totals = self.groups[grouping][key] = [0, 0, 0]
+            if is_income:
+                totals[0] += record.amount
+            elif is_expense:
+                totals[1] += record.amount
+            totals[2] += 1
+
+        if is_expense and self.top:
+            self._push_expense((record.amount, -record_id, record))
+
+    def _push_expense(self, item: tuple[int, int, Record]) -> None:
+        """Keep an expense if it's among the largest ones."""
+        if len(self._expenses) < self.top:
+            heapq.heappush(self._expenses, item)
+        elif item[:2] > self._expenses[0][:2]:
+            heapq.heapreplace(self._expenses, item)
+
+    def merge(self, other: 'Aggregator') -> None:
+        """Add totals collected by another aggregator."""
+        for grouping, keys in other.groups.items():
+            groups = self.groups[grouping]
+            for key, totals in keys.items():
+                if key in groups:
+                    groups[key] = [a + b for a, b in zip(groups[key], totals)]
+                else:
+                    groups[key] = totals
+        for item in other._expenses:
+            self._push_expense(item)
+
+    def result(self) -> dict:
+        """Get the collected totals as JSON-compatible data.
+
+        Returns:
+            A dictionary with 'groups': rows of [key, incomes, expenses,
+            count] sorted by key for each grouping, and 'top': the largest
+            expenses as [id, date, amount, desc], the largest first.
+        """
+        groups = {
+            grouping: [[key, *totals] for key, totals in sorted(keys.items())]
+            for grouping, keys in self.groups.items()
+        }
+        top = [
+            [-neg_id, rec.date, rec.amount, rec.desc]
+            for _, neg_id, rec in sorted(self._expenses, reverse=True)
+        ]
+        return {'groups': groups, 'top': top}
+
+
+def aggregate(rows: Iterable[tuple[int, Record]], top: int = 0) -> dict:
+    """Collect totals of records, see Aggregator.result.
+
+    Args:
+        rows: Pairs of a record ID and a record.
+        top: The number of the largest expenses to keep.
+    """
+    aggregator = Aggregator(top)
+    for record_id, record in rows:
+        aggregator.add(record_id, record)
+    return aggregator.result()
+
+
+def load_report(path: str, stamp: FileStamp, top: int) -> dict | None:
+    """Load saved report totals if they were collected from the same file.
+
+    Args:
+        path: The path to the saved totals.
+        stamp: The stamp of the tracker file.
+        top: The number of the largest expenses needed.
+
+    Returns:
+        Totals like Aggregator.result, or None if they are missing, out of
+        date or keep fewer of the largest expenses.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            saved = json.load(file)
+        if FileStamp(*saved['stamp']) != stamp or saved['top'] < top:
+            return None
+        data = saved['data']
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    data['top'] = data['top'][:top]
+    return data
+
+
+def save_report(path: str, stamp: FileStamp, top: int, data: dict) -> None:
+    """Save report totals collected from a file with the given stamp."""
+    saved = {'stamp': list(stamp), 'top': top, 'data': data}
+    atomic_write(path, json.dumps(saved, ensure_ascii=False).encode())
@@ -0,0 +1,82 @@
+"""Helpers for auxiliary files that are kept next to the tracker file.
+
+Sidecar files (snapshots, indexes) are derived from the CSV file and are
+only trusted while the CSV file is unchanged, which is checked with a stamp.
+"""
+
+import contextlib
+import os
+import zlib
+from typing import BinaryIO, NamedTuple
+
+TAIL_CHECK_SIZE = 64
+
+
+class FileStamp(NamedTuple):
+    """Identity of a file state: size, modification time and inode."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def of(cls, path: str) -> 'FileStamp':
+        """Take a stamp of an existing file.
+
+        Args:
+            path: The path to the file.
+        """
+        stat = os.stat(path)
+        return cls(stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def sidecar_path(file: str, suffix: str) -> str:
+    """Build a path of a sidecar file, e.g. data.csv -> data.csv.snapshot."""
+    return f'{file}.{suffix}'
+
+
+def tail_crc(file: BinaryIO, end: int) -> int:
+    """Calculate a checksum of the last bytes before an offset.
+
+    It's stored along with a sidecar to check later that the part of the
+    file it was built from is still the same and only new rows were added.
+
+    Args:
+        file: The file opened in binary mode.
+        end: The offset to take the bytes before.
+    """
+    start = max(0, end - TAIL_CHECK_SIZE)
+    file.seek(start)
+    return zlib.crc32(file.read(end - start))
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write data to a temporary file and move it over the target path.
+
+    The temporary file name is unique per process, as sidecars may be saved
+    by several readers at once.
+
+    Args:
+        path: The path to the file to write.
+        data: The full content of the file.
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def fsync_dir(path: str) -> None:
+    """Flush the directory entry of a replaced file to the disk."""
+    if os.name != 'posix':
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,98 @@
+"""Running-balance snapshot of the tracker file.
+
+The snapshot keeps the totals of all rows and the byte offset they were
+counted up to, so the balance can be shown without reading the whole file.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from typing import BinaryIO
+
+from .sidecar import FileStamp, atomic_write, tail_crc
+from .utils import EXPENSE, INCOME
+
+
+@dataclass
+class Snapshot:
+    """Aggregated state of the tracker file.
+
+    Attributes:
+        incomes: Sum of all income amounts.
+        expenses: Sum of all expense amounts.
+        rows: Number of records in the file.
+        offset: Byte offset up to which the rows are counted.
+        size: File size at the moment of the last sync.
+        mtime_ns: File modification time at the moment of the last sync.
+        inode: File inode at the moment of the last sync.
+        tail_crc: Checksum of the bytes right before the offset, used to
+            make sure the counted part of the file was not changed.
+    """
+
+    incomes: int = 0
+    expenses: int = 0
+    rows: int = 0
+    offset: int = 0
+    size: int = 0
+    mtime_ns: int = 0
+    inode: int = 0
+    tail_crc: int = 0
+
+    @property
+    def balance(self) -> int:
+        return self.incomes - self.expenses
+
+    def add(self, category: str, amount: int) -> None:
+        """Count a record in the totals."""
+        if category == INCOME:
+            self.incomes += amount
+        elif category == EXPENSE:
+            self.expenses += amount
+
+    def remove(self, category: str, amount: int) -> None:
+        """Exclude a previously counted record from the totals."""
+        self.add(category, -amount)
+
+    def matches(self, stamp: FileStamp) -> bool:
+        """Check if the snapshot describes the file state as is."""
+        return (
+            self.offset == stamp.size
+            and self.size == stamp.size
+            and self.mtime_ns == stamp.mtime_ns
+            and self.inode == stamp.inode
+        )
+
+    def is_prefix_of(self, file: BinaryIO, stamp: FileStamp) -> bool:
+        """Check if the file only got new rows appended since the last sync.
+
+        Args:
+            file: The tracker file opened in binary mode.
+            stamp: The current stamp of the file.
+        """
+        if self.inode != stamp.inode or self.offset >= stamp.size:
+            return False
+        return tail_crc(file, self.offset) == self.tail_crc
+
+    def sync(self, stamp: FileStamp, crc: int) -> None:
+        """Mark the whole file up to its current size as counted.
+
+        Args:
+            stamp: The current stamp of the file.
+            crc: The checksum of the file end, see sidecar.tail_crc.
+        """
+        self.offset = stamp.size
+        self.size = stamp.size
+        self.mtime_ns = stamp.mtime_ns
+        self.inode = stamp.inode
+        self.tail_crc = crc
+
+    @classmethod
+    def load(cls, path: str) -> 'Snapshot | None':
+        """Read a snapshot file, return None if it's missing or broken."""
+        try:
+            with open(path, encoding='utf-8') as file:
+                return cls(**json.load(file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, path: str) -> None:
+        atomic_write(path, json.dumps(asdict(self)).encode())
@@ -0,0 +1,178 @@
+"""Tracker that keeps records in an SQLite database.
+
+The database is opened in WAL mode and has indexes on date, category and
+amount, so searches and the balance are done by SQLite instead of Python
+loops, and edits are transactional. Record IDs are the row IDs, which match
+the order of adding as records are never deleted.
+
+Example:
+    tracker = SQLiteTracker("data.db")
+    tracker.import_from(Tracker("data.csv"))
+"""
+
+import sqlite3
+from typing import Iterator
+
+from .base import BaseTracker
+from .planner import SQL, Plan
+from .query import Query
+from .record import Record
+from .textindex import normalize
+from .utils import EXPENSE, INCOME
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    category TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    description TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS records_date ON records (date);
+CREATE INDEX IF NOT EXISTS records_category ON records (category);
+CREATE INDEX IF NOT EXISTS records_amount ON records (amount);
+'''
+COLUMNS = 'date, category, amount, description'
+
+
+class SQLiteTracker(BaseTracker):
+    """Class that manages financial records in an SQLite database.
+
+    Attributes:
+        file: The path to the database file.
+        connection: The connection to the database.
+    """
+
+    def __init__(self, file: str) -> None:
+        """Open or create a database with records.
+
+        Args:
+            file: The path to the database file.
+        """
+        self.file = file
+        self.connection = sqlite3.connect(file)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.create_function(
+            'normalize', 1, normalize, deterministic=True
+        )
+        self.connection.executescript(SCHEMA)
+
+    def iter_records(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Record]:
+        """Read records one by one.
+
+        Args:
+            start: 0-based index of the first record to read.
+            stop: 0-based index of the record to stop before, None for all.
+        """
+        sql = f'SELECT {COLUMNS} FROM records WHERE id > ?'
+        params = [start]
+        if stop is not None:
+            sql += ' AND id <= ?'
+            params.append(stop)
+        for row in self.connection.execute(sql + ' ORDER BY id', params):
+            yield Record(*row)
+
+    def count(self) -> int:
+        sql = 'SELECT COALESCE(MAX(id), 0) FROM records'
+        return self.connection.execute(sql).fetchone()[0]
+
+    def totals(self) -> tuple[int, int]:
+        sql = (
+            'SELECT COALESCE(SUM(CASE WHEN category = ? THEN amount END), 0),'
+            ' COALESCE(SUM(CASE WHEN category = ? THEN amount END), 0)'
+            ' FROM records'
+        )
+        return self.connection.execute(sql, (INCOME, EXPENSE)).fetchone()
+
+    def find(
+        self,
+        query: Query,
+        plan: Plan | None = None,
+    ) -> Iterator[tuple[int, Record]]:
+        """Find records matching a query.
+
+        Filters are turned into SQL conditions. Found records are checked
+        with the query once more, because words are matched in Python.
+        SQLite chooses the index itself, its plan is put into the details
+        of the given plan.
+        """
+        conditions = []
+        params = []
+        for column, op, value in [
+            ('category', '=', query.category),
+            ('date', '=', query.date),
+            ('date', '>=', query.date_from),
+            ('date', '<=', query.date_to),
+            ('amount', '=', query.amount),
+        ]:
+            if value is not None:
+                conditions.append(f'{column} {op} ?')
+                params.append(value)
+        if query.desc and not query.by_words:
+            conditions.append('instr(normalize(description), ?) > 0')
+            params.append(normalize(query.desc))
+
+        sql = f'SELECT id, {COLUMNS} FROM records'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY id'
+        if plan is None:
+            plan = Plan()
+        else:
+            plan.total = self.count()
+            plan.access = SQL
+            plan.details = [
+                row[-1]
+                for row in self.connection.execute(
+                    f'EXPLAIN QUERY PLAN {sql}', params
+                )
+            ]
+        rows = self.connection.execute(sql, params)
+        yield from plan.filter(
+            query,
+            ((record_id, Record(*fields)) for record_id, *fields in rows),
+        )
+
+    def compact(self) -> None:
+        self.connection.execute('VACUUM')
+
+    def _tail_records(self, n: int) -> list[Record]:
+        sql = f'SELECT {COLUMNS} FROM records ORDER BY id DESC LIMIT ?'
+        rows = self.connection.execute(sql, (n,)).fetchall()
+        return [Record(*row) for row in reversed(rows)]
+
+    def _append(self, records: list[Record]) -> None:
+        sql = f'INSERT INTO records ({COLUMNS}) VALUES (?, ?, ?, ?)'
+        with self.connection:
+            self.connection.executemany(
+                sql,
+                (
+                    (rec.date, rec.category, rec.amount, rec.desc)
+                    for rec in records
+                ),
+            )
+
+    def _edit(self, record_id: int, edit_data: dict) -> bool:
+        with self.connection:
+            row = self.connection.execute(
+                f'SELECT {COLUMNS} FROM records WHERE id = ?', (record_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            record = Record(*row).update(**edit_data)
+            self.connection.execute(
+                'UPDATE records SET date = ?, category = ?, amount = ?,'
+                ' description = ? WHERE id = ?',
+                (
+                    record.date,
+                    record.category,
+                    record.amount,
+                    record.desc,
+                    record_id,
+                ),
+            )
+        return True
@@ -0,0 +1,78 @@
+"""Reader of the last rows of a CSV file that reads it backwards by chunks.
+
+A newline ends a row only if it is outside of a quoted field. Since the file
+ends outside of quotes, a newline is a row boundary if the number of quote
+characters after it is even, so the check doesn't need the file beginning.
+Both newline and quote are single bytes that never occur inside multi-byte
+UTF-8 sequences, so chunks are split and searched as raw bytes and only
+complete rows are decoded. Blank lines outside of quotes are not counted as
+rows, like in the CSV reader.
+"""
+
+import os
+from typing import BinaryIO
+
+CHUNK_SIZE = 64 * 1024
+
+
+def read_tail(
+    file: BinaryIO,
+    n: int,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[int, bytes]:
+    """Find the last n rows of a CSV file with a header.
+
+    Args:
+        file: The CSV file opened in binary mode.
+        n: Number of rows to read.
+        chunk_size: Number of bytes to read at once.
+
+    Returns:
+        The byte offset where the rows start and the bytes of these rows.
+        If the file has less than n rows, all rows after the header are
+        returned.
+    """
+    end = file.seek(0, os.SEEK_END)
+    pos = end
+    chunks: list[tuple[int, bytes]] = []  # offsets and chunks, from the end
+    quotes = 0
+    found = 0
+    start = end
+    boundary = end  # the start of the row after the last found boundary
+
+    while found < n and pos > 0:
+        size = min(chunk_size, pos)
+        pos -= size
+        file.seek(pos)
+        chunk = file.read(size)
+        chunks.append((pos, chunk))
+        scan = size  # chunk[scan:] is already checked for row boundaries
+
+        while found < n:
+            i = chunk.rfind(b'\n', 0, scan)
+            if i < 0:
+                quotes += chunk.count(b'"', 0, scan)
+                break
+            quotes += chunk.count(b'"', i + 1, scan)
+            scan = i
+            if pos + i + 1 == end or quotes % 2:
+                continue
+            blank = _is_blank(chunks, pos + i + 1, boundary)
+            boundary = pos + i + 1
+            if blank:
+                continue  # blank lines are skipped by the CSV reader
+            found += 1
+            start = boundary
+
+    data = b''.join(chunk for _, chunk in reversed(chunks))
+    return start, data[start - pos :]
+
+
+def _is_blank(chunks: list[tuple[int, bytes]], start: int, stop: int) -> bool:
+    """Check if the bytes between two offsets are only line breaks."""
+    for pos, chunk in reversed(chunks):
+        if pos >= stop:
+            break
+        if chunk[max(start - pos, 0) : stop - pos].strip(b'\r\n'):
+            return False
+    return True
@@ -0,0 +1,190 @@
+"""Inverted index of record descriptions.
+
+Descriptions are normalized (case folded, ё as е) and indexed by words and
+by trigrams, each pointing to the rows that contain them. A substring query
+takes the rows having all of its trigrams, a word query takes the rows
+having words starting with each query word. Only these candidates have to
+be checked against the query.
+
+Rows are kept in arrays of 4-byte integers. The index is stored as a header
+with the file stamp, the words and the trigrams with their row counts as
+JSON and then the row arrays in the same order, like core.fieldindex.
+"""
+
+import json
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from .sidecar import FileStamp, atomic_write
+
+WORD_RE = re.compile(r'\w+')
+GRAM_SIZE = 3
+HEADER = struct.Struct('<QqQQ')  # size, mtime_ns, inode, size of keys
+
+
+def normalize(text: str) -> str:
+    """Prepare a text for case-insensitive comparison."""
+    return text.casefold().replace('ё', 'е')
+
+
+def words(text: str) -> list[str]:
+    """Split a text into normalized words."""
+    return WORD_RE.findall(normalize(text))
+
+
+def grams(text: str) -> set[str]:
+    """Get all trigrams of a normalized text."""
+    count = len(text) - GRAM_SIZE + 1
+    return {text[i : i + GRAM_SIZE] for i in range(count)}
+
+
+def has_words(query: list[str], desc: str) -> bool:
+    """Check if every query word is the beginning of a description word."""
+    desc_words = words(desc)
+    return all(
+        any(word.startswith(prefix) for word in desc_words)
+        for prefix in query
+    )
+
+
+class TextIndex:
+    """Rows of descriptions by their words and trigrams.
+
+    Attributes:
+        words: Rows by words, each array is sorted.
+        grams: Rows by trigrams, each array is sorted.
+        stamp: The file stamp the index was synced with.
+    """
+
+    def __init__(
+        self,
+        words: dict[str, array] | None = None,
+        grams: dict[str, array] | None = None,
+        stamp: FileStamp = FileStamp(0, 0, 0),
+    ) -> None:
+        self.words = words or {}
+        self.grams = grams or {}
+        self.stamp = stamp
+        self._vocabulary: list[str] | None = None
+
+    @classmethod
+    def build(cls, descs: Iterable[tuple[int, str]]) -> 'TextIndex':
+        """Create an index from pairs of a row index and a description."""
+        index = cls()
+        for row, desc in descs:
+            index.add(row, desc)
+        return index
+
+    def _postings(self, desc: str) -> list[tuple[set[str], dict]]:
+        """Pair the words and the trigrams of a description with postings."""
+        return [
+            (set(words(desc)), self.words),
+            (grams(normalize(desc)), self.grams),
+        ]
+
+    def add(self, row: int, desc: str) -> None:
+        """Index a description of a row.
+
+        Rows are expected to be added in ascending order, except for edits.
+        """
+        for keys, postings in self._postings(desc):
+            for key in keys:
+                rows = postings.get(key)
+                if rows is None:
+                    postings[key] = array('I', [row])
+                elif rows[-1] > row:
+                    rows.insert(bisect_left(rows, row), row)
+                else:
+                    rows.append(row)
+        self._vocabulary = None
+
+    def remove(self, row: int, desc: str) -> None:
+        """Delete a row that was indexed with the given description."""
+        for keys, postings in self._postings(desc):
+            for key in keys:
+                rows = postings[key]
+                rows.remove(row)
+                if not rows:
+                    del postings[key]
+        self._vocabulary = None
+
+    def find_substring(self, query: str) -> set[int] | None:
+        """Find candidate rows that may contain the query as a substring.
+
+        Returns:
+            Row indexes, or None if the query is too short to use the index.
+        """
+        query_grams = grams(normalize(query))
+        if not query_grams:
+            return None
+        return self._intersect(self.grams.get(g, []) for g in query_grams)
+
+    def find_words(self, query: str) -> set[int] | None:
+        """Find rows with words starting with each word of the query.
+
+        Returns:
+            Row indexes, or None if the query has no words.
+        """
+        prefixes = words(query)
+        if not prefixes:
+            return None
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.words)
+        found = []
+        for prefix in prefixes:
+            rows = set()
+            i = bisect_left(self._vocabulary, prefix)
+            while i < len(self._vocabulary):
+                word = self._vocabulary[i]
+                if not word.startswith(prefix):
+                    break
+                rows.update(self.words[word])
+                i += 1
+            found.append(rows)
+        return self._intersect(found)
+
+    def _intersect(self, postings: Iterable[Iterable[int]]) -> set[int]:
+        """Intersect posting lists starting with the shortest one."""
+        postings = sorted(postings, key=len)
+        if not postings:
+            return set()
+        rows = set(postings[0])
+        for other in postings[1:]:
+            if not rows:
+                break
+            rows.intersection_update(other)
+        return rows
+
+    @classmethod
+    def load(cls, path: str) -> 'TextIndex | None':
+        """Read an index file, return None if it's missing or broken."""
+        try:
+            with open(path, 'rb') as file:
+                *stamp, size = HEADER.unpack(file.read(HEADER.size))
+                counts = json.loads(file.read(size))
+                postings = []
+                for keys in counts:
+                    postings.append({})
+                    for key, count in keys:
+                        rows = array('I')
+                        rows.fromfile(file, count)
+                        postings[-1][key] = rows
+            words, grams = postings
+        except (OSError, EOFError, ValueError, TypeError, struct.error):
+            return None
+        return cls(words, grams, FileStamp(*stamp))
+
+    def save(self, path: str) -> None:
+        postings = (self.words, self.grams)
+        counts = [
+            [[key, len(rows)] for key, rows in items.items()]
+            for items in postings
+        ]
+        data = json.dumps(counts, ensure_ascii=False).encode()
+        parts = [HEADER.pack(*self.stamp, len(data)), data]
+        for items in postings:
+            parts.extend(rows.tobytes() for rows in items.values())
+        atomic_write(path, b''.join(parts))
@@ -1,5 +1,5 @@
 """This module provides the Tracker class to manage financial transactions
-and the Record class to represent and validate individual records.
+stored as Record objects (see core.record) in a CSV file.
 
 Example:
     tracker = Tracker("data.csv")
@@ -8,39 +8,94 @@ Example:
 """
 
 import csv
-from dataclasses import dataclass, fields
+import datetime
+import io
+import os
+import struct
+import time
+from contextlib import closing, suppress
+from copy import copy
+from dataclasses import asdict
+from itertools import islice
+from typing import BinaryIO, Callable, ContextManager, Iterable, Iterator
 
+from .base import BaseTracker
+from .cache import RecordCache, Row
+from .binary import (
+    BinaryLedger,
+    append_rows,
+    build_ledger,
+    read_header,
+    replace_rows,
+)
+from .columnar import ColumnarLedger
+from .layout import RowLayout
+from .dateindex import DateIndex
+from .fieldindex import FieldIndex
+from .indexlog import Change, append_changes, log_path, read_log, start_log
+from .journal import Journal
+from .offsets import OffsetIndex, append_offsets
+from .parallel import (
+    PARALLEL_MIN_SIZE,
+    Consumer,
+    Matches,
+    Totals,
+    default_workers,
+    parallel_scan,
+)
+from .locking import FileLock
+from .planner import INDEX, SCAN, Estimate, Plan
+from .query import Query
+from .record import Record
+from .reports import Aggregator, load_report, save_report
+from .sidecar import FileStamp, fsync_dir, sidecar_path, tail_crc
+from .snapshot import Snapshot
+from .tail import read_tail
+from .textindex import TextIndex
+from .utils import to_ordinal
 
-@dataclass
-class Record:
-    """Data class that represents a user's record of a transaction to track.
+MAX_ORDINAL = datetime.date.max.toordinal()
+COPY_SIZE = 1 << 20  # bytes copied at once when the file is rewritten
 
-    Attributes:
-        date: A date of a transaction in format YYYY-MM-DD.
-        category: Type of a transaction (Expense/Income).
-        amount: Monetary amount of a transaction, whole number.
-        description: An optional description of a transaction.
-    """
-
-    date: str
-    category: str
-    amount: int
-    desc: str = ''
-
-    def update(self, **kwargs):
-        for field in fields(self):
-            if field.name in kwargs:
-                setattr(self, field.name, kwargs[field.name])
-        return self
 
-
-class Tracker:
-    """Class that manages financial records.
+class Tracker(BaseTracker):
+    """Class that manages financial records in a CSV file.
 
     Attributes:
         file: The path to the CSV file with records.
+        snapshot_file: The path to the running-balance snapshot.
+        offsets_file: The path to the index of row byte offsets.
+        dates_file: The path to the sorted index of record dates.
+        text_file: The path to the inverted index of descriptions.
+        fields_file: The path to the hash index of amounts, categories and
+            dates.
+        reports_file: The path to the saved report totals.
+        binary_file: The path to the binary copy of records, see
+            core.binary.
+        descs_file: The path to the descriptions of the binary copy.
+        journal_file: The path to the journal of edits, see core.journal.
+        parallel_min_size: Files of this size and larger are scanned by
+            several processes, see core.parallel.
+        workers: The number of processes for scans, None for one per core.
+        cache_max_size: Records of files up to this size are kept parsed
+            in memory if keep_records is set, so the following reads don't
+            parse the file again.
+        journal_max_size: Edits are written into the file by compaction
+            once the journal grows to this size.
+        index_log_max_size: Secondary indexes are saved whole once the log
+            of their changes grows to this size, see core.indexlog.
+
+    Reads hold a shared lock on the lock file next to the CSV file and
+    writes hold an exclusive one, so trackers in several processes can
+    work with the same file.
     """
 
+    parallel_min_size = PARALLEL_MIN_SIZE
+    workers: int | None = None
+    cache_max_size = 16 * 1024 * 1024
+    journal_max_size = 1024 * 1024
+    index_log_max_size = 256 * 1024
+
     def __init__(self, file: str) -> None:
         """Initiate a tracker and specify a file which stores records.
 
@@ -48,6 +103,20 @@ class Tracker:
             file: The path to the CSV file.
         """
         self.file = file
+        self.snapshot_file = sidecar_path(file, 'snapshot')
+        self.offsets_file = sidecar_path(file, 'offsets')
+        self.dates_file = sidecar_path(file, 'dates')
+        self.text_file = sidecar_path(file, 'text')
+        self.fields_file = sidecar_path(file, 'fields')
+        self.reports_file = sidecar_path(file, 'reports')
+        self.binary_file = sidecar_path(file, 'bin')
+        self.descs_file = sidecar_path(file, 'descs')
+        self.journal_file = sidecar_path(file, 'journal')
+        self._loaded: dict[str, tuple[FileStamp, object]] = {}
+        # index objects of _loaded, their base stamps and positions in logs
+        self._replayed: dict[str, tuple[object, FileStamp, int]] = {}
+        self._cache: RecordCache | None = None
+        self._lock = FileLock(sidecar_path(file, 'lock'))
         self.fieldnames = ['Дата', 'Категория', 'Сумма', 'Описание']
         self.field_map = {
             'date': 'Дата',
@@ -55,13 +124,54 @@ class Tracker:
             'amount': 'Сумма',
             'desc': 'Описание',
         }
-        self._init_file()
+        self._initialized = False
+
+    def __getstate__(self) -> dict:
+        """Pickle the tracker for worker processes without its lock."""
+        state = self.__dict__.copy()
+        del state['_loaded'], state['_replayed']
+        del state['_cache'], state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._loaded = {}
+        self._replayed = {}
+        self._cache = None
+        self._lock = FileLock(sidecar_path(self.file, 'lock'))
 
     def _init_file(self):
+        """Create the file with a header on the first access if it's missing.
+
+        It's not done in __init__, so opening a tracker costs nothing until
+        a command reads or writes records.
+        """
+        if self._initialized:
+            return
         with open(self.file, 'a', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=self.fieldnames)
-            if file.tell() == 0:
-                writer.writeheader()
+            size = file.tell()
+        if not size:
+            with self._lock.exclusive(), open(
+                self.file, 'a', encoding='utf-8', newline=''
+            ) as file:
+                if file.tell() == 0:
+                    csv.writer(file).writerow(self.fieldnames)
+        self._initialized = True
+
+    def _row_layout(self, file: BinaryIO) -> RowLayout | None:
+        """Resolve positions of record fields from the header of the file.
+
+        Args:
+            file: The tracker file opened in binary mode.
+
+        Returns:
+            The layout, or None if some fields are missing in the header,
+            then rows are read and written as dicts with the default field
+            names.
+        """
+        file.seek(0)
+        header = next(csv.reader([file.readline().decode('utf-8')]), [])
+        return RowLayout.resolve(header, self.fieldnames)
 
     def _record_to_csv_dict(self, record: Record) -> dict:
         """Convert a Record object to a CSV dict with required field names.
@@ -74,125 +184,1001 @@ class Tracker:
             for attr, field in self.field_map.items()
         }
 
-    def _load_records(self) -> list[Record]:
-        """Open the tracker file and load all rows as a list of Record objects.
+    def _row_to_record(self, row: dict) -> Record:
+        """Convert a CSV dict row to a Record object."""
+        return Record(
+            date=row['Дата'],
+            category=row['Категория'],
+            amount=int(row['Сумма']),
+            desc=row['Описание'],
+        )
+
+    def _encode_records(
+        self,
+        records: Iterable[Record],
+        layout: RowLayout | None,
+    ) -> list[bytes]:
+        """Convert Record objects to the bytes of CSV rows.
+
+        Args:
+            records: The records to convert.
+            layout: The layout of the file, see _row_layout.
+        """
+        text = io.StringIO(newline='')
+        if layout is None:
+            writer = csv.DictWriter(text, fieldnames=self.fieldnames)
+            to_row = self._record_to_csv_dict
+        else:
+            writer = csv.writer(text)
+            to_row = layout.to_row
+        rows = []
+        for record in records:
+            writer.writerow(to_row(record))
+            rows.append(text.getvalue().encode('utf-8'))
+            text.seek(0)
+            text.truncate()
+        return rows
+
+    def _parse_rows(
+        self,
+        lines: Iterable[str],
+        layout: RowLayout | None,
+    ) -> Iterator[Record]:
+        """Parse CSV rows without the header into Record objects.
+
+        Args:
+            lines: Lines of CSV rows.
+            layout: The layout of the file, see _row_layout.
+        """
+        if layout is None:
+            reader = csv.DictReader(lines, fieldnames=self.fieldnames)
+            return map(self._row_to_record, reader)
+        return (layout.to_record(row) for row in csv.reader(lines) if row)
+
+    def _decode_record(self, data: bytes, layout: RowLayout | None) -> Record:
+        """Convert the bytes of a single CSV row to a Record object."""
+        text = io.StringIO(data.decode('utf-8'), newline='')
+        return next(self._parse_rows(text, layout))
+
+    def iter_records(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[Record]:
+        """Read records from the file one by one.
+
+        Args:
+            start: 0-based index of the first row to read.
+            stop: 0-based index of the row to stop before, None to read all.
+
+        Yields:
+            Rows of the file as Record objects.
+        """
+        if stop is not None and stop <= start:
+            return
+        self._init_file()
+        with self._lock.shared():
+            cached = self._cached_rows()
+            if cached is not None:
+                for row in cached[start:stop]:
+                    yield Record(*row)
+                return
+
+            if not start:
+                with open(self.file, encoding='utf-8', newline='') as file:
+                    header = next(csv.reader(file), [])
+                    layout = RowLayout.resolve(header, self.fieldnames)
+                    if layout is None:
+                        file.seek(0)
+                        reader = csv.DictReader(file)
+                        records = map(self._row_to_record, reader)
+                    else:
+                        records = self._parse_rows(file, layout)
+                    yield from islice(self._apply_journal(records, 0), stop)
+                return
+
+            index = self._offset_index()
+            if start < len(index):
+                count = None if stop is None else stop - start
+                with open(self.file, 'rb') as file:
+                    rows = self._read_rows_from(
+                        file, index.offsets[start], start
+                    )
+                    with closing(rows):
+                        yield from islice(rows, count)
+
+    def load_columnar(self) -> ColumnarLedger:
+        """Load all records into a compact column-oriented ledger.
+
+        Rows with dates not in YYYY-MM-DD format are loaded with the dates
+        as they are, see core.columnar.
 
         Returns:
-            Rows from a file loaded as Record objects.
-        """
-        with open(self.file, encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            return [
-                Record(
-                    date=row['Дата'],
-                    category=row['Категория'],
-                    amount=int(row['Сумма']),
-                    desc=row['Описание'],
-                )
-                for row in reader
-            ]
+            The ledger with all rows of the file, in the same order.
 
-    def show_records(
+        Raises:
+            ValueError: If the file has more than 256 distinct categories.
+        """
+        return ColumnarLedger(self.iter_records())
+
+    def _read_rows_from(
         self,
-        records: list[Record] | None = None,
-        n: int | None = None,
-    ) -> None:
-        """Print existing records from a file.
+        file: BinaryIO,
+        offset: int,
+        first_row: int,
+    ) -> Iterator[Record]:
+        """Read records starting from a byte offset of a row beginning.
+
+        Args:
+            file: The tracker file opened in binary mode.
+            offset: The byte offset to start reading from.
+            first_row: The 0-based index of the row at the offset, to apply
+                the journaled edits.
+        """
+        layout = self._row_layout(file)
+        file.seek(offset)
+        text = io.TextIOWrapper(file, encoding='utf-8', newline='')
+        try:
+            records = self._parse_rows(text, layout)
+            yield from self._apply_journal(records, first_row)
+        finally:
+            text.detach()
+
+    def _journal(self) -> Journal | None:
+        """Load the journal of edits, None if there is none for the file."""
+        journal = self._load_sidecar(Journal, self.journal_file)
+        if journal is None or not journal.belongs_to(
+            self.file, FileStamp.of(self.file)
+        ):
+            return None
+        return journal
+
+    def _apply_journal(
+        self,
+        records: Iterable[Record],
+        first_row: int,
+    ) -> Iterable[Record]:
+        """Apply the journaled edits to records of consecutive rows.
 
         Args:
-            records: Records to show.
-            n: Number of last records to show.
+            records: Records parsed from the file.
+            first_row: The 0-based index of the row of the first record.
         """
-        if not records:
-            records = self._load_records()
-        start = 1
+        journal = self._journal()
+        if not journal:
+            return records
+        return journal.apply(records, first_row)
 
-        if records:
-            if n and n < len(records):
-                start = max(0, len(records) - n + 1)
-                records = records[-n:]
-                print('  ...')
+    def _tail_records(self, n: int) -> list[Record]:
+        """Read the last n records, starting from the end of the file.
 
-            for i, rec in enumerate(records, start=start):
-                print(
-                    f'{i:3}.  {rec.date:12} {rec.category:6} '
-                    f'{rec.amount:8}   {rec.desc}'
+        Args:
+            n: Number of records to read.
+        """
+        self._init_file()
+        with self._lock.shared():
+            cached = self._cached_rows()
+            if cached is not None:
+                return [Record(*row) for row in cached[-n:]]
+            with open(self.file, 'rb') as file:
+                layout = self._row_layout(file)
+                _, data = read_tail(file, n)
+            text = io.StringIO(data.decode('utf-8'), newline='')
+            records = list(self._parse_rows(text, layout))
+            if self._journal():
+                first_row = len(self._offset_index()) - len(records)
+                records = list(self._apply_journal(records, first_row))
+        return records
+
+    def _cached_rows(self) -> list[Row] | None:
+        """Get fields of all records from the in-memory cache.
+
+        The cache is brought up to date first: if the file only grew, just
+        the appended rows are parsed, after other changes all rows are.
+
+        The cache is filled only if the tracker keeps records between
+        commands, a single read of a few rows must not parse the whole file.
+
+        Returns:
+            Fields of records in the order of rows, or None if there is no
+            cache to use or the file is larger than cache_max_size.
+        """
+        if self._cache is None and not self.keep_records:
+            return None
+        stamp = FileStamp.of(self.file)
+        if stamp.size > self.cache_max_size:
+            self._cache = None
+            return None
+        journal = self._journal_stamp()
+        cache = self._cache
+        if cache is not None and cache.stamp == stamp:
+            if cache.journal == journal:
+                return cache.rows
+            cache = None
+
+        with open(self.file, 'rb') as file:
+            if (
+                cache is None
+                or cache.journal != journal
+                or not cache.is_prefix_of(file, stamp)
+            ):
+                cache = RecordCache()
+                file.seek(0)
+                offset = len(file.readline())
+            else:
+                offset = cache.stamp.size
+            records = self._read_rows_from(file, offset, len(cache.rows))
+            cache.extend(list(records))
+            cache.sync(stamp, tail_crc(file, stamp.size), journal)
+        self._cache = cache
+        return cache.rows
+
+    def _journal_stamp(self) -> FileStamp | None:
+        """Take a stamp of the journal file, None if it's missing."""
+        try:
+            return FileStamp.of(self.journal_file)
+        except OSError:
+            return None
+
+    def _snapshot(self) -> Snapshot:
+        """Load the balance snapshot and bring it up to date with the file.
+
+        Only rows appended since the last sync are read. If the counted part
+        of the file was changed outside the tracker, all rows are recounted.
+        """
+        stamp = FileStamp.of(self.file)
+        snapshot = self._load_sidecar(Snapshot, self.snapshot_file)
+        if snapshot is not None and snapshot.matches(stamp):
+            return snapshot
+
+        with open(self.file, 'rb') as file:
+            if snapshot is None or not snapshot.is_prefix_of(file, stamp):
+                file.seek(0)
+                snapshot = Snapshot(offset=len(file.readline()))
+                totals = self._merge_in_parallel(Totals())
+                if totals is not None:
+                    snapshot = Snapshot(
+                        totals.incomes,
+                        totals.expenses,
+                        totals.rows,
+                        offset=stamp.size,
+                    )
+            rows = self._read_rows_from(file, snapshot.offset, snapshot.rows)
+            for record in rows:
+                snapshot.rows += 1
+                snapshot.add(record.category, record.amount)
+        self._save_snapshot(snapshot)
+        return snapshot
+
+    def _save_snapshot(self, snapshot: Snapshot) -> None:
+        """Mark the snapshot as synced with the current file and save it."""
+        stamp = FileStamp.of(self.file)
+        with open(self.file, 'rb') as file:
+            snapshot.sync(stamp, tail_crc(file, stamp.size))
+        self._save_sidecar(snapshot, self.snapshot_file)
+
+    def _offset_index(self) -> OffsetIndex:
+        """Load the row offset index and bring it up to date with the file."""
+        stamp = FileStamp.of(self.file)
+        index = self._load_sidecar(OffsetIndex, self.offsets_file)
+        if index is not None and index.stamp == stamp:
+            return index
+
+        with open(self.file, 'rb') as file:
+            if index is not None and index.is_prefix_of(file, stamp):
+                index.extend(file)
+            else:
+                index = OffsetIndex.build(file)
+            index.sync(file, stamp)
+        self._save_sidecar(index, self.offsets_file)
+        return index
+
+    def _scan_in_parallel(
+        self,
+        consumer: Consumer,
+    ) -> Iterator[Consumer] | None:
+        """Pass all records to copies of a consumer in worker processes.
+
+        Returns:
+            Consumers with consecutive ranges of rows, see core.parallel, or
+            None if the file is smaller than parallel_min_size or only one
+            worker is available.
+        """
+        workers = self.workers or default_workers()
+        if workers < 2 or os.path.getsize(self.file) < self.parallel_min_size:
+            return None
+        return parallel_scan(self, self._offset_index(), consumer, workers)
+
+    def _merge_in_parallel(self, consumer: Consumer) -> Consumer | None:
+        """Scan in parallel and merge the consumers of all ranges.
+
+        The given consumer stays empty: it's copied for workers while the
+        results of the first ranges are merged.
+        """
+        parts = self._scan_in_parallel(consumer)
+        if parts is None:
+            return None
+        merged = next(parts, consumer)
+        for part in parts:
+            merged.merge(part)
+        return merged
+
+    def _binary_ledger(self) -> BinaryLedger:
+        """Map the binary ledger, bring it up to date with the file first.
+
+        Rows appended since the last sync are added in place, after other
+        changes the ledger is rebuilt from the CSV file.
+        """
+        stamp = FileStamp.of(self.file)
+        header = read_header(self.binary_file)
+        if header is None or header.stamp != stamp:
+            with open(self.file, 'rb') as file:
+                synced = header is not None and header.is_prefix_of(
+                    file, stamp
                 )
-        else:
-            print('Записей нет')
-
-    def show_balance(self) -> None:
-        """Print info: current balance, total incomes, total expenses."""
-        records = self._load_records()
-        incomes: int = sum(r.amount for r in records if r.category == 'Доход')
-        expenses: int = sum(r.amount for r in records if r.category == 'Расход')
-        balance: int = incomes - expenses
-        print(
-            f'{"Текущий баланс:":<15} {balance:>10} ₽\n'
-            f'{"Все доходы:":<15} {incomes:>10} ₽\n'
-            f'{"Все расходы:":<15} {expenses:>10} ₽'
+                if synced:
+                    synced = append_rows(
+                        self.binary_file,
+                        self.descs_file,
+                        list(
+                            self._read_rows_from(
+                                file, header.stamp.size, header.rows
+                            )
+                        ),
+                        header.stamp,
+                        stamp,
+                        tail_crc(file, stamp.size),
+                    )
+            if not synced:
+                self._build_binary()
+        try:
+            return BinaryLedger(self.binary_file, self.descs_file)
+        except (OSError, struct.error):
+            self._build_binary()
+            return BinaryLedger(self.binary_file, self.descs_file)
+
+    def _build_binary(self) -> None:
+        """Write the binary ledger from scratch."""
+        stamp = FileStamp.of(self.file)
+        with open(self.file, 'rb') as file:
+            crc = tail_crc(file, stamp.size)
+        build_ledger(
+            self.binary_file, self.descs_file, self.iter_records(), stamp, crc
         )
 
-    def search(
+    def _scan_binary(self, query: Query) -> Iterator[tuple[int, Record]]:
+        """Read records that may match category and amount filters.
+
+        Filters are checked on the binary ledger, only the found rows are
+        turned into records.
+
+        Yields:
+            Pairs of a 1-based row ID and a record.
+        """
+        with self._binary_ledger() as ledger:
+            with closing(ledger.scan(query.category, query.amount)) as rows:
+                for row in rows:
+                    record = ledger.record(row)
+                    if record is None:
+                        yield from self._records_at([row])
+                    else:
+                        yield row + 1, record
+
+    def _load_sidecar(self, cls: type, path: str):
+        """Load a sidecar file, reuse the object kept from the last load.
+
+        Objects are kept in memory together with the stamp of their sidecar
+        file, so a long-living tracker reads a sidecar again only if it was
+        changed by another process.
+
+        Args:
+            cls: The sidecar class with a load method.
+            path: The path to the sidecar file.
+
+        Returns:
+            The loaded object or None if the file is missing or broken.
+        """
+        try:
+            stamp = FileStamp.of(path)
+        except OSError:
+            self._loaded.pop(path, None)
+            return None
+        loaded = self._loaded.get(path)
+        if loaded is not None and loaded[0] == stamp:
+            return loaded[1]
+        item = cls.load(path)
+        if item is not None:
+            self._loaded[path] = stamp, item
+        return item
+
+    def _save_sidecar(self, item, path: str) -> None:
+        """Save a sidecar object and keep it for the next loads."""
+        item.save(path)
+        self._loaded[path] = FileStamp.of(path), item
+
+    def _load_index(
         self,
-        category: str | None = None,
-        date: str | None = None,
-        amount: int | None = None,
-        desc: str | None = None,
+        cls: type,
+        path: str,
+        stamp: FileStamp,
+        change: Callable[..., None],
+    ):
+        """Load a saved index and bring it up to date by the log of changes.
+
+        The index object is kept in memory with the position in the log it
+        was brought to, so a long-living tracker reads only new changes.
+        Once the log grows to index_log_max_size, the whole index is saved
+        and a new log is started, see core.indexlog.
+
+        Args:
+            cls: The index class with a load method and a stamp attribute.
+            path: The path to the index file.
+            stamp: The current stamp of the tracker file.
+            change: A function that applies a change of a row to the index.
+
+        Returns:
+            The index or None if it's missing or out of date.
+        """
+        index = self._load_sidecar(cls, path)
+        if index is None or index.stamp == stamp:
+            return index
+        replayed = self._replayed.get(path)
+        if replayed is None or replayed[0] is not index:
+            replayed = index, index.stamp, 0
+        _, base, offset = replayed
+        tail = read_log(log_path(path), base, offset)
+        if tail is None or tail.stamp != stamp:
+            return None
+        try:
+            for row, old, new in tail.changes:
+                change(index, row, old, new)
+        except (ValueError, KeyError):
+            # the log doesn't match the index, it has to be rebuilt
+            self._loaded.pop(path, None)
+            return None
+        index.stamp = stamp
+        self._replayed[path] = index, base, tail.size
+        if tail.size >= self.index_log_max_size:
+            self._save_index(index, path)
+        return index
+
+    def _save_index(self, index, path: str) -> None:
+        """Save an index synced with the current file and start its log."""
+        index.stamp = FileStamp.of(self.file)
+        self._save_sidecar(index, path)
+        start_log(log_path(path), index.stamp)
+        self._replayed.pop(path, None)
+
+    def _date_index(self) -> DateIndex:
+        """Load the date index, build it if it's missing or out of date."""
+        stamp = FileStamp.of(self.file)
+        index = self._load_index(
+            DateIndex, self.dates_file, stamp, self._change_dates
+        )
+        if index is None:
+            index = DateIndex.build(
+                (i, ordinal)
+                for i, rec in enumerate(self.iter_records())
+                if (ordinal := self._date_ordinal(rec.date)) is not None
+            )
+            self._save_index(index, self.dates_file)
+        return index
+
+    def _text_index(self) -> TextIndex:
+        """Load the description index, build it if it's missing or outdated."""
+        stamp = FileStamp.of(self.file)
+        index = self._load_index(
+            TextIndex, self.text_file, stamp, self._change_text
+        )
+        if index is None:
+            index = TextIndex.build(
+                (i, rec.desc) for i, rec in enumerate(self.iter_records())
+            )
+            self._save_index(index, self.text_file)
+        return index
+
+    def _field_index(self) -> FieldIndex:
+        """Load the field index, build it if it's missing or out of date."""
+        stamp = FileStamp.of(self.file)
+        index = self._load_index(
+            FieldIndex, self.fields_file, stamp, self._change_fields
+        )
+        if index is None:
+            index = FieldIndex.build(enumerate(self.iter_records()))
+            self._save_index(index, self.fields_file)
+        return index
+
+    def _date_ordinal(self, date: str) -> int | None:
+        """Convert a date to an ordinal, None if the date is not valid."""
+        try:
+            return to_ordinal(date)
+        except ValueError:
+            return None
+
+    def _change_dates(
+        self,
+        index: DateIndex,
+        row: int,
+        old: Record | None,
+        new: Record,
+    ) -> None:
+        """Update the date index after a row was added or edited."""
+        if old is not None:
+            ordinal = self._date_ordinal(old.date)
+            if ordinal is not None:
+                index.remove(row, ordinal)
+        ordinal = self._date_ordinal(new.date)
+        if ordinal is not None:
+            index.add(row, ordinal)
+
+    def _change_text(
+        self,
+        index: TextIndex,
+        row: int,
+        old: Record | None,
+        new: Record,
+    ) -> None:
+        """Update the description index after a row was added or edited."""
+        if old is not None:
+            if old.desc == new.desc:
+                return
+            index.remove(row, old.desc)
+        index.add(row, new.desc)
+
+    def _change_fields(
+        self,
+        index: FieldIndex,
+        row: int,
+        old: Record | None,
+        new: Record,
+    ) -> None:
+        """Update the field index after a row was added or edited."""
+        if old is not None:
+            index.remove(row, old)
+        index.add(row, new)
+
+    def _log_changes(
+        self,
+        before: FileStamp,
+        after: FileStamp,
+        changes: list[Change],
     ) -> None:
-        """Search for records by category, date, amount, description.
-
-        Args:
-            category: The category to filter by.
-            date: The date to filter by.
-            amount: The amount to filter by.
-            desc: The description to filter by.
-        """
-        records = self._load_records()
-        filtered_records: list[Record] = [
-            rec
-            for rec in records
-            if (category is None or rec.category == category)
-            and (date is None or rec.date == date)
-            and (amount is None or rec.amount == amount)
-            and (desc is None or desc.lower() in rec.desc.lower())
+        """Add changed rows to the logs of the secondary indexes.
+
+        The indexes themselves are not loaded, logs that were not in sync
+        with the file before the write are left as is and their indexes are
+        rebuilt when needed.
+
+        Args:
+            before: The stamp of the file before the write.
+            after: The stamp of the file after the write.
+            changes: The added and edited rows.
+        """
+        for path in (self.dates_file, self.text_file, self.fields_file):
+            append_changes(log_path(path), changes, before, after)
+
+    def _date_bounds(
+        self,
+        date_from: str | None,
+        date_to: str | None,
+    ) -> tuple[int, int] | None:
+        """Turn a period of a search into a range of date ordinals.
+
+        Returns:
+            The first and the last ordinals, or None if there is no period
+            or its dates are not valid.
+        """
+        if not date_from and not date_to:
+            return None
+        try:
+            start = to_ordinal(date_from) if date_from else 1
+            end = to_ordinal(date_to) if date_to else MAX_ORDINAL
+        except ValueError:
+            return None
+        return start, end
+
+    def _records_at(self, rows: Iterable[int]) -> Iterator[tuple[int, Record]]:
+        """Read records by their row indexes using the offset index.
+
+        The records cache is used if it was filled by a full read before,
+        but it's not filled here even if the tracker keeps records, that
+        would parse all rows to get a few.
+
+        Args:
+            rows: 0-based row indexes.
+
+        Yields:
+            Pairs of a 1-based row ID and a record.
+        """
+        cached = None if self._cache is None else self._cached_rows()
+        if cached is not None:
+            for row in rows:
+                yield row + 1, Record(*cached[row])
+            return
+        yield from self._read_records_at(self._offset_index(), rows)
+
+    def _read_records_at(
+        self,
+        index: OffsetIndex,
+        rows: Iterable[int],
+    ) -> Iterator[tuple[int, Record]]:
+        """Read records by their row indexes from the file, see _records_at."""
+        journal = self._journal()
+        edits = journal.edits if journal else {}
+        with open(self.file, 'rb') as file:
+            layout = self._row_layout(file)
+            for row in rows:
+                start, end = index.span(row)
+                file.seek(start)
+                record = self._decode_record(file.read(end - start), layout)
+                if row in edits:
+                    record.update(**edits[row])
+                yield row + 1, record
+
+    def _rewrite(self, edits: dict[int, dict]) -> None:
+        """Write the file with edited rows into a new file that replaces it.
+
+        Rows without edits are copied byte for byte, edited rows keep the
+        values of the columns that are not record fields. The snapshot is
+        saved for the new file, the other sidecars are rebuilt on the next
+        access.
+
+        Args:
+            edits: New values of the record fields by 0-based row index.
+        """
+        snapshot = self._snapshot()
+        index = self._offset_index()
+        tmp_path = f'{self.file}.tmp'
+        with open(self.file, 'rb') as file, open(tmp_path, 'wb') as out:
+            layout = self._row_layout(file)
+            if layout is None:
+                # rows are read by position with the default field names
+                layout = RowLayout(self.fieldnames, self.fieldnames)
+            text = io.StringIO(newline='')
+            writer = csv.writer(text)
+            file.seek(0)
+            for row in sorted(edits):
+                start, end = index.span(row)
+                _copy_bytes(file, out, start - file.tell())
+                data = file.read(end - start).decode('utf-8')
+                cells = next(csv.reader(io.StringIO(data, newline='')))
+                record = layout.to_record(cells).update(**edits[row])
+                writer.writerow(layout.to_row(record, cells))
+                out.write(text.getvalue().encode('utf-8'))
+                text.seek(0)
+                text.truncate()
+            _copy_bytes(file, out, index.stamp.size - file.tell())
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, self.file)
+        fsync_dir(self.file)
+        self._save_snapshot(snapshot)
+
+    def _touch(self) -> FileStamp:
+        """Change the modification time of the file after a journaled edit.
+
+        The rows of the file stay the same, so the time is what tells other
+        trackers that their copies of records are out of date.
+
+        Returns:
+            The new stamp of the file.
+        """
+        stat = os.stat(self.file)
+        mtime_ns = max(time.time_ns(), stat.st_mtime_ns + 1)
+        os.utime(self.file, ns=(stat.st_atime_ns, mtime_ns))
+        return FileStamp.of(self.file)
+
+    def count(self) -> int:
+        self._init_file()
+        with self._lock.shared():
+            return self._snapshot().rows
+
+    def totals(self) -> tuple[int, int]:
+        self._init_file()
+        with self._lock.shared():
+            snapshot = self._snapshot()
+        return snapshot.incomes, snapshot.expenses
+
+    def find(
+        self,
+        query: Query,
+        plan: Plan | None = None,
+    ) -> Iterator[tuple[int, Record]]:
+        """Find records matching a query.
+
+        Candidate rows are taken from the index of the most selective
+        filter, see _plan, and only these rows are read. Without selective
+        filters category and amount filters are checked on the binary
+        ledger, and without them the whole file is scanned, by several
+        processes if it's large.
+        """
+        self._init_file()
+        with self._lock.shared():
+            plan = self._plan(query, Plan() if plan is None else plan)
+            if plan.access == INDEX:
+                records = self._records_at(plan.driver.rows())
+            elif plan.access == SCAN:
+                parts = self._scan_in_parallel(Matches(query))
+                if parts is not None:
+                    plan.checked = plan.total
+                    for part in parts:
+                        plan.found += len(part.found)
+                        yield from part.found
+                    return
+                records = enumerate(self.iter_records(), start=1)
+            else:
+                records = self._scan_binary(query)
+            yield from plan.filter(query, records)
+
+    def _plan(self, query: Query, plan: Plan) -> Plan:
+        """Estimate the rows of the indexed filters and choose the access.
+
+        Indexes are loaded, or built on the first search, only for the
+        filters of the query: the field index for an exact category, amount
+        or date, the date index for a period and the description index for
+        a description.
+
+        Args:
+            query: The search query.
+            plan: The plan to fill.
+        """
+        plan.total = self.count()
+        exact = [
+            (name, value)
+            for name in ('category', 'amount', 'date')
+            if (value := getattr(query, name)) is not None
         ]
-        if filtered_records:
-            self.show_records(records=filtered_records)
-        else:
-            print('Ничего не найдено.')
+        if exact:
+            fields = self._field_index()
+            for name, value in exact:
+                rows = fields.find(name, value)
+                plan.estimates.append(
+                    Estimate(name, str(value), len(rows), lambda r=rows: r)
+                )
+
+        bounds = self._date_bounds(query.date_from, query.date_to)
+        if bounds is not None:
+            dates = self._date_index()
+            plan.estimates.append(
+                Estimate(
+                    'period',
+                    f'{query.date_from or ""}..{query.date_to or ""}',
+                    dates.count(*bounds),
+                    lambda: dates.find(*bounds),
+                )
+            )
+
+        if query.desc:
+            text = self._text_index()
+            if query.by_words:
+                found = text.find_words(query.desc)
+            else:
+                found = text.find_substring(query.desc)
+            if found is not None:
+                plan.estimates.append(
+                    Estimate(
+                        'desc', query.desc, len(found), lambda: sorted(found)
+                    )
+                )
 
-    def add_record(self, record: Record) -> None:
-        """Append a new record row to a file based on user input.
+        plan.choose(
+            binary=query.category is not None or query.amount is not None
+        )
+        return plan
+
+    def report_data(self, top: int = 0) -> dict:
+        """Collect report totals, reuse the saved ones if the file is the same.
+
+        Totals of all groupings are saved together, so reports by other
+        groupings or with fewer expenses are taken from the same file.
+        """
+        self._init_file()
+        with self._lock.shared():
+            stamp = FileStamp.of(self.file)
+            data = load_report(self.reports_file, stamp, top)
+            if data is None:
+                aggregator = self._merge_in_parallel(Aggregator(top))
+                if aggregator is not None:
+                    data = aggregator.result()
+                else:
+                    data = super().report_data(top)
+                save_report(self.reports_file, stamp, top, data)
+        return data
+
+    def locked(self) -> ContextManager:
+        return self._lock.exclusive()
+
+    def compact(self) -> None:
+        """Write journaled edits into the file and rebuild the binary ledger.
+
+        The binary ledger is rebuilt without descriptions left by edits.
+        """
+        self._init_file()
+        with self._lock.exclusive():
+            self._fold_journal()
+            self._build_binary()
+
+    def _fold_journal(self) -> None:
+        """Rewrite the file with the journaled edits and remove the journal.
+
+        The journal is removed after the new file replaces the old one, if
+        this is interrupted, the journal is left for the old inode and is
+        ignored.
+        """
+        journal = self._journal()
+        if journal:
+            self._rewrite(journal.edits)
+        if self._journal_stamp() is not None:
+            os.remove(self.journal_file)
+            self._loaded.pop(self.journal_file, None)
+
+    def _append(self, records: list[Record]) -> None:
+        """Append rows to the file and update the snapshot and the indexes.
+
+        All rows are written at once and synced to the disk.
 
         Args:
-            record: The Record object to be saved to the file.
+            records: The Record objects to be saved to the file.
         """
-        with open(self.file, 'a', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=self.fieldnames)
-            writer.writerow(self._record_to_csv_dict(record))
-            print('Запись сохранена.')
+        self._init_file()
+        with self._lock.exclusive():
+            snapshot = self._snapshot()
+            before = FileStamp.of(self.file)
+            first_row = snapshot.rows
+            with open(self.file, 'rb') as file:
+                layout = self._row_layout(file)
+            data = self._encode_records(records, layout)
+            with open(self.file, 'ab') as file:
+                offset = file.tell()
+                file.write(b''.join(data))
+                file.flush()
+                os.fsync(file.fileno())
+            offsets = []
+            for record, row in zip(records, data):
+                offsets.append(offset)
+                offset += len(row)
+                snapshot.rows += 1
+                snapshot.add(record.category, record.amount)
+            self._save_snapshot(snapshot)
+            after = FileStamp(snapshot.size, snapshot.mtime_ns, snapshot.inode)
+            append_offsets(
+                self.offsets_file, offsets, before, after, snapshot.tail_crc
+            )
+            append_rows(
+                self.binary_file,
+                self.descs_file,
+                records,
+                before,
+                after,
+                snapshot.tail_crc,
+            )
+            cache = self._cache
+            if cache is not None and cache.stamp == before:
+                cache.extend(records)
+                cache.sync(after, snapshot.tail_crc, cache.journal)
+            self._log_changes(
+                before,
+                after,
+                [
+                    (row, None, record)
+                    for row, record in enumerate(records, start=first_row)
+                ],
+            )
 
-    def edit_record(self, record_id: int, edit_data: dict) -> bool:
+    def _edit(self, record_id: int, edit_data: dict) -> bool:
         """Edit an existing record using its line number as ID.
 
+        The changed fields are appended to the journal of edits, the file
+        itself is not rewritten until the journal grows to journal_max_size
+        and is folded into it, see compact.
+
         Args:
             record_id: A line number of a row to edit.
-            edited_record: The Record object to replace existing row.
-        """
-        records = self._load_records()
-        record_id -= 1  # using 1-based indexes in 'show'
-
-        if 0 <= record_id < len(records):
-            record = records[record_id]
-            records[record_id] = record.update(**edit_data)
-            with open(self.file, 'w', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=self.fieldnames)
-                writer.writeheader()
-                for rec in records:
-                    writer.writerow(self._record_to_csv_dict(rec))
-            print('Запись обновлена.')
+            edit_data: New values of the record fields.
+        """
+        self._init_file()
+        with self._lock.exclusive():
+            record_id -= 1  # using 1-based indexes in 'show'
+            if not 0 <= record_id < len(self._offset_index()):
+                return False
+            self._journal_edits([(record_id, edit_data)])
             return True
 
-        print('Запись не найдена.')
-        return False
+    def _save_batch(
+        self,
+        records: list[Record],
+        first_new: int,
+        edited: list[int],
+    ) -> None:
+        """Save records changed by a batch with one write of each file.
+
+        All edits go to the journal with one sync, the snapshot, the
+        binary ledger and the index logs are updated once for them, and
+        new records are saved with one append, see BaseTracker._save_batch.
+        """
+        self._init_file()
+        with self._lock.exclusive():
+            if edited:
+                self._journal_edits(
+                    [(i, asdict(records[i])) for i in edited]
+                )
+            if first_new < len(records):
+                self._append(records[first_new:])
+
+    def _journal_edits(self, edits: list[tuple[int, dict]]) -> None:
+        """Append edits of existing rows to the journal of edits.
+
+        Must be called under the exclusive lock.
+
+        Args:
+            edits: Pairs of a 0-based row index and new values of the
+                record fields, the rows are distinct.
+        """
+        index = self._offset_index()
+        snapshot = self._snapshot()
+        cache = self._cache
+        synced = (
+            cache is not None
+            and cache.stamp == FileStamp.of(self.file)
+            and cache.journal == self._journal_stamp()
+        )
+        rows = [row for row, _ in edits]
+        if synced:
+            old_records = [Record(*cache.rows[row]) for row in rows]
+        else:
+            found = dict(self._read_records_at(index, sorted(rows)))
+            old_records = [found[row + 1] for row in rows]
+        changes = []
+        for (row, edit_data), old_record in zip(edits, old_records):
+            record = copy(old_record).update(**edit_data)
+            snapshot.remove(old_record.category, old_record.amount)
+            snapshot.add(record.category, record.amount)
+            changes.append((row, old_record, record))
+
+        journal = self._journal()
+        if journal is None:
+            stamp = index.stamp
+            journal = Journal(stamp.inode, stamp.size, index.crc)
+        # the sidecars are out of date before the edits are journaled,
+        # so they are rebuilt if the write is interrupted after the journal
+        before = index.stamp
+        after = self._touch()
+        journal.append(self.journal_file, edits)
+        self._loaded[self.journal_file] = (
+            FileStamp.of(self.journal_file),
+            journal,
+        )
+        self._save_snapshot(snapshot)
+        # rows stay in place, only the stamp of the index is updated
+        append_offsets(self.offsets_file, [], before, after, snapshot.tail_crc)
+        if not replace_rows(
+            self.binary_file,
+            self.descs_file,
+            rows,
+            [record for _, _, record in changes],
+            before,
+            after,
+            snapshot.tail_crc,
+        ):
+            # a stale ledger could be taken for a prefix of the file
+            # and extended later without these edits
+            with suppress(FileNotFoundError):
+                os.remove(self.binary_file)
+        if synced:
+            for row, _, record in changes:
+                cache.replace(row, record)
+            cache.sync(after, snapshot.tail_crc, self._journal_stamp())
+        self._log_changes(before, after, changes)
+
+        if journal.size >= self.journal_max_size:
+            self._fold_journal()
+
+
+def _copy_bytes(src: BinaryIO, dst: BinaryIO, size: int) -> None:
+    """Copy a number of bytes from the current position of a file."""
+    while size > 0:
+        data = src.read(min(size, COPY_SIZE))
+        if not data:
+            break
+        dst.write(data)
+        size -= len(data)
@@ -1,8 +1,14 @@
 """Validation, normalization functions, texts for unloading other modules."""
 import datetime
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Iterable
 
+INCOME = 'Доход'
+EXPENSE = 'Расход'
+GROUPINGS = ['month', 'week', 'year', 'desc']
+FORMATS = ['table', 'csv', 'jsonl']  # of printed records, see core.output
+
 expense_category_names: list = ['расход', 'р', '-', 'e', 'ex', 'exp', 'expense']
 income_category_names: list = ['доход', 'д', '+', 'i', 'in', 'inc', 'income']
 
@@ -21,16 +27,110 @@ texts = SimpleNamespace(
     date_validation='Дата должна быть в формате ГГГГ-ММ-ДД.',
     category_validation='Ожидаемые категории: Расход/Доход, Exp/Inc или -/+.',
     amount_validation='Сумма должна быть целым числом.',
+    count_validation='Число должно быть целым и не меньше 0.',
+    date_from_help='Начало периода, ГГГГ-ММ-ДД',
+    date_to_help='Конец периода (включительно), ГГГГ-ММ-ДД',
+    month_help='Месяц, ГГГГ-ММ',
+    year_help='Год, ГГГГ',
+    file_help='Файл с записями (.csv или .db/.sqlite для SQLite)',
+    backend_help='Хранилище записей, по умолчанию выбирается по расширению',
+    migrate_help='Перенести записи из другого файла в текущее хранилище',
+    migrate_source_help='Файл, из которого переносятся записи',
+    import_help='Добавить записи из файла CSV или JSONL',
+    import_file_help='Файл с записями (заголовки/ключи: Дата, Категория, '
+    'Сумма, Описание или date, category, amount, desc)',
+    import_format_help='Формат файла, по умолчанию по расширению',
+    import_missing='Дата, категория и сумма обязательны.',
+    import_row_error='Ожидается объект с полями записи.',
+    import_row='Запись {}: {}',
+    import_done='Сохранено записей: {}, пропущено с ошибками: {}.',
+    words_help='Искать описание по началам слов, а не по подстроке',
+    offset_help='Пропустить первые N записей результата',
+    limit_help='Показать не больше N записей',
+    format_help='Формат вывода: таблица, CSV или JSON по строке на запись '
+    '(номер записи в поле id)',
+    explain_help='После результатов вывести план поиска и число '
+    'проверенных записей',
+    plan_title='План поиска, всего записей: {}',
+    plan_estimate='  {} {}: кандидатов {}',
+    plan_fields={
+        'category': 'категория',
+        'amount': 'сумма',
+        'date': 'дата',
+        'period': 'период',
+        'desc': 'описание',
+    },
+    plan_index='Кандидаты из индекса: {} {}, остальные условия проверяются '
+    'на них',
+    plan_access={
+        'binary': 'Просмотр двоичной копии по категории и сумме',
+        'scan': 'Просмотр всех записей',
+        'sql': 'Запрос SQLite:',
+    },
+    plan_rows='Проверено записей: {}, найдено: {}',
+    month_validation='Месяц должен быть в формате ГГГГ-ММ.',
+    year_validation='Год должен быть в формате ГГГГ.',
+    report_help='Показать доходы и расходы по периодам или описаниям',
+    report_by_help='Группировка: по месяцам, неделям, годам или по первому '
+    'слову описания',
+    report_top_help='Показать N крупнейших расходов',
+    report_key='Группа',
+    report_top_title='Крупнейшие расходы:',
+    compact_help='Пересобрать служебные файлы хранилища, удалив устаревшие '
+    'данные',
+    compact_done='Хранилище пересобрано.',
+    serve_help='Запустить демон, который держит записи в памяти и выполняет '
+    'команды других запусков',
+    serve_started='Демон слушает {}',
+    serve_running='Демон для этого файла уже запущен.',
+    serve_command='Команда {} выполняется без демона.',
+    batch_help='Выполнить команды из stdin (по одной на строку) с одной '
+    'загрузкой и одной записью файла',
+    batch_dry_run_help='Выполнить команды, не сохраняя изменения',
+    batch_dry_run='Пробный запуск: изменения не сохранены.',
+    batch_line='Строка {}: {}',
+    batch_command='Команда {} не выполняется в пакетном режиме.',
+    batch_file='В пакетном режиме нельзя указывать другой файл.',
+    profile_help='Вывести в stderr время операций трекера (также включается '
+    'переменной окружения TRACKER_PROFILE)',
+    profile_out_help='Сохранить профиль в файл: JSON для .json, иначе '
+    'статистику cProfile',
+    profile_total='Профиль {}: {:.3f} с, прочитано {} МиБ',
+    profile_header=('Операция', 'Вызовы', 'Всего, с', 'Своё, с', 'Строк'),
 )
 
 
-def validate_date(value: str) -> bool:
-    """Check if a user input is a valid date in the required format."""
+@lru_cache(maxsize=4096)
+def parse_date(value: str) -> str | None:
+    """Validate a date in format YYYY-MM-DD and normalize it in one pass.
+
+    Month and day may have one digit, like strptime's '%Y-%m-%d' allows.
+    The result is cached, as the same dates repeat a lot in records.
+
+    Returns:
+        The date in format YYYY-MM-DD or None if the value is not valid.
+    """
+    parts = value.split('-')
+    if len(parts) != 3:
+        return None
+    year, month, day = parts
+    if not (
+        len(year) == 4
+        and 0 < len(month) < 3
+        and 0 < len(day) < 3
+        and value.isascii()
+        and (year + month + day).isdigit()
+    ):
+        return None
     try:
-        datetime.datetime.strptime(value, '%Y-%m-%d')
-        return True
+        return datetime.date(int(year), int(month), int(day)).isoformat()
     except ValueError:
-        return False
+        return None
+
+
+def validate_date(value: str) -> bool:
+    """Check if a user input is a valid date in the required format."""
+    return parse_date(value) is not None
 
 
 def validate_amount(value: str) -> bool:
@@ -50,15 +150,23 @@ def validate_category(value: str) -> bool:
 def normalize_category(value: str) -> str:
     """Unify category format for saving."""
     if value in income_category_names:
-        return 'Доход'
+        return INCOME
     else:
-        return 'Расход'
+        return EXPENSE
 
 
 def normalize_date(value: str) -> str:
     """Normalize a valid date string to YYYY-MM-DD format."""
-    date_obj = datetime.datetime.strptime(value, '%Y-%m-%d')
-    return date_obj.strftime('%Y-%m-%d')
+    date = parse_date(value)
+    if date is None:
+        raise ValueError(texts.date_validation)
+    return date
+
+
+@lru_cache(maxsize=4096)
+def to_ordinal(value: str) -> int:
+    """Convert a YYYY-MM-DD date string to a day ordinal."""
+    return datetime.date.fromisoformat(value).toordinal()
 
 
 def get_today() -> str:
@@ -66,6 +174,28 @@ def get_today() -> str:
     return datetime.datetime.now().date().strftime('%Y-%m-%d')
 
 
+def check_args(
+    date: str | None,
+    category: str | None,
+    amount: str | None,
+) -> str | None:
+    """Validate values of a record, None values are skipped.
+
+    Returns:
+        The text of the first validation error or None if values are valid.
+    """
+    if date is not None and not validate_date(date) and not date == 't':
+        return texts.date_validation
+
+    if category is not None and not validate_category(category.lower()):
+        return texts.category_validation
+
+    if amount is not None and not validate_amount(amount):
+        return texts.amount_validation
+
+    return None
+
+
 def process_args(
     date: str | None,
     category: str | None,
@@ -83,26 +213,103 @@ def process_args(
     Returns:
         A dictionary containing normalized data or None if any validation fails.
     """
-    if date is not None and not validate_date(date) and not date == 't':
-        print(texts.date_validation)
-        return
-
-    if category is not None and not validate_category(category.lower()):
-        print(texts.category_validation)
-        return
-
-    if amount is not None and not validate_amount(amount):
-        print(texts.amount_validation)
+    error = check_args(date, category, amount)
+    if error:
+        print(error)
         return
 
     if date == 't':
         date = get_today()
     elif date is not None:
-        date = normalize_date(date)
+        date = parse_date(date)
 
     return {
         'date': date if date else None,
-        'category': normalize_category(category) if category else None,
+        'category': normalize_category(category.lower()) if category else None,
         'amount': int(amount) if amount is not None else None,
         'desc': ' '.join(desc),
     }
+
+
+def process_row(row: dict) -> dict:
+    """Validate and normalize values of a record from an imported row.
+
+    Args:
+        row: A dictionary with date, category, amount and optional desc,
+            or any other object if the row could not be parsed.
+
+    Returns:
+        A dictionary containing normalized data.
+
+    Raises:
+        ValueError: If a required value is missing or any validation fails,
+            the message explains the problem.
+    """
+    if not isinstance(row, dict):
+        raise ValueError(texts.import_row_error)
+    values = [row.get(key) for key in ('date', 'category', 'amount')]
+    if any(value is None or value == '' for value in values):
+        raise ValueError(texts.import_missing)
+    date, category, amount = (str(value).strip() for value in values)
+
+    error = check_args(date, category, amount)
+    if error:
+        raise ValueError(error)
+
+    return {
+        'date': get_today() if date == 't' else parse_date(date),
+        'category': normalize_category(category.lower()),
+        'amount': int(amount),
+        'desc': str(row.get('desc') or ''),
+    }
+
+
+def process_period(
+    date_from: str | None,
+    date_to: str | None,
+    month: str | None,
+    year: str | None,
+) -> tuple[str | None, str | None] | None:
+    """Validate period options and turn them into date bounds.
+
+    If several options are given, the period is their intersection.
+
+    Args:
+        date_from: The first date of the period.
+        date_to: The last date of the period.
+        month: A month in format YYYY-MM.
+        year: A year in format YYYY.
+
+    Returns:
+        A tuple with the first and the last dates of the period, each may be
+        None if unbounded, or None if any validation fails.
+    """
+    starts, ends = [], []
+    for value, bounds in ((date_from, starts), (date_to, ends)):
+        if value is not None:
+            date = parse_date(value)
+            if date is None:
+                print(texts.date_validation)
+                return
+            bounds.append(date)
+
+    if month is not None:
+        date = parse_date(f'{month}-01')
+        if date is None:
+            print(texts.month_validation)
+            return
+        import calendar
+
+        first = datetime.date.fromisoformat(date)
+        days = calendar.monthrange(first.year, first.month)[1]
+        starts.append(first.isoformat())
+        ends.append(first.replace(day=days).isoformat())
+
+    if year is not None:
+        if not (year.isdigit() and len(year) == 4):
+            print(texts.year_validation)
+            return
+        starts.append(f'{year}-01-01')
+        ends.append(f'{year}-12-31')
+
+    return max(starts, default=None), min(ends, default=None)
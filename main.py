@@ -1,62 +1,66 @@
 #!/usr/bin/env python3
 
-"""Main module that initiates a tracker with a file and handles arguments."""
+"""Main module that initiates a tracker with a file and handles arguments.
+
+If a daemon serves the file (see core.daemon), commands are forwarded to it,
+unless they are profiled (see core.profiling).
+
+Modules are imported only when a command needs them: forwarding a command
+to the daemon doesn't import the trackers at all.
+"""
+
+import os
+import sys
 
-from core.tracker import Record, Tracker
 from core.argparser import parse_args
-from core.utils import process_args
+from core.client import FORWARDED, forward
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Initiate tracker and handle CLI functionality."""
-    tracker = Tracker('data.csv')
-    args = parse_args()
-
-    if args.command == 'add':
-        record_data = process_args(
-            args.date,
-            args.category,
-            args.amount,
-            args.desc,
-        )
-        if record_data:
-            new_record = Record(
-                date=record_data['date'],
-                category=record_data['category'],
-                amount=record_data['amount'],
-                desc=record_data['desc'],
-            )
-            tracker.add_record(new_record)
-
-    elif args.command == 'edit':
-        record_data = process_args(
-            args.date,
-            args.category,
-            args.amount,
-            args.desc,
-        )
-        if record_data:
-            # remove empty values
-            edit_data = {k: v for k, v in record_data.items() if v}
-            tracker.edit_record(args.id, edit_data)
-
-    elif args.command == 'search':
-        tracker.search(
-            category=args.category,
-            date=args.date,
-            amount=args.amount,
-            desc=' '.join(args.desc),
-        )
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parse_args(argv)
+
+    if args.command == 'serve':
+        from core.daemon import serve
 
-    elif args.command in ['list', 'show']:
-        if args.tail:
-            tracker.show_records(n=args.tail)
-        else:
-            tracker.show_records()
+        serve(args.file, args.backend)
+        return
 
-    elif args.command == 'balance':
-        tracker.show_balance()
+    profile = None
+    if args.profile or args.profile_out or os.environ.get('TRACKER_PROFILE'):
+        from core.profiling import from_args
+
+        profile = from_args(args)
+
+    if args.command in FORWARDED and profile is None:
+        response = forward(args.file, argv)
+        if response is not None:
+            if 'error' in response:
+                sys.exit(response['error'])
+            print(response['output'], end='')
+            return
+
+    from core.backends import open_tracker
+    from core.commands import run_command
+
+    if profile is None:
+        run_command(args, open_tracker(args.file, args.backend))
+        return
+
+    with profile:
+        tracker = profile.timed('open_tracker', open_tracker)(
+            args.file, args.backend
+        )
+        profile.instrument(tracker)
+        run_command(args, tracker)
 
 
 if __name__ == '__main__':
-    main()
+    try:
+        main()
+    except BrokenPipeError:
+        # the output is piped into a command that exited early, like head
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
@@ -1,3 +1,4 @@
+import io
 import unittest
 from unittest.mock import patch
 
@@ -9,6 +10,15 @@ class TestArgparser(unittest.TestCase):
     def test_balance_command(self):
         args = parse_args()
         self.assertEqual(args.command, 'balance')
+        self.assertEqual(args.file, 'data.csv')
+        self.assertIsNone(args.backend)
+
+    @patch('sys.argv', ['tracker', '-f', 'data.db', 'migrate', 'data.csv'])
+    def test_migrate_command(self):
+        args = parse_args()
+        self.assertEqual(args.command, 'migrate')
+        self.assertEqual(args.file, 'data.db')
+        self.assertEqual(args.source, 'data.csv')
 
     @patch('sys.argv', ['tracker', 'show', '-t', '2'])
     def test_show_command_with_tail(self):
@@ -44,6 +54,33 @@ class TestArgparser(unittest.TestCase):
         self.assertEqual(args.command, 'search')
         self.assertEqual(args.category, 'Расход')
 
+    @patch(
+        'sys.argv',
+        ['tracker', 'search', '--from', '2024-05-01', '--month', '2024-05'],
+    )
+    def test_search_period(self):
+        args = parse_args()
+        self.assertEqual(args.date_from, '2024-05-01')
+        self.assertIsNone(args.date_to)
+        self.assertEqual(args.month, '2024-05')
+        self.assertIsNone(args.year)
+        self.assertFalse(args.words)
+
+    @patch('sys.argv', ['tracker', 'search', '--desc', 'нов', 'год', '--words'])
+    def test_search_words(self):
+        args = parse_args()
+        self.assertEqual(args.desc, ['нов', 'год'])
+        self.assertTrue(args.words)
+
+    def test_report_top(self):
+        args = parse_args(['report', '--by', 'week', '--top', '3'])
+        self.assertEqual((args.by, args.top), ('week', 3))
+        self.assertEqual(parse_args(['report']).top, 0)
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            with self.assertRaises(SystemExit):
+                parse_args(['report', '--top', '-1'])
+        self.assertIn('--top', stderr.getvalue())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,131 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.batch import parse_line, run_batch
+from core.query import Query
+from core.sqlite_tracker import SQLiteTracker
+from core.tracker import Record, Tracker
+
+COMMANDS = '''
+# comment
+add 2024-05-03 - 50 "чай, печенье"
+edit 1 --amount 1500
+search --desc чай
+add 2024-05-04 + 10 кешбэк
+balance
+'''
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(
+            [
+                Record('2024-05-01', 'Доход', 1000, 'зп'),
+                Record('2024-05-02', 'Расход', 300, 'кофе'),
+            ]
+        )
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def run_batch(self, text: str, **kwargs) -> tuple[int, list[str]]:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            errors = run_batch(io.StringIO(text), self.tracker, **kwargs)
+        return errors, stdout.getvalue().splitlines()
+
+    def test_commands_see_changes(self):
+        errors, lines = self.run_batch(COMMANDS)
+        self.assertEqual(errors, 0)
+        self.assertIn('чай, печенье', lines[2])
+        self.assertTrue(lines[2].lstrip().startswith('3.'))
+        self.assertIn('1160', lines[4])
+
+        tracker = Tracker(self.test_file)
+        self.assertEqual(tracker.count(), 4)
+        self.assertEqual(tracker.totals(), (1510, 350))
+        self.assertEqual(tracker._load_records()[0].amount, 1500)
+        self.assertEqual(len(list(tracker.find(Query(desc='кешбэк')))), 1)
+
+    def test_one_append(self):
+        with patch.object(
+            self.tracker, '_append', wraps=self.tracker._append
+        ) as append:
+            self.run_batch('add t - 1 a\nadd t - 2 b\nedit 3 --amount 5\n')
+        append.assert_called_once()
+        self.assertEqual(
+            [r.amount for r in self.tracker._load_records()], [1000, 300, 5, 2]
+        )
+
+    def test_edits_journaled(self):
+        with open(self.test_file, 'rb') as file:
+            data = file.read()
+        self.run_batch('edit 1 --amount 1\nedit 2 --desc новое\n')
+        with open(self.test_file, 'rb') as file:
+            self.assertEqual(file.read(), data)
+        records = Tracker(self.test_file)._load_records()
+        self.assertEqual(records[0].amount, 1)
+        self.assertEqual(records[1].desc, 'новое')
+
+    def test_edits_synced_once(self):
+        list(self.tracker.find(Query(desc='кофе')))
+        with patch('core.journal.os.fsync', wraps=os.fsync) as fsync:
+            self.run_batch('edit 1 --desc чай\nedit 2 --amount 7\n')
+        fsync.assert_called_once()
+        tracker = Tracker(self.test_file)
+        self.assertEqual(tracker.totals(), (1000, 7))
+        found = tracker.find(Query(desc='чай'))
+        self.assertEqual([i for i, _ in found], [1])
+        found = tracker.find(Query(amount=7))
+        self.assertEqual([i for i, _ in found], [2])
+
+    def test_dry_run(self):
+        with open(self.test_file, 'rb') as file:
+            data = file.read()
+        _, lines = self.run_batch(COMMANDS, dry_run=True)
+        self.assertEqual(lines[-1], 'Пробный запуск: изменения не сохранены.')
+        with open(self.test_file, 'rb') as file:
+            self.assertEqual(file.read(), data)
+
+    def test_invalid_lines(self):
+        text = 'import a.csv\nadd t\n--file a.csv balance\nadd "x\nshow\n'
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            errors, lines = self.run_batch(text)
+        self.assertEqual(errors, 4)
+        self.assertEqual(len(lines), 2)
+        numbers = [
+            line.split(':')[0]
+            for line in stderr.getvalue().splitlines()
+            if line.startswith('Строка')
+        ]
+        self.assertEqual(numbers, [f'Строка {i}' for i in range(1, 5)])
+
+    def test_parse_line(self):
+        self.assertIsNone(parse_line('  # add', self.test_file))
+        self.assertIsNone(parse_line('\n', self.test_file))
+        args = parse_line('add t - 1 "два слова"', self.test_file)
+        self.assertEqual(args.desc, ['два слова'])
+
+
+class TestSQLiteBatch(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.db'
+        self.tracker = SQLiteTracker(self.test_file)
+        self.tracker._append([Record('2024-05-01', 'Доход', 1000, 'зп')])
+
+    def tearDown(self):
+        self.tracker.connection.close()
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_save(self):
+        with patch('sys.stdout', new_callable=io.StringIO):
+            run_batch(
+                io.StringIO('edit 1 --amount 5\nadd t - 1 чай\n'), self.tracker
+            )
+        self.assertEqual(self.tracker.totals(), (5, 1))
@@ -0,0 +1,115 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.binary import BinaryLedger, build_ledger, read_header
+from core.sidecar import FileStamp
+from core.tracker import Record, Tracker
+
+RECORDS = [
+    Record('2024-05-01', 'Доход', 1000, 'зп'),
+    Record('2024-05-02', 'Расход', 300, 'кофе и булка'),
+    Record('2024-5-3', 'Расход', 300, 'дата без нулей'),
+    Record('2024-05-04', 'Другое', 300, ''),
+    Record('2024-05-05', 'Расход', 2**70, 'огромная сумма'),
+]
+
+
+class TestBinaryLedger(unittest.TestCase):
+    def setUp(self):
+        self.path = 'test_data.csv.bin'
+        self.descs_path = 'test_data.csv.descs'
+        build_ledger(
+            self.path, self.descs_path, RECORDS, FileStamp(1, 2, 3), 4
+        )
+
+    def tearDown(self):
+        for path in glob.glob('test_data.csv*'):
+            os.remove(path)
+
+    def test_header(self):
+        header = read_header(self.path)
+        self.assertEqual(header.stamp, FileStamp(1, 2, 3))
+        self.assertEqual((header.crc, header.rows), (4, 5))
+
+    def test_records(self):
+        with BinaryLedger(self.path, self.descs_path) as ledger:
+            self.assertEqual(len(ledger), 5)
+            self.assertEqual(ledger.record(0), RECORDS[0])
+            self.assertEqual(ledger.record(1), RECORDS[1])
+            self.assertEqual(
+                [ledger.record(i) for i in (2, 3, 4)], [None] * 3
+            )
+
+    def test_scan(self):
+        with BinaryLedger(self.path, self.descs_path) as ledger:
+            self.assertEqual(list(ledger.scan()), [0, 1, 2, 3, 4])
+            self.assertEqual(list(ledger.scan(amount=1000)), [0, 2, 3, 4])
+            self.assertEqual(list(ledger.scan('Расход')), [1, 2, 3, 4])
+            self.assertEqual(list(ledger.scan('Доход', 300)), [2, 3, 4])
+            self.assertEqual(list(ledger.scan('Другое')), [2, 3, 4])
+
+
+class TestTrackerBinary(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(RECORDS[:2])
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def search(self, **kwargs) -> list[str]:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.tracker.search(**kwargs)
+        return stdout.getvalue().splitlines()
+
+    def assertSynced(self):
+        header = read_header(self.tracker.binary_file)
+        self.assertEqual(header.stamp, FileStamp.of(self.test_file))
+        self.assertEqual(header.rows, self.tracker.count())
+
+    def test_search(self):
+        self.tracker._append(RECORDS[2:])
+        self.assertEqual(len(self.search(amount=300)), 3)
+        lines = self.search(category='Расход', amount=300)
+        ids = [line.split('.')[0].strip() for line in lines]
+        self.assertEqual(ids, ['2', '3'])
+        self.assertIn('дата без нулей', lines[1])
+
+    def test_synced_on_add_and_edit(self):
+        self.search(amount=300)
+        self.tracker._append([Record('2024-06-01', 'Доход', 50, 'новая')])
+        self.assertSynced()
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.tracker.edit_record(2, {'amount': 50, 'desc': 'чай'})
+        self.assertSynced()
+        self.assertEqual(
+            [line.split()[-1] for line in self.search(amount=50)],
+            ['чай', 'новая'],
+        )
+
+    def test_external_change(self):
+        self.search(amount=300)
+        with open(self.test_file, 'a', encoding='utf-8') as file:
+            file.write('2024-06-02,Расход,300,вручную\r\n')
+        self.assertEqual(len(self.search(amount=300)), 2)
+        self.assertSynced()
+
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            file.write('Дата,Категория,Сумма,Описание\r\n')
+            file.write('2024-06-03,Расход,300,заново\r\n')
+        self.assertEqual(self.search(amount=300)[0].split()[-1], 'заново')
+
+    def test_compact(self):
+        self.search(amount=300)
+        with patch('sys.stdout', new_callable=io.StringIO):
+            for desc in ('первое', 'второе', 'третье'):
+                self.tracker.edit_record(1, {'desc': desc})
+        size = os.path.getsize(self.tracker.descs_file)
+        self.tracker.compact()
+        self.assertLess(os.path.getsize(self.tracker.descs_file), size)
+        self.assertEqual(self.search(amount=1000)[0].split()[-1], 'третье')
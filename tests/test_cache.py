@@ -0,0 +1,121 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.layout import RowLayout
+from core.tracker import Record, Tracker
+
+RECORDS = [
+    Record('2024-05-01', 'Доход', 1000, 'зп'),
+    Record('2024-05-02', 'Расход', 300, 'кофе, булка'),
+]
+
+
+class TestRecordCache(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker.keep_records = True
+        self.tracker._append(RECORDS)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_reused(self):
+        self.assertEqual(self.tracker._load_records(), RECORDS)
+        with patch.object(
+            self.tracker, '_read_rows_from', side_effect=AssertionError
+        ):
+            self.assertEqual(self.tracker._load_records(), RECORDS)
+            self.assertEqual(self.tracker._tail_records(1), RECORDS[1:])
+
+    def test_own_writes(self):
+        self.tracker._load_records()
+        record = Record('2024-05-03', 'Расход', 5, 'чай')
+        with patch.object(
+            self.tracker, '_read_rows_from', side_effect=AssertionError
+        ), patch('sys.stdout', new_callable=io.StringIO):
+            self.tracker.add_record(record)
+            self.tracker.edit_record(1, {'desc': 'зарплата'})
+            records = self.tracker._load_records()
+        self.assertEqual(records[0].desc, 'зарплата')
+        self.assertEqual(records[2], record)
+        self.assertEqual(records, Tracker(self.test_file)._load_records())
+
+    def test_external_append(self):
+        self.tracker._load_records()
+        with open(self.test_file, 'a', encoding='utf-8') as file:
+            file.write('2024-06-02,Расход,7,вручную\r\n')
+        offsets = []
+        read_rows_from = self.tracker._read_rows_from
+
+        def read_rows(file, offset, first_row):
+            offsets.append(offset)
+            return read_rows_from(file, offset, first_row)
+
+        with patch.object(self.tracker, '_read_rows_from', read_rows):
+            records = self.tracker._load_records()
+        self.assertEqual(
+            records[-1], Record('2024-06-02', 'Расход', 7, 'вручную')
+        )
+        self.assertEqual(len(offsets), 1)
+        self.assertGreater(offsets[0], 100)
+
+    def test_external_rewrite(self):
+        self.tracker._load_records()
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            file.write('Дата,Категория,Сумма,Описание\r\n')
+            file.write('2024-06-03,Доход,1,заново\r\n')
+        self.assertEqual(
+            self.tracker._load_records(),
+            [Record('2024-06-03', 'Доход', 1, 'заново')],
+        )
+
+    def test_too_large(self):
+        self.tracker.cache_max_size = 10
+        self.assertEqual(self.tracker._load_records(), RECORDS)
+        self.assertIsNone(self.tracker._cache)
+
+    def test_no_matches(self):
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.tracker.show_records([])
+        self.assertEqual(stdout.getvalue(), 'Записей нет\n')
+
+
+class TestSingleCommand(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        Tracker(self.test_file)._append(RECORDS * 50)
+        self.tracker = Tracker(self.test_file)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def parsed(self, read) -> int:
+        """Count the rows parsed by a read on a fresh tracker."""
+        with patch.object(
+            RowLayout,
+            'to_record',
+            autospec=True,
+            side_effect=RowLayout.to_record,
+        ) as to_record:
+            read()
+        self.assertIsNone(self.tracker._cache)
+        return to_record.call_count
+
+    def test_tail_and_range_read_only_their_rows(self):
+        count = self.parsed(lambda: self.tracker._tail_records(3))
+        self.assertEqual(count, 3)
+        count = self.parsed(lambda: list(self.tracker.iter_records(10, 15)))
+        self.assertEqual(count, 5)
+
+    def test_show_tail(self):
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            count = self.parsed(lambda: self.tracker.show_records(n=3))
+        self.assertEqual(count, 3)
+        last = stdout.getvalue().splitlines()[-1]
+        self.assertTrue(last.startswith('100.'))
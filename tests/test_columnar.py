@@ -0,0 +1,74 @@
+import glob
+import os
+import unittest
+
+from core.columnar import ColumnarLedger
+from core.record import Record
+from core.tracker import Tracker
+
+RECORDS = [
+    Record('2024-05-01', 'Доход', 1000, 'зп'),
+    Record('2024-05-02', 'Расход', 200, 'продукты'),
+    Record('2024-05-03', 'Расход', 300, 'продукты'),
+]
+
+
+class TestColumnarLedger(unittest.TestCase):
+    def test_round_trip(self):
+        ledger = ColumnarLedger(RECORDS)
+        self.assertEqual(len(ledger), 3)
+        self.assertEqual(list(ledger), RECORDS)
+        self.assertEqual(ledger[1], RECORDS[1])
+
+    def test_values_are_shared(self):
+        ledger = ColumnarLedger(RECORDS)
+        self.assertEqual(ledger.category_names, ['Доход', 'Расход'])
+        self.assertEqual(ledger.descs, ['зп', 'продукты'])
+        self.assertEqual(list(ledger.desc_ids), [0, 1, 1])
+
+    def test_setitem(self):
+        ledger = ColumnarLedger(RECORDS)
+        ledger[0] = Record('2024-06-01', 'Расход', 5, 'кофе')
+        self.assertEqual(ledger[0], Record('2024-06-01', 'Расход', 5, 'кофе'))
+        self.assertEqual(ledger[2], RECORDS[2])
+
+    def test_raw_dates(self):
+        raw = [Record('01.05.2024', 'Доход', 1), Record('20240502', '-', 2)]
+        ledger = ColumnarLedger(RECORDS + raw)
+        self.assertEqual(list(ledger), RECORDS + raw)
+        self.assertEqual(ledger.raw_dates, {3: '01.05.2024', 4: '20240502'})
+        ledger[-2] = RECORDS[0]
+        ledger[0] = raw[0]
+        self.assertEqual(ledger[3], RECORDS[0])
+        self.assertEqual(ledger.raw_dates, {0: '01.05.2024', 4: '20240502'})
+        self.assertEqual(ledger[0], raw[0])
+        with self.assertRaises(IndexError):
+            ledger[5] = raw[0]
+        self.assertNotIn(5, ledger.raw_dates)
+
+    def test_record_has_no_dict(self):
+        self.assertFalse(hasattr(RECORDS[0], '__dict__'))
+
+
+class TestTrackerColumnar(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_load_columnar(self):
+        self.tracker._append(RECORDS)
+        with open(self.test_file, 'a', encoding='utf-8') as file:
+            file.write('2024-13-01,Расход,5,вручную\r\n')
+        self.tracker._edit(2, {'amount': 250})
+        ledger = self.tracker.load_columnar()
+        self.assertEqual(list(ledger), list(self.tracker.iter_records()))
+        self.assertEqual(ledger[1].amount, 250)
+        self.assertEqual(ledger.raw_dates, {3: '2024-13-01'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import asyncio
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.client import forward, socket_path
+from core.daemon import TrackerServer
+from core.tracker import Record, Tracker
+
+
+class TestTrackerServer(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.server = TrackerServer(self.test_file)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_execute(self):
+        output = self.server.execute(['add', '2024-05-01', '+', '1000', 'зп'])
+        self.assertEqual(output, 'Запись сохранена.\n')
+        output = self.server.execute(['balance'])
+        self.assertIn('1000', output.splitlines()[0])
+
+    def test_execute_errors(self):
+        with self.assertRaises(ValueError):
+            self.server.execute(['import', 'rows.csv'])
+        with self.assertRaisesRegex(ValueError, 'invalid'):
+            self.server.execute(['add', '2024-05-01', '+', 'много'])
+
+    def test_external_changes(self):
+        self.server.execute(['balance'])
+        record = Record('2024-05-01', 'Расход', 70)
+        with patch('sys.stdout', new_callable=io.StringIO):
+            Tracker(self.test_file).add_record(record)
+        self.assertEqual(self.server.tracker.totals(), (0, 70))
+
+    def test_socket(self):
+        async def scenario():
+            server = await self.server.start()
+            async with server:
+                add = ['add', '2024-05-01', '-', '300', 'еда']
+                await asyncio.to_thread(forward, self.test_file, add)
+                return await asyncio.to_thread(
+                    forward, self.test_file, ['show']
+                )
+
+        response = asyncio.run(scenario())
+        self.assertEqual(response['output'].split()[-2:], ['300', 'еда'])
+        self.assertEqual(len(Tracker(self.test_file)._load_records()), 1)
+
+    def test_no_daemon(self):
+        self.assertIsNone(forward(self.test_file, ['balance']))
+        open(socket_path(self.test_file), 'w').close()
+        self.assertIsNone(forward(self.test_file, ['balance']))
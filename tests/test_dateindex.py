@@ -0,0 +1,87 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.dateindex import DateIndex
+from core.indexlog import log_path, read_log
+from core.sidecar import FileStamp
+from core.tracker import Record, Tracker
+from core.utils import to_ordinal
+
+
+class TestDateIndex(unittest.TestCase):
+    def setUp(self):
+        dates = ['2024-05-03', '2024-05-01', '2024-05-02', '2024-05-01']
+        self.index = DateIndex.build(
+            (row, to_ordinal(date)) for row, date in enumerate(dates)
+        )
+
+    def test_find(self):
+        find = self.index.find
+        self.assertEqual(find(to_ordinal('2024-05-01'), 800000), [0, 1, 2, 3])
+        self.assertEqual(find(*[to_ordinal('2024-05-01')] * 2), [1, 3])
+        self.assertEqual(find(to_ordinal('2024-05-02'), 1), [])
+
+    def test_add_remove(self):
+        self.index.add(4, to_ordinal('2024-05-02'))
+        self.index.remove(1, to_ordinal('2024-05-01'))
+        self.assertEqual(self.index.find(1, 800000), [0, 2, 3, 4])
+        self.assertEqual(list(self.index.ordinals), sorted(self.index.ordinals))
+
+    def test_save_load(self):
+        path = 'test_index.dates'
+        self.index.stamp = FileStamp(1, 2, 3)
+        self.index.save(path)
+        loaded = DateIndex.load(path)
+        os.remove(path)
+        self.assertEqual(loaded.stamp, FileStamp(1, 2, 3))
+        self.assertEqual(loaded.rows, self.index.rows)
+        self.assertEqual(loaded.ordinals, self.index.ordinals)
+
+
+class TestTrackerPeriodSearch(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        with patch('sys.stdout', new_callable=io.StringIO):
+            for date in ('2024-04-30', '2024-05-01', '2024-05-31', '2024-06-01'):
+                self.tracker.add_record(Record(date, 'Расход', 100))
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def search(self, **kwargs) -> list[str]:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.tracker.search(**kwargs)
+        return stdout.getvalue().splitlines()
+
+    def test_period(self):
+        lines = self.search(date_from='2024-05-01', date_to='2024-05-31')
+        self.assertEqual([line[:4] for line in lines], ['  2.', '  3.'])
+        self.assertTrue(os.path.exists(self.tracker.dates_file))
+
+    def test_index_is_updated_on_add_and_edit(self):
+        self.search(date_from='2024-05-01')
+        saved = DateIndex.load(self.tracker.dates_file).stamp
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.tracker.add_record(Record('2024-05-15', 'Расход', 1))
+            self.tracker.edit_record(1, {'date': '2024-05-20'})
+        self.assertEqual(DateIndex.load(self.tracker.dates_file).stamp, saved)
+        tail = read_log(log_path(self.tracker.dates_file), saved)
+        self.assertEqual(tail.stamp, FileStamp.of(self.test_file))
+        self.assertEqual(len(tail.changes), 2)
+        lines = self.search(date_from='2024-05-01', date_to='2024-05-31')
+        self.assertEqual(
+            [line[:4] for line in lines], ['  1.', '  2.', '  3.', '  5.']
+        )
+
+    def test_exact_date(self):
+        self.assertEqual(len(self.search(date='2024-06-01')), 1)
+        self.assertEqual(self.search(date='2024-6-1'), ['Ничего не найдено.'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import glob
+import os
+import unittest
+
+from core.fieldindex import FieldIndex
+from core.query import Query
+from core.sidecar import FileStamp
+from core.tracker import Record, Tracker
+
+RECORDS = [
+    Record('2024-05-01', 'Доход', 1000, 'зп'),
+    Record('2024-05-01', 'Расход', 300, 'кофе'),
+    Record('2024-05-02', 'Расход', 50, 'чай'),
+    Record('2024-05-03', 'Расход', 300, 'обед'),
+]
+
+
+class TestFieldIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = FieldIndex.build(enumerate(RECORDS))
+
+    def test_find(self):
+        self.assertEqual(list(self.index.find('amount', 300)), [1, 3])
+        self.assertEqual(
+            list(self.index.find('category', 'Расход')), [1, 2, 3]
+        )
+        self.assertEqual(list(self.index.find('date', '2024-05-01')), [0, 1])
+        self.assertEqual(list(self.index.find('amount', 7)), [])
+
+    def test_add_remove_save_load(self):
+        self.index.remove(2, RECORDS[2])
+        self.index.add(2, Record('2024-05-03', 'Расход', 300, 'чай'))
+        self.index.stamp = FileStamp(1, 2, 3)
+        path = 'test_index.fields'
+        self.index.save(path)
+        loaded = FieldIndex.load(path)
+        os.remove(path)
+        self.assertEqual(loaded.stamp, FileStamp(1, 2, 3))
+        self.assertEqual(list(loaded.find('amount', 300)), [1, 2, 3])
+        self.assertEqual(list(loaded.find('amount', 50)), [])
+        self.assertEqual(list(loaded.find('date', '2024-05-03')), [2, 3])
+
+
+class TestTrackerFieldIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(RECORDS)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_index_is_updated_on_add_and_edit(self):
+        list(self.tracker.find(Query(amount=300)))
+        saved = FieldIndex.load(self.tracker.fields_file).stamp
+        self.tracker._edit(2, {'amount': 70})
+        self.tracker._append([Record('2024-05-04', 'Расход', 300, 'ужин')])
+        index = FieldIndex.load(self.tracker.fields_file)
+        self.assertEqual(index.stamp, saved)
+        index = Tracker(self.test_file)._field_index()
+        self.assertEqual(index.stamp, FileStamp.of(self.test_file))
+        self.assertEqual(list(index.find('amount', 300)), [3, 4])
+        self.assertEqual(list(index.find('amount', 70)), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
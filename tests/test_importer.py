@@ -0,0 +1,80 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.importer import read_csv, read_jsonl, read_rows
+from core.record import Record
+from core.tracker import Tracker
+
+
+class TestReaders(unittest.TestCase):
+    def test_read_csv(self):
+        file = io.StringIO(
+            'Дата,Категория,Сумма,Описание\r\n2024-05-01,+,100,зп\r\n'
+        )
+        self.assertEqual(
+            list(read_csv(file)),
+            [
+                {
+                    'date': '2024-05-01',
+                    'category': '+',
+                    'amount': '100',
+                    'desc': 'зп',
+                }
+            ],
+        )
+
+    def test_read_jsonl(self):
+        file = io.StringIO(
+            '{"date": "2024-05-01", "amount": 1}\n\n[1]\n{broken\n'
+        )
+        rows = list(read_jsonl(file))
+        self.assertEqual(rows, [{'date': '2024-05-01', 'amount': 1}, None, None])
+
+
+class TestAddRecords(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*') + ['test_import.jsonl']:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_add_records_skips_invalid_rows(self):
+        rows = [
+            {'date': '2024-5-1', 'category': 'Доход', 'amount': '100'},
+            {'date': '2024-05-02', 'category': 'х', 'amount': '1'},
+            None,
+            {'date': '2024-05-03', 'category': '-', 'amount': 20, 'desc': 'а'},
+            {'date': '2024-05-04', 'category': '-'},
+        ]
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(self.tracker.add_records(rows), 2)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[0].startswith('Запись 2:'))
+        self.assertTrue(lines[1].startswith('Запись 3:'))
+        self.assertTrue(lines[2].startswith('Запись 5:'))
+        self.assertEqual(
+            self.tracker._load_records(),
+            [
+                Record('2024-05-01', 'Доход', 100, ''),
+                Record('2024-05-03', 'Расход', 20, 'а'),
+            ],
+        )
+        self.assertEqual(self.tracker.totals(), (100, 20))
+
+    def test_import_jsonl_file(self):
+        with open('test_import.jsonl', 'w', encoding='utf-8') as file:
+            file.write('{"Дата": "2024-05-01", "Категория": "+", "Сумма": 5}\n')
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.tracker.add_records(read_rows('test_import.jsonl'))
+        self.assertEqual(self.tracker.count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import glob
+import os
+import unittest
+from unittest.mock import patch
+
+from core.indexlog import (
+    HEADER,
+    append_changes,
+    log_path,
+    read_log,
+    start_log,
+)
+from core.query import Query
+from core.sidecar import FileStamp
+from core.textindex import TextIndex
+from core.tracker import Record, Tracker
+
+RECORDS = [
+    Record('2024-05-01', 'Доход', 1000, 'зп'),
+    Record('2024-05-02', 'Расход', 300, 'кофе, "с собой"'),
+    Record('2024-05-03', 'Расход', 50, 'чай'),
+]
+BASE = FileStamp(10, 1, 7)
+FIRST = FileStamp(20, 2, 7)
+SECOND = FileStamp(30, 3, 7)
+THIRD = FileStamp(40, 4, 7)
+
+
+class TestIndexLog(unittest.TestCase):
+    def setUp(self):
+        self.path = 'test_index.log'
+        start_log(self.path, BASE)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_append_and_read(self):
+        append_changes(self.path, [(3, None, RECORDS[1])], BASE, FIRST)
+        append_changes(self.path, [(0, RECORDS[0], RECORDS[2])], FIRST, SECOND)
+        tail = read_log(self.path, BASE)
+        self.assertEqual(tail.stamp, SECOND)
+        self.assertEqual(
+            tail.changes,
+            [(3, None, RECORDS[1]), (0, RECORDS[0], RECORDS[2])],
+        )
+        first = read_log(self.path, BASE).size
+        append_changes(self.path, [(4, None, RECORDS[0])], SECOND, THIRD)
+        tail = read_log(self.path, BASE, first)
+        self.assertEqual(tail.changes, [(4, None, RECORDS[0])])
+        self.assertEqual(read_log(self.path, BASE, tail.size).changes, [])
+
+    def test_out_of_sync(self):
+        append_changes(self.path, [(3, None, RECORDS[1])], FIRST, SECOND)
+        self.assertEqual(read_log(self.path, BASE).stamp, BASE)
+        self.assertIsNone(read_log(self.path, FIRST))
+        self.assertIsNone(read_log('test_missing.log', BASE))
+
+    def test_interrupted_write_is_ignored(self):
+        append_changes(self.path, [(3, None, RECORDS[1])], BASE, FIRST)
+        with open(self.path, 'ab') as file:
+            file.write(b'[4, null, ["2024')
+        tail = read_log(self.path, BASE)
+        self.assertEqual(tail.changes, [(3, None, RECORDS[1])])
+        append_changes(self.path, [(4, None, RECORDS[2])], FIRST, SECOND)
+        self.assertEqual(len(read_log(self.path, BASE).changes), 2)
+        with open(self.path, 'r+b') as file:
+            file.truncate(HEADER.size + 5)
+        self.assertIsNone(read_log(self.path, BASE))
+
+
+class TestTrackerIndexLog(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(RECORDS)
+        list(self.tracker.find(Query(desc='кофе', amount=300)))
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_writes_only_append_to_logs(self):
+        with patch.object(TextIndex, 'save', side_effect=AssertionError):
+            self.tracker._append([Record('2024-05-04', 'Расход', 7, 'кофе')])
+            self.tracker._edit(1, {'desc': 'зарплата'})
+        found = Tracker(self.test_file).find(Query(desc='кофе'))
+        self.assertEqual([i for i, _ in found], [2, 4])
+        found = Tracker(self.test_file).find(Query(desc='зарпл'))
+        self.assertEqual([i for i, _ in found], [1])
+
+    def test_long_living_tracker_reads_new_changes(self):
+        tracker = Tracker(self.test_file)
+        index = tracker._text_index()
+        self.tracker._append([Record('2024-05-04', 'Расход', 7, 'такси')])
+        self.assertIs(tracker._text_index(), index)
+        self.assertEqual(index.find_substring('такс'), {3})
+        self.tracker._edit(4, {'desc': 'метро'})
+        _, _, offset = tracker._replayed[tracker.text_file]
+        with patch('core.tracker.read_log', wraps=read_log) as read:
+            self.assertEqual(tracker._text_index().find_words('метро'), {3})
+        self.assertEqual(read.call_args.args[2], offset)
+        self.assertEqual(index.find_substring('такс'), set())
+
+    def test_log_is_folded(self):
+        self.tracker.index_log_max_size = 1
+        self.tracker._append([Record('2024-05-04', 'Расход', 7, 'такси')])
+        self.tracker._text_index()
+        stamp = FileStamp.of(self.test_file)
+        self.assertEqual(TextIndex.load(self.tracker.text_file).stamp, stamp)
+        tail = read_log(log_path(self.tracker.text_file), stamp)
+        self.assertEqual((tail.stamp, tail.changes), (stamp, []))
+
+    def test_broken_log_rebuilds_index(self):
+        self.tracker._append([Record('2024-05-04', 'Расход', 7, 'такси')])
+        os.remove(log_path(self.tracker.text_file))
+        tracker = Tracker(self.test_file)
+        self.assertEqual(tracker._text_index().find_substring('такс'), {3})
+        stamp = FileStamp.of(self.test_file)
+        self.assertEqual(TextIndex.load(self.tracker.text_file).stamp, stamp)
+
+
+if __name__ == '__main__':
+    unittest.main()
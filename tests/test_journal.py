@@ -0,0 +1,126 @@
+import glob
+import os
+import unittest
+from unittest.mock import patch
+
+from core.journal import Journal
+from core.query import Query
+from core.tracker import Record, Tracker
+
+RECORDS = [
+    Record('2024-05-01', 'Доход', 1000, 'зп'),
+    Record('2024-05-02', 'Расход', 300, 'кофе'),
+    Record('2024-05-03', 'Расход', 50, 'чай'),
+]
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(RECORDS)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def read_file(self) -> bytes:
+        with open(self.test_file, 'rb') as file:
+            return file.read()
+
+    def test_edit_appends_to_journal(self):
+        data = self.read_file()
+        self.tracker._edit(2, {'amount': 200, 'desc': 'кофе, булка'})
+        self.tracker._edit(2, {'amount': 250})
+        self.assertEqual(self.read_file(), data)
+
+        journal = Journal.load(self.tracker.journal_file)
+        self.assertEqual(
+            journal.edits, {1: {'amount': 250, 'desc': 'кофе, булка'}}
+        )
+        self.assertEqual(
+            self.tracker._load_records()[1],
+            Record('2024-05-02', 'Расход', 250, 'кофе, булка'),
+        )
+
+    def test_readers_apply_journal(self):
+        self.tracker._edit(3, {'amount': 70, 'desc': 'зелёный чай'})
+        tracker = Tracker(self.test_file)
+        tracker.cache_max_size = 0
+        edited = Record('2024-05-03', 'Расход', 70, 'зелёный чай')
+        self.assertEqual(tracker._load_records()[2], edited)
+        self.assertEqual(list(tracker.iter_records(2)), [edited])
+        self.assertEqual(tracker._tail_records(1), [edited])
+        self.assertEqual(tracker.totals(), (1000, 370))
+        self.assertEqual(
+            list(tracker.find(Query(desc='зелёный'))), [(3, edited)]
+        )
+        self.assertEqual(list(tracker.find(Query(amount=70))), [(3, edited)])
+        self.assertEqual(list(tracker.find(Query(amount=50))), [])
+
+    def test_interrupted_edit(self):
+        self.tracker._text_index()
+        append = Journal.append
+
+        def crash(journal, path, edits):
+            append(journal, path, edits)
+            raise OSError
+
+        with patch.object(Journal, 'append', crash):
+            with self.assertRaises(OSError):
+                self.tracker._edit(2, {'amount': 999})
+        tracker = Tracker(self.test_file)
+        self.assertEqual(tracker.totals(), (1000, 1049))
+        found = tracker.find(Query(amount=999))
+        self.assertEqual([i for i, _ in found], [2])
+        self.assertEqual(list(tracker.find(Query(amount=300))), [])
+
+    def test_cache_of_other_tracker(self):
+        tracker = Tracker(self.test_file)
+        tracker.keep_records = True
+        tracker._load_records()
+        self.tracker._edit(1, {'amount': 900})
+        self.tracker._append([Record('2024-05-04', 'Расход', 5, 'вода')])
+        records = tracker._load_records()
+        self.assertEqual(records[0].amount, 900)
+        self.assertEqual(len(records), 4)
+
+    def test_compact(self):
+        self.tracker._edit(1, {'desc': 'зарплата'})
+        self.tracker.compact()
+        self.assertFalse(os.path.exists(self.tracker.journal_file))
+        self.assertIn('зарплата'.encode(), self.read_file())
+        self.assertEqual(self.tracker._load_records()[0].desc, 'зарплата')
+        self.assertEqual(self.tracker.totals(), (1000, 350))
+
+    def test_auto_compact(self):
+        self.tracker._edit(1, {'amount': 900})
+        self.assertTrue(os.path.exists(self.tracker.journal_file))
+        self.tracker.journal_max_size = 1
+        self.tracker._edit(2, {'amount': 400})
+        self.assertFalse(os.path.exists(self.tracker.journal_file))
+        self.assertIn(b',400,', self.read_file())
+        records = Tracker(self.test_file)._load_records()
+        self.assertEqual([r.amount for r in records], [900, 400, 50])
+
+    def test_other_file_ignored(self):
+        self.tracker._edit(1, {'amount': 1})
+        os.rename(self.tracker.journal_file, 'test_data.csv.old')
+        data = self.read_file().replace(b',50,', b',55,')
+        os.remove(self.test_file)
+        with open(self.test_file, 'wb') as file:
+            file.write(data)
+        os.rename('test_data.csv.old', self.tracker.journal_file)
+        records = Tracker(self.test_file)._load_records()
+        self.assertEqual([r.amount for r in records], [1000, 300, 55])
+
+    def test_cut_line_skipped(self):
+        self.tracker._edit(1, {'amount': 1})
+        with open(self.tracker.journal_file, 'ab') as file:
+            file.write(b'{"id": 2, "am')
+        journal = Journal.load(self.tracker.journal_file)
+        self.assertEqual(journal.edits, {0: {'amount': 1}})
+
+        self.tracker._edit(3, {'amount': 3})
+        journal = Journal.load(self.tracker.journal_file)
+        self.assertEqual(journal.edits, {0: {'amount': 1}, 2: {'amount': 3}})
@@ -0,0 +1,101 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.layout import RowLayout
+from core.tracker import Record, Tracker
+
+FIELDNAMES = ['Дата', 'Категория', 'Сумма', 'Описание']
+
+
+class TestRowLayout(unittest.TestCase):
+    def test_standard(self):
+        layout = RowLayout(FIELDNAMES, FIELDNAMES)
+        record = Record('2024-05-01', 'Доход', 10, 'зп')
+        self.assertEqual(
+            layout.to_row(record), ['2024-05-01', 'Доход', 10, 'зп']
+        )
+        self.assertEqual(
+            layout.to_record(['2024-05-01', 'Доход', '10', 'зп']), record
+        )
+
+    def test_reordered(self):
+        header = ['Описание', 'Заметка', 'Сумма', 'Дата', 'Категория']
+        layout = RowLayout(header, FIELDNAMES)
+        record = Record('2024-05-01', 'Доход', 10, 'зп')
+        self.assertEqual(
+            layout.to_row(record), ['зп', '', 10, '2024-05-01', 'Доход']
+        )
+        self.assertEqual(
+            layout.to_record(['зп', 'x', '10', '2024-05-01', 'Доход']), record
+        )
+
+    def test_keeps_other_cells(self):
+        header = ['Описание', 'Заметка', 'Сумма', 'Дата', 'Категория']
+        layout = RowLayout(header, FIELDNAMES)
+        record = Record('2024-05-01', 'Доход', 10, 'зп')
+        self.assertEqual(
+            layout.to_row(record, ['a', 'x', '1', '2024-01-01', '+']),
+            ['зп', 'x', 10, '2024-05-01', 'Доход'],
+        )
+
+    def test_short_row(self):
+        layout = RowLayout(FIELDNAMES, FIELDNAMES)
+        self.assertIsNone(layout.to_record(['2024-05-01', '+', '1']).desc)
+
+    def test_missing_field(self):
+        self.assertIsNone(RowLayout.resolve(FIELDNAMES[:3], FIELDNAMES))
+
+
+class TestTrackerReorderedHeader(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        with open(self.test_file, 'w', encoding='utf-8', newline='') as file:
+            file.write('Сумма,Описание,Дата,Категория\r\n')
+            file.write('1000,зп,2024-05-01,Доход\r\n')
+            file.write('300,"кофе, булка",2024-05-02,Расход\r\n')
+        self.tracker = Tracker(self.test_file)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_read(self):
+        self.assertEqual(
+            self.tracker._load_records(),
+            [
+                Record('2024-05-01', 'Доход', 1000, 'зп'),
+                Record('2024-05-02', 'Расход', 300, 'кофе, булка'),
+            ],
+        )
+        self.assertEqual(self.tracker._tail_records(1)[0].amount, 300)
+        self.assertEqual(list(self.tracker.iter_records(1))[0].amount, 300)
+
+    def test_write(self):
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.tracker.add_record(Record('2024-05-03', 'Расход', 5, 'чай'))
+            self.tracker.edit_record(1, {'desc': 'зарплата'})
+        self.tracker.compact()
+        with open(self.test_file, encoding='utf-8', newline='') as file:
+            lines = file.read().split('\r\n')
+        self.assertEqual(lines[1], '1000,зарплата,2024-05-01,Доход')
+        self.assertEqual(lines[3], '5,чай,2024-05-03,Расход')
+        self.assertEqual(self.tracker.totals(), (1000, 305))
+
+    def test_compact_keeps_extra_columns(self):
+        with open(self.test_file, 'w', encoding='utf-8', newline='') as file:
+            file.write('Описание,Сумма,Дата,Категория,Extra\r\n')
+            file.write('зп,1000,2024-05-01,Доход,x\n')
+            file.write('кофе,300,2024-05-02,Расход,y\n')
+        tracker = Tracker(self.test_file)
+        with patch('sys.stdout', new_callable=io.StringIO):
+            tracker.edit_record(2, {'amount': 200})
+        tracker.compact()
+        with open(self.test_file, encoding='utf-8', newline='') as file:
+            lines = file.read().split('\n')
+        # the row without edits is copied as is
+        self.assertEqual(lines[1], 'зп,1000,2024-05-01,Доход,x')
+        self.assertEqual(lines[2], 'кофе,200,2024-05-02,Расход,y\r')
+        self.assertEqual(tracker.totals(), (1000, 200))
@@ -0,0 +1,120 @@
+import glob
+import io
+import multiprocessing
+import os
+import random
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from core import locking
+from core.locking import FileLock
+from core.tracker import Record, Tracker
+
+WORKERS = 8
+ADDS = 15
+SEED_ROWS = 5
+
+
+def is_locked(path: str, exclusive: bool) -> bool:
+    """Check if a lock of the given kind can't be taken right now."""
+    mode = locking.fcntl.LOCK_EX if exclusive else locking.fcntl.LOCK_SH
+    with open(path, 'a') as file:
+        try:
+            locking.fcntl.flock(file, mode | locking.fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+    return False
+
+
+def write_records(path: str, worker: int) -> None:
+    """Add records and edit the seed rows with sizes changing."""
+    tracker = Tracker(path)
+    rng = random.Random(worker)
+    with redirect_stdout(io.StringIO()):
+        for i in range(ADDS):
+            tracker.add_record(
+                Record('2024-05-01', 'Расход', 1, f'w{worker}-{i}')
+            )
+            edit_data = {
+                'amount': rng.randint(1, 10**6),
+                'desc': 'x' * rng.randint(1, 30),
+            }
+            tracker.edit_record(rng.randint(1, SEED_ROWS), edit_data)
+
+
+@unittest.skipIf(locking.fcntl is None, 'fcntl is not available')
+class TestFileLock(unittest.TestCase):
+    def setUp(self):
+        self.path = 'test_data.csv.lock'
+        self.lock = FileLock(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_shared(self):
+        with self.lock.shared():
+            self.assertFalse(is_locked(self.path, exclusive=False))
+            self.assertTrue(is_locked(self.path, exclusive=True))
+        self.assertFalse(is_locked(self.path, exclusive=True))
+
+    def test_nested_upgrade(self):
+        with self.lock.shared():
+            with self.lock.exclusive():
+                self.assertTrue(is_locked(self.path, exclusive=False))
+                with self.lock.shared():
+                    pass
+                self.assertTrue(is_locked(self.path, exclusive=False))
+            self.assertFalse(is_locked(self.path, exclusive=False))
+            self.assertTrue(is_locked(self.path, exclusive=True))
+        self.assertFalse(is_locked(self.path, exclusive=True))
+
+    def test_release_on_error(self):
+        with self.assertRaises(KeyError):
+            with self.lock.exclusive():
+                raise KeyError
+        self.assertFalse(is_locked(self.path, exclusive=True))
+
+
+@unittest.skipIf(locking.fcntl is None, 'fcntl is not available')
+class TestConcurrentWriters(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        tracker = Tracker(self.test_file)
+        tracker._append(
+            [Record('2024-04-01', 'Доход', 100, 'seed')] * SEED_ROWS
+        )
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_no_lost_rows(self):
+        processes = [
+            multiprocessing.Process(
+                target=write_records, args=(self.test_file, worker)
+            )
+            for worker in range(WORKERS)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertTrue(all(p.exitcode == 0 for p in processes))
+
+        tracker = Tracker(self.test_file)
+        records = tracker._load_records()
+        self.assertEqual(len(records), SEED_ROWS + WORKERS * ADDS)
+        self.assertTrue(all(rec.date == '2024-04-01' for rec in records[:5]))
+        self.assertEqual(
+            {rec.desc for rec in records[SEED_ROWS:]},
+            {f'w{w}-{i}' for w in range(WORKERS) for i in range(ADDS)},
+        )
+
+        incomes = sum(r.amount for r in records if r.category == 'Доход')
+        expenses = sum(r.amount for r in records if r.category == 'Расход')
+        self.assertEqual(tracker.totals(), (incomes, expenses))
+        self.assertEqual(tracker.count(), len(records))
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            tracker.search(desc='w3-')
+        self.assertEqual(len(stdout.getvalue().splitlines()), ADDS)
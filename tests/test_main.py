@@ -0,0 +1,38 @@
+import glob
+import os
+import subprocess
+import sys
+import unittest
+
+
+class TestStartup(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_lazy_imports(self):
+        code = (
+            'import sys, main; '
+            'from core.argparser import parse_args; '
+            'parse_args(["balance"]); '
+            'print(sorted(m for m in sys.modules if m.startswith("core.")))'
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for module in ['core.tracker', 'core.commands', 'core.backends']:
+            self.assertNotIn(module, output)
+
+    def test_help_does_not_create_file(self):
+        subprocess.run(
+            [sys.executable, 'main.py', '--file', self.test_file, '-h'],
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        self.assertEqual(glob.glob(f'{self.test_file}*'), [])
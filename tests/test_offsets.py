@@ -0,0 +1,125 @@
+import glob
+import io
+import os
+import unittest
+from array import array
+from unittest.mock import patch
+
+from core.offsets import OffsetIndex, append_offsets, scan_row_offsets
+from core.sidecar import FileStamp
+from core.tracker import Record, Tracker
+
+CONTENT = (
+    'Дата,Категория,Сумма,Описание\r\n'
+    '2024-05-01,Доход,1000,зп\r\n'
+    '2024-05-02,Расход,200,"еда\r\nи ""вода"""\r\n'
+    '2024-05-03,Расход,300,кино\r\n'
+).encode('utf-8')
+
+
+class TestOffsetIndex(unittest.TestCase):
+    def test_scan_skips_quoted_newlines(self):
+        file = io.BytesIO(CONTENT)
+        index = OffsetIndex.build(file)
+        self.assertEqual(len(index), 3)
+        for i, date in enumerate(('2024-05-01', '2024-05-02', '2024-05-03')):
+            offset = index.offsets[i]
+            self.assertEqual(CONTENT[offset : offset + 10], date.encode())
+        self.assertEqual(list(scan_row_offsets(file, len(CONTENT))), [])
+
+    def test_scan_skips_blank_lines(self):
+        content = CONTENT.replace(b'\r\n2024-05-03', b'\r\n\r\n2024-05-03')
+        content += b'\n'
+        offsets = OffsetIndex.build(io.BytesIO(content)).offsets
+        self.assertEqual(len(offsets), 3)
+        self.assertEqual(content[offsets[2] :].split(b',')[0], b'2024-05-03')
+
+    def test_save_load_and_append(self):
+        path = 'test_index.offsets'
+        index = OffsetIndex(array('Q', [10, 20]), FileStamp(30, 1, 2), 3)
+        index.save(path)
+        append_offsets(path, [30], FileStamp(9, 9, 9), FileStamp(40, 5, 2), 4)
+        self.assertEqual(list(OffsetIndex.load(path).offsets), [10, 20])
+
+        append_offsets(path, [30], FileStamp(30, 1, 2), FileStamp(40, 5, 2), 4)
+        loaded = OffsetIndex.load(path)
+        self.assertEqual(list(loaded.offsets), [10, 20, 30])
+        self.assertEqual(loaded.stamp, FileStamp(40, 5, 2))
+        self.assertEqual(loaded.span(2), (30, 40))
+        os.remove(path)
+
+
+class TestTrackerEdit(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        with patch('sys.stdout', new_callable=io.StringIO):
+            for amount, desc in ((100, 'еда'), (200, 'кино'), (300, 'такси')):
+                record = Record('2024-05-01', 'Расход', amount, desc)
+                self.tracker.add_record(record)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def edit(self, record_id: int, edit_data: dict) -> bool:
+        with patch('sys.stdout', new_callable=io.StringIO):
+            return self.tracker.edit_record(record_id, edit_data)
+
+    def test_same_size_edit_is_done_in_place(self):
+        inode = os.stat(self.test_file).st_ino
+        self.assertTrue(self.edit(2, {'amount': 900}))
+        self.assertEqual(os.stat(self.test_file).st_ino, inode)
+        amounts = [r.amount for r in self.tracker.iter_records()]
+        self.assertEqual(amounts, [100, 900, 300])
+
+    def test_resized_row_keeps_index_valid(self):
+        self.assertTrue(self.edit(1, {'desc': 'продукты и "вода"\nв пятницу'}))
+        self.assertTrue(self.edit(2, {'desc': 'к'}))
+        records = self.tracker._load_records()
+        self.assertEqual(records[0].desc, 'продукты и "вода"\nв пятницу')
+        self.assertEqual(records[1].desc, 'к')
+        self.assertEqual(records[2].desc, 'такси')
+
+        index = OffsetIndex.load(self.tracker.offsets_file)
+        self.assertEqual(index.stamp, FileStamp.of(self.test_file))
+        kept = self.tracker._offset_index()
+        os.remove(self.tracker.offsets_file)
+        self.assertEqual(self.tracker._offset_index().offsets, kept.offsets)
+        self.assertEqual(self.tracker._snapshot().expenses, 600)
+
+    def test_iter_records_from_row(self):
+        amounts = [r.amount for r in self.tracker.iter_records(start=1)]
+        self.assertEqual(amounts, [200, 300])
+        amounts = [r.amount for r in self.tracker.iter_records(2, 3)]
+        self.assertEqual(amounts, [300])
+
+    def test_blank_lines(self):
+        with open(self.test_file, 'w', encoding='utf-8', newline='') as file:
+            file.write(
+                'Дата,Категория,Сумма,Описание\r\n'
+                '2024-05-01,Расход,1,a\r\n\r\n'
+                '2024-05-02,Расход,2,b\r\n'
+                '2024-05-03,Расход,3,c\r\n\r\n'
+            )
+        self.tracker._field_index()
+        self.assertTrue(self.edit(2, {'amount': 20}))
+        self.assertTrue(self.edit(3, {'desc': 'см'}))
+        self.assertEqual(
+            self.tracker._load_records(),
+            [
+                Record('2024-05-01', 'Расход', 1, 'a'),
+                Record('2024-05-02', 'Расход', 20, 'b'),
+                Record('2024-05-03', 'Расход', 3, 'см'),
+            ],
+        )
+        self.assertEqual(self.tracker.totals(), (0, 24))
+        self.assertEqual(self.tracker._tail_records(2)[0].amount, 20)
+
+    def test_missing_record(self):
+        self.assertFalse(self.edit(4, {'amount': 1}))
+        self.assertFalse(self.edit(0, {'amount': 1}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import csv
+import glob
+import io
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from core import output
+from core.argparser import parse_args
+from core.output import write_records
+from core.tracker import Record, Tracker
+
+RECORDS = [
+    Record('2024-05-01', 'Доход', 1000, 'зп'),
+    Record('2024-05-02', 'Расход', 300, 'кофе, "с собой"'),
+    Record('2024-05-03', 'Расход', 50, 'чай'),
+    Record('2024-05-04', 'Расход', 300, 'обед'),
+    Record('2024-05-05', 'Расход', 70, 'кофе'),
+]
+
+
+class TestWriteRecords(unittest.TestCase):
+    def write(self, rows, fmt: str) -> str:
+        file = io.StringIO()
+        count = write_records(rows, fmt, file)
+        self.assertEqual(count, len(rows))
+        return file.getvalue()
+
+    def test_csv(self):
+        text = self.write(list(enumerate(RECORDS[:2], start=4)), 'csv')
+        self.assertEqual(
+            list(csv.reader(io.StringIO(text))),
+            [
+                output.CSV_HEADER,
+                ['4', '2024-05-01', 'Доход', '1000', 'зп'],
+                ['5', '2024-05-02', 'Расход', '300', 'кофе, "с собой"'],
+            ],
+        )
+
+    def test_jsonl(self):
+        text = self.write([(2, RECORDS[1])], 'jsonl')
+        self.assertEqual(text.count('\n'), 1)
+        self.assertEqual(
+            json.loads(text),
+            {
+                'id': 2,
+                'date': '2024-05-02',
+                'category': 'Расход',
+                'amount': 300,
+                'desc': 'кофе, "с собой"',
+            },
+        )
+
+    def test_table(self):
+        text = self.write([(1, RECORDS[0])], 'table')
+        self.assertEqual(text, '  1.  2024-05-01   Доход      1000   зп\n')
+        self.assertEqual(self.write([], 'table'), '')
+
+    def test_flushes_in_chunks(self):
+        file = io.StringIO()
+        rows = [(i, RECORDS[0]) for i in range(1, 11)]
+        with patch.object(output, 'FLUSH_ROWS', 4):
+            with patch.object(file, 'write', wraps=file.write) as write:
+                write_records(rows, 'jsonl', file)
+        self.assertEqual(write.call_count, 3)
+        self.assertEqual(len(file.getvalue().splitlines()), 10)
+
+
+class TestTrackerOutput(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(RECORDS)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def ids(self, method, fmt: str = 'jsonl', **kwargs) -> list[int]:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            method(fmt=fmt, **kwargs)
+        lines = stdout.getvalue().splitlines()
+        return [json.loads(line)['id'] for line in lines]
+
+    def test_show_pages(self):
+        show = self.tracker.show_records
+        self.assertEqual(self.ids(show), [1, 2, 3, 4, 5])
+        self.assertEqual(self.ids(show, offset=1, limit=2), [2, 3])
+        self.assertEqual(self.ids(show, offset=3), [4, 5])
+        self.assertEqual(self.ids(show, n=3, offset=1, limit=1), [4])
+        self.assertEqual(self.ids(show, offset=10), [])
+
+    def test_show_table_marks_skipped(self):
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.tracker.show_records(offset=4)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(lines[0], '  ...')
+        self.assertTrue(lines[1].startswith('  5.'))
+
+    def test_search_pages(self):
+        search = self.tracker.search
+        self.assertEqual(self.ids(search, category='Расход'), [2, 3, 4, 5])
+        self.assertEqual(
+            self.ids(search, category='Расход', offset=1, limit=2), [3, 4]
+        )
+        self.assertEqual(self.ids(search, desc='нет такого'), [])
+
+    def test_search_explain_goes_to_stderr(self):
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            ids = self.ids(self.tracker.search, amount=300, explain=True)
+        self.assertEqual(ids, [2, 4])
+        self.assertIn('План поиска', stderr.getvalue())
+
+
+class TestOutputArguments(unittest.TestCase):
+    def test_defaults(self):
+        args = parse_args(['show'])
+        self.assertEqual(
+            (args.offset, args.limit, args.format), (0, None, 'table')
+        )
+
+    def test_search_options(self):
+        args = parse_args(
+            ['search', '--desc', 'кофе', '--offset', '2', '--limit', '5']
+            + ['--format', 'csv']
+        )
+        self.assertEqual((args.offset, args.limit, args.format), (2, 5, 'csv'))
+
+    def test_negative_offset_and_limit(self):
+        for argv in (
+            ['show', '--offset', '-1'],
+            ['search', '--limit', '-1'],
+            ['show', '-t', '-2'],
+        ):
+            with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+                with self.assertRaises(SystemExit):
+                    parse_args(argv)
+            self.assertIn('не меньше 0', stderr.getvalue())
+        self.assertEqual(parse_args(['list', '--limit', '0']).limit, 0)
+
+    def test_unknown_format(self):
+        with patch('sys.stderr', new_callable=io.StringIO):
+            with self.assertRaises(SystemExit):
+                parse_args(['list', '--format', 'xml'])
+
+
+if __name__ == '__main__':
+    unittest.main()
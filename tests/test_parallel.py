@@ -0,0 +1,64 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.parallel import split_rows
+from core.query import Query
+from core.tracker import Record, Tracker
+
+
+class TestParallelScan(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(
+            [
+                Record(
+                    f'2024-05-{i % 28 + 1:02}',
+                    'Доход' if i % 3 else 'Расход',
+                    i,
+                    f'запись {i}\n"в кавычках", с запятой' if i % 7 else '',
+                )
+                for i in range(200)
+            ]
+        )
+        self.parallel = Tracker(self.test_file)
+        self.parallel.parallel_min_size = 0
+        self.parallel.workers = 3
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_split_rows(self):
+        index = self.tracker._offset_index()
+        ranges = split_rows(index, 12)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], 200)
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(ranges, ranges[1:])))
+        self.assertGreater(len(ranges), 6)
+
+    def test_find(self):
+        for query in [Query(), Query(category='Расход'), Query(amount=150)]:
+            self.assertEqual(
+                list(self.parallel.find(query)),
+                list(self.tracker.find(query)),
+            )
+
+    def test_search_ids(self):
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.parallel.search(amount=199)
+        self.assertTrue(stdout.getvalue().startswith('200.'))
+
+    def test_report(self):
+        expected = self.tracker.report_data(top=5)
+        os.remove(self.tracker.reports_file)
+        self.assertEqual(self.parallel.report_data(top=5), expected)
+
+    def test_snapshot_rescan(self):
+        expected = self.tracker.totals()
+        os.remove(self.tracker.snapshot_file)
+        self.assertEqual(self.parallel.totals(), expected)
+        self.assertEqual(self.parallel.count(), 200)
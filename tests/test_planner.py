@@ -0,0 +1,127 @@
+import glob
+import io
+import os
+import random
+import unittest
+from unittest.mock import patch
+
+from core.planner import BINARY, INDEX, SCAN, SQL, Estimate, Plan
+from core.query import Query
+from core.sqlite_tracker import SQLiteTracker
+from core.tracker import Record, Tracker
+
+
+def make_records(n: int) -> list[Record]:
+    rng = random.Random(1)
+    return [
+        Record(
+            f'2024-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}',
+            'Доход' if i % 10 == 0 else 'Расход',
+            rng.randint(1, 50) * 10 + i % 3,
+            rng.choice(['кофе', 'обед', 'такси', 'зарплата']),
+        )
+        for i in range(n)
+    ]
+
+
+class TestPlan(unittest.TestCase):
+    def estimate(self, field: str, count: int) -> Estimate:
+        return Estimate(field, 'x', count, lambda: [])
+
+    def test_choose_most_selective(self):
+        plan = Plan(100, estimates=[self.estimate('category', 90)])
+        plan.estimates.append(self.estimate('amount', 5))
+        plan.choose(binary=True)
+        self.assertEqual(plan.access, INDEX)
+        self.assertEqual(plan.driver.field, 'amount')
+
+    def test_choose_scan(self):
+        plan = Plan(100, estimates=[self.estimate('category', 10)])
+        plan.choose(binary=True)
+        self.assertEqual(plan.access, BINARY)
+        plan.choose(binary=False)
+        self.assertEqual(plan.access, INDEX)
+        plan = Plan(100, estimates=[self.estimate('desc', 30)])
+        plan.choose(binary=False)
+        self.assertEqual(plan.access, SCAN)
+        self.assertIsNone(plan.driver)
+
+    def test_filter_counts(self):
+        plan = Plan()
+        records = enumerate(make_records(10), start=1)
+        found = list(plan.filter(Query(category='Доход'), records))
+        self.assertEqual([i for i, _ in found], [1])
+        self.assertEqual((plan.checked, plan.found), (10, 1))
+
+
+class TestTrackerPlanner(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.records = make_records(400)
+        self.tracker._append(self.records)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_same_results_as_scan(self):
+        queries = [
+            Query(amount=300),
+            Query(category='Доход', amount=1000),
+            Query(category='Расход'),
+            Query(date='2024-03-12', desc='кофе'),
+            Query(date_from='2024-02-01', date_to='2024-02-28'),
+            Query(amount=501, date_from='2024-05-01', desc='такс'),
+            Query(date='2024-13-01'),
+        ]
+        for query in queries:
+            expected = [
+                (i, record)
+                for i, record in enumerate(self.records, start=1)
+                if query.matches(record)
+            ]
+            plan = Plan()
+            self.assertEqual(list(self.tracker.find(query, plan)), expected)
+            self.assertEqual(plan.found, len(expected))
+            self.assertEqual(plan.total, 400)
+
+    def test_plan(self):
+        plan = Plan()
+        list(self.tracker.find(Query(category='Расход', amount=502), plan))
+        self.assertEqual(plan.access, INDEX)
+        self.assertEqual(plan.driver.field, 'amount')
+        self.assertEqual(plan.checked, plan.driver.count)
+        self.assertEqual(len(plan.estimates), 2)
+
+    def test_explain(self):
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.tracker.search(amount=502, desc='кофе', explain=True)
+        lines = stdout.getvalue().splitlines()
+        self.assertTrue(lines[-1].startswith('Проверено записей:'))
+        self.assertIn('Кандидаты из индекса: сумма 502', lines[-2])
+        self.assertIn('План поиска, всего записей: 400', lines)
+
+
+class TestSQLitePlanner(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.db'
+        self.tracker = SQLiteTracker(self.test_file)
+        self.tracker._append(make_records(20))
+
+    def tearDown(self):
+        self.tracker.connection.close()
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_plan(self):
+        plan = Plan()
+        found = list(self.tracker.find(Query(amount=300), plan))
+        self.assertEqual(plan.access, SQL)
+        self.assertTrue(any('records_amount' in d for d in plan.details))
+        self.assertEqual(plan.found, len(found))
+        self.assertEqual(plan.total, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
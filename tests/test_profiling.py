@@ -0,0 +1,80 @@
+import glob
+import io
+import json
+import os
+import pstats
+import unittest
+from unittest.mock import patch
+
+from core import commands
+from core.argparser import parse_args
+from core.profiling import ENV_VAR, Profile, from_args
+from core.tracker import Record, Tracker
+from main import main
+
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(
+            [Record('2024-05-01', 'Расход', i, f'кофе {i}') for i in range(5)]
+        )
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_timings(self):
+        find = Tracker.find
+        profile = Profile('search')
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            with profile, patch('sys.stdout', new_callable=io.StringIO):
+                profile.instrument(self.tracker)
+                self.assertIsNot(Tracker.find, find)
+                self.tracker.search(amount=3)
+        self.assertIs(Tracker.find, find)
+        self.assertNotIn('_print_records', vars(Tracker))
+
+        timing = profile.timings['Tracker.find']
+        self.assertEqual((timing.calls, timing.items), (1, 1))
+        printing = profile.timings['Tracker._print_records']
+        self.assertLessEqual(printing.own, printing.total - timing.total)
+        self.assertNotIn('Tracker._row_to_record', profile.timings)
+        self.assertIn('Tracker.find', stderr.getvalue())
+
+    def test_from_args(self):
+        args = parse_args(['balance'])
+        with patch.dict(os.environ, {ENV_VAR: ''}):
+            self.assertIsNone(from_args(args))
+        with patch.dict(os.environ, {ENV_VAR: '1'}):
+            self.assertIsNone(from_args(args).output)
+        with patch.dict(os.environ, {ENV_VAR: 'out.json'}):
+            self.assertEqual(from_args(args).output, 'out.json')
+        args = parse_args(['--profile', 'balance'])
+        with patch.dict(os.environ, {ENV_VAR: '0'}):
+            self.assertEqual(from_args(args).name, 'balance')
+
+    def run_main(self, *argv):
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr, patch(
+            'sys.stdout', new_callable=io.StringIO
+        ):
+            main(['--file', self.test_file, *argv])
+        return stderr.getvalue()
+
+    def test_json_output(self):
+        path = f'{self.test_file}.json'
+        summary = self.run_main(
+            '--profile-out', path, 'add', 't', '-', '1', 'чай'
+        )
+        self.assertIn('process_args', summary)
+        self.assertFalse(hasattr(commands.process_args, '__wrapped__'))
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        self.assertEqual(data['command'], 'add')
+        self.assertEqual(data['timings']['Tracker._append']['calls'], 1)
+
+    def test_cprofile_output(self):
+        path = f'{self.test_file}.prof'
+        self.run_main('--profile-out', path, 'show')
+        self.assertGreater(pstats.Stats(path).total_calls, 0)
@@ -0,0 +1,112 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.record import Record
+from core.reports import aggregate, week_of
+from core.sqlite_tracker import SQLiteTracker
+from core.tracker import Tracker
+
+RECORDS = [
+    Record('2024-04-30', 'Доход', 1000, 'Зарплата за апрель'),
+    Record('2024-05-01', 'Расход', 300, 'продукты'),
+    Record('2024-05-06', 'Расход', 700, 'Продукты и вода'),
+    Record('2025-01-01', 'Расход', 300, ''),
+]
+
+
+class TestAggregate(unittest.TestCase):
+    def test_week_of(self):
+        self.assertEqual(week_of('2024-05-01'), '2024-W18')
+        self.assertEqual(week_of('2024-12-30'), '2025-W01')
+        self.assertEqual(week_of('2024-13-01'), '?')
+
+    def test_groups(self):
+        groups = aggregate(enumerate(RECORDS, start=1))['groups']
+        self.assertEqual(
+            groups['month'],
+            [
+                ['2024-04', 1000, 0, 1],
+                ['2024-05', 0, 1000, 2],
+                ['2025-01', 0, 300, 1],
+            ],
+        )
+        self.assertEqual(
+            groups['year'], [['2024', 1000, 1000, 3], ['2025', 0, 300, 1]]
+        )
+        self.assertEqual(
+            [row[0] for row in groups['week']],
+            ['2024-W18', '2024-W19', '2025-W01'],
+        )
+        self.assertEqual(
+            groups['desc'],
+            [
+                ['?', 0, 300, 1],
+                ['зарплата', 1000, 0, 1],
+                ['продукты', 0, 1000, 2],
+            ],
+        )
+
+    def test_top(self):
+        top = aggregate(enumerate(RECORDS, start=1), top=2)['top']
+        self.assertEqual(
+            top,
+            [
+                [3, '2024-05-06', 700, 'Продукты и вода'],
+                [2, '2024-05-01', 300, 'продукты'],
+            ],
+        )
+
+
+class TestTrackerReport(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker._append(RECORDS)
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def report(self, tracker=None, **kwargs) -> list[str]:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            (tracker or self.tracker).show_report(**kwargs)
+        return stdout.getvalue().splitlines()
+
+    def test_show_report(self):
+        lines = self.report(grouping='year', top=1)
+        self.assertEqual(
+            lines[0].split(),
+            ['Группа', 'Доходы', 'Расходы', 'Баланс', 'Записей'],
+        )
+        self.assertEqual(lines[1].split(), ['2024', '1000', '1000', '0', '3'])
+        self.assertEqual(lines[2].split(), ['2025', '0', '300', '-300', '1'])
+        self.assertEqual(lines[-1].split()[:3], ['3.', '2024-05-06', '700'])
+
+    def test_empty(self):
+        tracker = Tracker('test_data.csv.empty')
+        self.assertEqual(self.report(tracker), ['Записей нет'])
+
+    def test_cache(self):
+        self.tracker.report_data(top=2)
+        self.assertTrue(os.path.exists(self.tracker.reports_file))
+
+        with patch.object(self.tracker, 'iter_records') as iter_records:
+            data = self.tracker.report_data(top=1)
+        iter_records.assert_not_called()
+        self.assertEqual([row[0] for row in data['top']], [3])
+
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.tracker.add_record(Record('2025-01-02', 'Доход', 50))
+        data = self.tracker.report_data()
+        self.assertEqual(data['groups']['year'][1], ['2025', 50, 300, 2])
+
+    def test_sqlite(self):
+        tracker = SQLiteTracker('test_data.csv.db')
+        tracker._append(RECORDS)
+        self.assertEqual(
+            tracker.report_data(top=1), self.tracker.report_data(top=1)
+        )
+        tracker.connection.close()
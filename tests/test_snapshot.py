@@ -0,0 +1,65 @@
+import glob
+import os
+import unittest
+
+from core.sidecar import FileStamp
+from core.snapshot import Snapshot
+from core.tracker import Record, Tracker
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_add_remove(self):
+        snapshot = Snapshot()
+        snapshot.add('Доход', 1000)
+        snapshot.add('Расход', 300)
+        snapshot.remove('Расход', 100)
+        self.assertEqual(snapshot.incomes, 1000)
+        self.assertEqual(snapshot.expenses, 200)
+        self.assertEqual(snapshot.balance, 800)
+
+    def test_load_missing_or_broken(self):
+        self.assertIsNone(Snapshot.load('missing.snapshot'))
+        with open('broken.snapshot', 'w') as file:
+            file.write('{"incomes": ')
+        self.assertIsNone(Snapshot.load('broken.snapshot'))
+        os.remove('broken.snapshot')
+
+
+class TestTrackerSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        self.tracker.add_record(Record('2024-05-01', 'Доход', 1000, 'зп'))
+        self.tracker.add_record(Record('2024-05-02', 'Расход', 200, 'еда'))
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_snapshot_updated_on_add_and_edit(self):
+        self.tracker.edit_record(2, {'amount': 300})
+        snapshot = Snapshot.load(self.tracker.snapshot_file)
+        self.assertEqual(snapshot.rows, 2)
+        self.assertEqual(snapshot.incomes, 1000)
+        self.assertEqual(snapshot.expenses, 300)
+        self.assertTrue(snapshot.matches(FileStamp.of(self.test_file)))
+
+    def test_appended_rows_are_counted(self):
+        with open(self.test_file, 'a', encoding='utf-8') as file:
+            file.write('2024-05-03,Расход,50,кофе\r\n')
+        snapshot = self.tracker._snapshot()
+        self.assertEqual(snapshot.rows, 3)
+        self.assertEqual(snapshot.expenses, 250)
+
+    def test_external_change_triggers_rescan(self):
+        with open(self.test_file, encoding='utf-8') as file:
+            content = file.read()
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            file.write(content.replace('1000', '900'))
+        snapshot = self.tracker._snapshot()
+        self.assertEqual(snapshot.incomes, 900)
+        self.assertEqual(snapshot.rows, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
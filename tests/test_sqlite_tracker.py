@@ -0,0 +1,84 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.backends import open_tracker
+from core.record import Record
+from core.sqlite_tracker import SQLiteTracker
+from core.tracker import Tracker
+
+
+class TestSQLiteTracker(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.db'
+        self.tracker = SQLiteTracker(self.test_file)
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.tracker.add_record(Record('2024-05-01', 'Доход', 1000, 'зп'))
+            self.tracker.add_record(Record('2024-05-02', 'Расход', 200, 'Ёлка'))
+            self.tracker.add_record(Record('2024-06-01', 'Расход', 300, 'кафе'))
+
+    def tearDown(self):
+        self.tracker.connection.close()
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def output(self, method, *args, **kwargs) -> list[str]:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            method(*args, **kwargs)
+        return stdout.getvalue().splitlines()
+
+    def test_records_and_balance(self):
+        self.assertEqual(self.tracker.count(), 3)
+        self.assertEqual(self.tracker.totals(), (1000, 500))
+        amounts = [r.amount for r in self.tracker.iter_records(1, 2)]
+        self.assertEqual(amounts, [200])
+        lines = self.output(self.tracker.show_records, n=1)
+        self.assertEqual(lines[0], '  ...')
+        self.assertTrue(lines[1].startswith('  3.'))
+
+    def test_search(self):
+        lines = self.output(self.tracker.search, desc='ЕЛ')
+        self.assertEqual([line[:4] for line in lines], ['  2.'])
+        lines = self.output(
+            self.tracker.search, category='Расход', date_to='2024-05-31'
+        )
+        self.assertEqual([line[:4] for line in lines], ['  2.'])
+        lines = self.output(self.tracker.search, desc='аф', by_words=True)
+        self.assertEqual(lines, ['Ничего не найдено.'])
+
+    def test_edit(self):
+        self.assertTrue(self.tracker._edit(2, {'amount': 250, 'desc': 'ёлка'}))
+        self.assertFalse(self.tracker._edit(4, {'amount': 1}))
+        self.assertEqual(
+            self.tracker._load_records()[1],
+            Record('2024-05-02', 'Расход', 250, 'ёлка'),
+        )
+
+
+class TestBackends(unittest.TestCase):
+    def tearDown(self):
+        for path in glob.glob('test_data.*'):
+            os.remove(path)
+
+    def test_open_tracker(self):
+        self.assertIsInstance(open_tracker('test_data.csv'), Tracker)
+        tracker = open_tracker('test_data.db')
+        self.assertIsInstance(tracker, SQLiteTracker)
+        tracker.connection.close()
+        tracker = open_tracker('test_data.data', 'sqlite')
+        self.assertIsInstance(tracker, SQLiteTracker)
+        tracker.connection.close()
+
+    def test_import_from_csv(self):
+        source = Tracker('test_data.csv')
+        source._append([Record('2024-05-01', 'Доход', i) for i in range(5)])
+        target = SQLiteTracker('test_data.db')
+        self.assertEqual(target.import_from(source, batch_size=2), 5)
+        self.assertEqual(target._load_records(), source._load_records())
+        target.connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import csv
+import io
+import unittest
+
+from core.tail import read_tail
+
+HEADER = 'Дата,Категория,Сумма,Описание\r\n'
+ROWS = [
+    ['2024-05-01', 'Доход', '1000', 'зарплата'],
+    ['2024-05-02', 'Расход', '200', 'продукты,\r\nфрукты "и" овощи'],
+    ['2024-05-03', 'Расход', '300', '"кафе"\nс друзьями'],
+    ['2024-05-04', 'Расход', '50', 'ёжик'],
+]
+
+
+def make_file(rows: list[list[str]]) -> io.BytesIO:
+    text = io.StringIO(newline='')
+    text.write(HEADER)
+    csv.writer(text).writerows(rows)
+    return io.BytesIO(text.getvalue().encode('utf-8'))
+
+
+def parse(data: bytes) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(data.decode('utf-8'), newline='')))
+
+
+class TestReadTail(unittest.TestCase):
+    def test_tail_with_every_chunk_size(self):
+        file = make_file(ROWS)
+        for chunk_size in range(1, 40):
+            for n in range(1, len(ROWS) + 1):
+                _, data = read_tail(file, n, chunk_size=chunk_size)
+                self.assertEqual(parse(data), ROWS[-n:])
+
+    def test_offset_points_to_row_start(self):
+        file = make_file(ROWS)
+        offset, data = read_tail(file, 2, chunk_size=5)
+        self.assertEqual(file.getvalue()[offset:], data)
+
+    def test_more_rows_than_file_has(self):
+        _, data = read_tail(make_file(ROWS), 10, chunk_size=7)
+        self.assertEqual(parse(data), ROWS)
+
+    def test_blank_lines_are_not_rows(self):
+        data = make_file(ROWS).getvalue()
+        data = data.replace(b'\r\n2024-05-04', b'\r\n\r\n\n2024-05-04')
+        file = io.BytesIO(data + b'\r\n')
+        for chunk_size in range(1, 40):
+            _, tail = read_tail(file, 2, chunk_size=chunk_size)
+            self.assertEqual([row for row in parse(tail) if row], ROWS[-2:])
+
+    def test_header_only_and_empty_file(self):
+        self.assertEqual(read_tail(make_file([]), 3)[1], b'')
+        self.assertEqual(read_tail(io.BytesIO(), 3), (0, b''))
+
+
+if __name__ == '__main__':
+    unittest.main()
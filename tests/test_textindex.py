@@ -0,0 +1,86 @@
+import glob
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from core.sidecar import FileStamp
+from core.textindex import TextIndex, has_words, normalize, words
+from core.tracker import Record, Tracker
+
+DESCS = ['Ёлка на Новый год', 'продукты', 'яблоки и груши', 'Кафе ЁЖИК']
+
+
+class TestTextIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = TextIndex.build(enumerate(DESCS))
+
+    def test_normalize(self):
+        self.assertEqual(normalize('ЁЛКА'), 'елка')
+        self.assertEqual(words('Кафе, ёжик!'), ['кафе', 'ежик'])
+        self.assertTrue(has_words(['еж', 'каф'], 'Кафе ЁЖИК'))
+        self.assertFalse(has_words(['жик'], 'Кафе ЁЖИК'))
+
+    def test_find_substring(self):
+        self.assertEqual(self.index.find_substring('елк'), {0})
+        self.assertEqual(self.index.find_substring('ЛОКИ'), {2})
+        self.assertEqual(self.index.find_substring('и г'), {2})
+        self.assertEqual(self.index.find_substring('xyz'), set())
+        self.assertIsNone(self.index.find_substring('ок'))
+
+    def test_find_words(self):
+        self.assertEqual(self.index.find_words('ежи'), {3})
+        self.assertEqual(self.index.find_words('нов год'), {0})
+        self.assertEqual(self.index.find_words('локи'), set())
+        self.assertIsNone(self.index.find_words('...'))
+
+    def test_add_remove_save_load(self):
+        self.index.remove(1, DESCS[1])
+        self.index.add(1, 'Ёлочные игрушки')
+        self.index.stamp = FileStamp(1, 2, 3)
+        path = 'test_index.text'
+        self.index.save(path)
+        loaded = TextIndex.load(path)
+        os.remove(path)
+        self.assertEqual(loaded.stamp, FileStamp(1, 2, 3))
+        self.assertEqual(loaded.find_words('елоч'), {1})
+        self.assertEqual(loaded.find_substring('продукт'), set())
+        self.assertEqual(loaded.find_substring('елк'), {0})
+
+
+class TestTrackerDescSearch(unittest.TestCase):
+    def setUp(self):
+        self.test_file = 'test_data.csv'
+        self.tracker = Tracker(self.test_file)
+        with patch('sys.stdout', new_callable=io.StringIO):
+            for desc in DESCS:
+                self.tracker.add_record(Record('2024-05-01', 'Расход', 1, desc))
+
+    def tearDown(self):
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def search(self, **kwargs) -> list[str]:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.tracker.search(**kwargs)
+        return [line[:4] for line in stdout.getvalue().splitlines()]
+
+    def test_search_substring_and_words(self):
+        self.assertEqual(self.search(desc='ЕЛК'), ['  1.'])
+        self.assertEqual(self.search(desc='к'), ['  1.', '  2.', '  3.', '  4.'])
+        self.assertEqual(self.search(desc='жик', by_words=True), ['Ниче'])
+        self.assertEqual(self.search(desc='ёж', by_words=True), ['  4.'])
+
+    def test_index_is_updated_on_add_and_edit(self):
+        self.search(desc='груш')
+        saved = TextIndex.load(self.tracker.text_file).stamp
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.tracker.edit_record(3, {'desc': 'сливы'})
+            self.tracker.add_record(Record('2024-05-02', 'Расход', 1, 'груши'))
+        self.assertEqual(TextIndex.load(self.tracker.text_file).stamp, saved)
+        self.assertEqual(self.search(desc='груш'), ['  5.'])
+        self.assertEqual(self.search(desc='слив'), ['  3.'])
+
+
+if __name__ == '__main__':
+    unittest.main()
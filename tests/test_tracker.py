@@ -1,5 +1,8 @@
+import glob
+import io
 import os
 import unittest
+from unittest.mock import patch
 
 from core.tracker import Record, Tracker
 
@@ -27,8 +30,14 @@ class TestTracker(unittest.TestCase):
         self.tracker = Tracker(self.test_file)
 
     def tearDown(self):
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        for path in glob.glob(f'{self.test_file}*'):
+            os.remove(path)
+
+    def test_file_created_on_first_access(self):
+        self.assertFalse(os.path.exists(self.test_file))
+        self.assertEqual(self.tracker.count(), 0)
+        with open(self.test_file, encoding='utf-8') as file:
+            self.assertEqual(file.read(), 'Дата,Категория,Сумма,Описание\n')
 
     def test_add_record(self):
         record = Record('2024-05-01', 'exp', 1000, 'еда')
@@ -50,6 +59,40 @@ class TestTracker(unittest.TestCase):
         self.assertEqual(records[0].amount, 1200)
         self.assertEqual(records[0].desc, 'desc+')
 
+    def test_iter_records(self):
+        for amount in (100, 200, 300):
+            self.tracker.add_record(Record('2024-05-01', '-', amount))
+
+        records = self.tracker.iter_records()
+        self.assertNotIsInstance(records, list)
+        self.assertEqual([r.amount for r in records], [100, 200, 300])
+        amounts = [r.amount for r in self.tracker.iter_records(1, 2)]
+        self.assertEqual(amounts, [200])
+
+    def test_search_shows_row_ids(self):
+        self.tracker.add_record(Record('2024-05-01', '-', 100, 'Еда'))
+        self.tracker.add_record(Record('2024-05-02', '-', 200, 'кино'))
+        self.tracker.add_record(Record('2024-05-03', '-', 300, 'еда'))
+
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.tracker.search(desc='ЕДА')
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('  1.'))
+        self.assertTrue(lines[1].startswith('  3.'))
+
+    def test_show_records_tail(self):
+        for amount in (100, 200, 300):
+            self.tracker.add_record(Record('2024-05-01', '-', amount))
+
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.tracker.show_records(n=2)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(lines[0], '  ...')
+        self.assertTrue(lines[1].startswith('  2.'))
+        self.assertIn('200', lines[1])
+        self.assertTrue(lines[2].startswith('  3.'))
+
     def test_show_balance(self):
         self.tracker.add_record(Record('2024-05-01', '+', 1000, 'зп'))
         self.tracker.add_record(Record('2024-05-02', '-', 200, 'food'))
@@ -12,6 +12,19 @@ class TestUtils(unittest.TestCase):
         self.assertFalse(utils.validate_date('12.12.12'))
         self.assertFalse(utils.validate_date('12-12-2012'))
 
+    def test_parse_date(self):
+        self.assertEqual(utils.parse_date('2024-05-08'), '2024-05-08')
+        self.assertEqual(utils.parse_date('2024-5-8'), '2024-05-08')
+        self.assertEqual(utils.parse_date('2024-02-29'), '2024-02-29')
+        self.assertIsNone(utils.parse_date('2023-02-29'))
+        self.assertIsNone(utils.parse_date('2024-05-08-1'))
+        self.assertIsNone(utils.parse_date('2024-005-08'))
+        self.assertIsNone(utils.parse_date('0000-05-08'))
+        self.assertIsNone(utils.parse_date(' 2024-05-08'))
+        self.assertIsNone(utils.parse_date('2024-+5-08'))
+        self.assertIsNone(utils.parse_date('２０２４-05-08'))
+        self.assertIsNone(utils.parse_date(''))
+
     def test_validate_amount(self):
         self.assertTrue(utils.validate_amount('100'))
         self.assertTrue(utils.validate_amount('-50'))
@@ -39,6 +52,8 @@ class TestUtils(unittest.TestCase):
     def test_normalize_date(self):
         self.assertEqual(utils.normalize_date('2024-5-8'), '2024-05-08')
         self.assertEqual(utils.normalize_date('2024-5-08'), '2024-05-08')
+        with self.assertRaises(ValueError):
+            utils.normalize_date('2024-13-01')
 
     def test_get_today(self):
         today = utils.get_today()
@@ -82,6 +97,56 @@ class TestUtils(unittest.TestCase):
             )
         )
 
+    def test_process_period(self):
+        self.assertEqual(
+            utils.process_period(None, None, '2024-02', None),
+            ('2024-02-01', '2024-02-29'),
+        )
+        self.assertEqual(
+            utils.process_period('2024-5-10', None, None, '2024'),
+            ('2024-05-10', '2024-12-31'),
+        )
+        self.assertEqual(
+            utils.process_period(None, None, None, None), (None, None)
+        )
+        self.assertIsNone(utils.process_period(None, None, '2024-13', None))
+        self.assertIsNone(utils.process_period(None, None, None, '24'))
+        self.assertIsNone(utils.process_period('01.05.2024', None, None, None))
+
+    def test_process_args_category_case(self):
+        self.assertEqual(
+            utils.process_args(None, 'Доход', None, [])['category'], 'Доход'
+        )
+
+    def test_check_args(self):
+        self.assertIsNone(utils.check_args('2024-05-08', '+', '1'))
+        self.assertIsNone(utils.check_args(None, None, None))
+        self.assertEqual(
+            utils.check_args('2024-05-08', '+', 'x'),
+            utils.texts.amount_validation,
+        )
+
+    def test_process_row(self):
+        self.assertEqual(
+            utils.process_row(
+                {'date': '2024-5-8', 'category': 'INC', 'amount': 100}
+            ),
+            {
+                'date': '2024-05-08',
+                'category': 'Доход',
+                'amount': 100,
+                'desc': '',
+            },
+        )
+        for row in [
+            None,
+            {'date': '2024-05-08', 'category': '+'},
+            {'date': '2024-05-08', 'category': '+', 'amount': ''},
+            {'date': '2024-05-08', 'category': '?', 'amount': '1'},
+        ]:
+            with self.assertRaises(ValueError):
+                utils.process_row(row)
+
 
 if __name__ == '__main__':
     unittest.main()